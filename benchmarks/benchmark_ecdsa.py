@@ -0,0 +1,45 @@
+import os
+import sys
+import time
+
+from sawtooth_signing.secp256k1 import Secp256k1Context
+
+sys.path.insert(0, os.path.realpath('./'))
+
+from remme.models.keys.ecdsa import ECDSA
+
+SIGNATURES_COUNT = 20000
+
+
+def benchmark(name, function):
+
+    started_at = time.perf_counter()
+
+    for _ in range(SIGNATURES_COUNT):
+        function()
+
+    elapsed = time.perf_counter() - started_at
+
+    print(f'{name:<36} {SIGNATURES_COUNT / elapsed:>10,.0f} signatures/s')
+
+
+if __name__ == '__main__':
+    private_key, public_key = ECDSA.generate_key_pair()
+
+    key = ECDSA(private_key=private_key)
+    public_key = ECDSA(public_key=public_key)
+
+    data = os.urandom(256)
+    signature_hex = key.sign(data)
+    signature = bytes.fromhex(signature_hex)
+
+    benchmark('sign, context per call', lambda: Secp256k1Context().sign(data, key._private_key_obj))
+    benchmark('sign', lambda: key.sign(data))
+    benchmark('sign_bytes', lambda: key.sign_bytes(data))
+
+    benchmark(
+        'verify, context per call',
+        lambda: Secp256k1Context().verify(signature_hex, data, public_key._public_key_obj),
+    )
+    benchmark('verify', lambda: public_key.verify(data, signature))
+    benchmark('verify_bytes', lambda: public_key.verify_bytes(data, signature))
@@ -0,0 +1,45 @@
+import hashlib
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.realpath('./'))
+
+from remme.models.transaction_service.nonce_provider import (
+    RemmeCounterNonceProvider,
+    RemmeRandomNonceProvider,
+)
+
+NONCES_COUNT = 1000000
+
+
+def get_legacy_nonces(count):
+    return [hashlib.sha512(str(math.floor(1000 * random.random())).encode('UTF-8')).hexdigest() for _ in range(count)]
+
+
+def benchmark(name, get_nonces):
+
+    started_at = time.perf_counter()
+    nonces = get_nonces(NONCES_COUNT)
+    elapsed = time.perf_counter() - started_at
+
+    collisions = len(nonces) - len(set(nonces))
+
+    print(
+        f'{name:<24} {NONCES_COUNT / elapsed:>14,.0f} nonces/s   '
+        f'collisions: {collisions} ({collisions / len(nonces):.4%})',
+    )
+
+
+if __name__ == '__main__':
+    benchmark('legacy sha512(1000)', get_legacy_nonces)
+
+    counter_provider = RemmeCounterNonceProvider()
+    benchmark('counter get', lambda count: [counter_provider.get() for _ in range(count)])
+    benchmark('counter get_many', lambda count: counter_provider.get_many(count=count))
+
+    random_provider = RemmeRandomNonceProvider()
+    benchmark('random get', lambda count: [random_provider.get() for _ in range(count)])
+    benchmark('random get_many', lambda count: random_provider.get_many(count=count))
@@ -1,8 +1,21 @@
-from random import random
-
-import aiohttp_json_rpc
-
-from remme.models.general.methods import RemmeMethods
+import asyncio
+import time
+
+from remme.models.api.balancing_strategy import RemmeBalancingStrategy
+from remme.models.api.connection_pool import RemmeConnectionPool
+from remme.models.api.hedging import (
+    DEFAULT_HEDGING_MIN_DELAY,
+    RemmeHedgingPolicy,
+)
+from remme.models.api.json_rpc import split_into_chunks
+from remme.models.api.node_balancer import (
+    RemmeNode,
+    RemmeNodeBalancer,
+)
+from remme.models.general.methods import (
+    READ_METHODS,
+    RemmeMethods,
+)
 from remme.models.interfaces.api import IRemmeAPI
 from remme.utils import validate_node_config
 
@@ -11,6 +24,10 @@ DEFAULT_NETWORK_CONFIG = {
     'ssl_mode': False,
 }
 
+DEFAULT_POOL_HEALTH_CHECK_INTERVAL = 30
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_BATCH_TIMEOUT = 30
+
 
 class RemmeAPI(IRemmeAPI):
     """
@@ -40,8 +57,22 @@ class RemmeAPI(IRemmeAPI):
 
         By default params for constructor are: ``node_address = 'localhost:8080'``, ``ssl_mode = False``
 
+        By default each request opens and closes its own connection to the node.
+        Set ``pool_size`` to keep that many long-lived connections to each node and reuse them between requests.
+
+        Set ``nodes`` to spread reads of chain data across several nodes with ``balancing_strategy``
+        (``round_robin`` by default, ``least_outstanding`` or ``ewma_latency``). Other requests go to the primary
+        node, which is ``node_address`` or the first of ``nodes``. Failed nodes are excluded until they respond again.
+
+        Set ``hedging_percentile`` to send a read also to another node, when the first node did not answer within
+        that percentile of recent read latencies (but not sooner than ``hedging_min_delay`` seconds).
+        The first answer wins and the slower request is cancelled.
+
         Args:
-            network_config (dict): node_address (string), ssl_mode (boolean)
+            network_config (dict): node_address (string), ssl_mode (boolean), pool_size (integer, optional),
+                pool_health_check_interval (integer, optional), batch_size (integer, optional),
+                nodes (list, optional), balancing_strategy (string, optional), hedging_percentile (float, optional),
+                hedging_min_delay (float, optional)
 
         To use:
             Implementation with all params.
@@ -69,7 +100,37 @@ class RemmeAPI(IRemmeAPI):
 
                 from remme.api import RemmeAPI
                 remme_api = await RemmeAPI()
+
+            Implementation with pool of connections.
+
+            .. code-block:: python
+
+                from remme.api import RemmeAPI
+                remme_api = await RemmeAPI({
+                    'node_address': 'localhost:8080',
+                    'pool_size': 8,
+                    'pool_health_check_interval': 30,
+                })
+
+                ...
+
+                await remme_api.close()
+
+            Implementation with several nodes.
+
+            .. code-block:: python
+
+                from remme.api import RemmeAPI
+                remme_api = await RemmeAPI({
+                    'nodes': ['node-1.example.com:8080', 'node-2.example.com:8080', 'node-3.example.com:8080'],
+                    'balancing_strategy': RemmeBalancingStrategy.EWMA_LATENCY.value,
+                    'pool_size': 4,
+                    'hedging_percentile': 95,
+                })
         """
+        if network_config.get('nodes') and not network_config.get('node_address'):
+            network_config['node_address'] = network_config.get('nodes')[0]
+
         if not network_config.get('node_address'):
             network_config['node_address'] = 'localhost:8080'
 
@@ -79,26 +140,48 @@ class RemmeAPI(IRemmeAPI):
         validate_node_config(network_config=network_config)
         self._network_config = network_config
 
-        self._rpc_client = aiohttp_json_rpc.JsonRpcClient()
+        node_addresses = [network_config.get('node_address')]
 
-    def _get_url_for_request(self):
+        for node_address in network_config.get('nodes', []):
+            if node_address not in node_addresses:
+                node_addresses.append(node_address)
 
-        node_address, ssl_mode = self._network_config.get('node_address'), self._network_config.get('ssl_mode')
-        return f'{"https://" if ssl_mode else "http://"}{node_address}'
+        self._balancer = RemmeNodeBalancer(
+            nodes=[self._create_node(node_address=node_address) for node_address in node_addresses],
+            strategy=network_config.get('balancing_strategy', RemmeBalancingStrategy.ROUND_ROBIN),
+        )
+
+        self._hedging_policy = None
+
+        if network_config.get('hedging_percentile'):
+            self._hedging_policy = RemmeHedgingPolicy(
+                percentile=network_config.get('hedging_percentile'),
+                min_delay=network_config.get('hedging_min_delay', DEFAULT_HEDGING_MIN_DELAY),
+            )
 
-    @staticmethod
-    def _get_request_config(method, payload):
+    def _create_node(self, node_address):
 
-        options = {
-            'method': method.value,
-            'params': payload,
-            'id': round(random() * 100),
-        }
+        url = self._get_url_for_request(node_address=node_address)
+        connection_pool = None
 
-        if payload:
-            options.update({'params': payload})
+        if self._network_config.get('pool_size'):
+            connection_pool = RemmeConnectionPool(
+                url=url,
+                size=self._network_config.get('pool_size'),
+                health_check_interval=self._network_config.get(
+                    'pool_health_check_interval', DEFAULT_POOL_HEALTH_CHECK_INTERVAL,
+                ),
+            )
 
-        return options
+        return RemmeNode(address=node_address, url=url, connection_pool=connection_pool)
+
+    def _get_url_for_request(self, node_address=None):
+
+        if node_address is None:
+            node_address = self._network_config.get('node_address')
+
+        ssl_mode = self._network_config.get('ssl_mode')
+        return f'{"https://" if ssl_mode else "http://"}{node_address}'
 
     @property
     def network_config(self):
@@ -107,6 +190,48 @@ class RemmeAPI(IRemmeAPI):
         """
         return self._network_config
 
+    @property
+    def nodes(self):
+        """
+        Return nodes requests are sent to, with their statistics (outstanding requests, latency, ejection).
+        """
+        return self._balancer.nodes
+
+    @property
+    def hedging_policy(self):
+        """
+        Return policy of hedged reads with its counters, ``None`` if reads are not hedged.
+        """
+        return self._hedging_policy
+
+    async def _send(self, call, is_read, failed_nodes=None):
+        """
+        Send call to the node chosen by balancer. Reads that failed because of unavailable node
+        are retried on other nodes.
+
+        Args:
+            call (callable): coroutine function that takes connection and sends request over it
+            is_read (boolean): whether request can be answered by any node
+            failed_nodes (list, optional): nodes that already failed for this call
+
+        Returns:
+            Result of the call.
+        """
+        failed_nodes = list(failed_nodes or [])
+
+        while True:
+            node = self._balancer.choose(is_read=is_read, exclude=failed_nodes)
+
+            try:
+                return await self._balancer.send(node=node, call=call, is_read=is_read)
+
+            except Exception as error:
+                failed_nodes.append(node)
+
+                if not is_read or not self._balancer.is_node_error(error=error) \
+                        or self._balancer.choose(is_read=is_read, exclude=failed_nodes) is None:
+                    raise
+
     async def send_request(self, method, params=None):
         """
         Make and send request with given method and payload.
@@ -129,15 +254,147 @@ class RemmeAPI(IRemmeAPI):
         if not isinstance(method, RemmeMethods):
             raise Exception('Invalid RPC method given.')
 
-        url = self._get_url_for_request()
-        request_data = self._get_request_config(method=method, payload=params)
+        async def call(connection):
+            return await connection.call(method=method, params=params)
 
-        try:
-            await self._rpc_client.connect_url(url=url)
-        except Exception:
-            raise Exception(f'Please check if your node running at {url}.')
+        if method not in READ_METHODS:
+            return await self._send(call=call, is_read=False)
+
+        if self._hedging_policy is None:
+            return await self._send(call=call, is_read=True)
+
+        started_at = time.monotonic()
+        result = await self._send_hedged(call=call)
+
+        self._hedging_policy.record(latency=time.monotonic() - started_at)
+
+        return result
+
+    async def _send_hedged(self, call):
+        """
+        Send read to the node chosen by balancer, and if it was not answered within hedging delay,
+        send it to another node too. Return the first answer and cancel the slower request.
+
+        Args:
+            call (callable): coroutine function that takes connection and sends request over it
+
+        Returns:
+            Result of the call.
+        """
+        delay = self._hedging_policy.get_delay()
+
+        if delay is None:
+            return await self._send(call=call, is_read=True)
+
+        first_node = self._balancer.choose(is_read=True)
+
+        if self._balancer.choose(is_read=True, exclude=[first_node]) is None:
+            return await self._send(call=call, is_read=True)
+
+        nodes = {asyncio.ensure_future(self._balancer.send(node=first_node, call=call)): first_node}
+        hedge = None
 
         try:
-            return await self._rpc_client.call(**request_data)
+            done, _ = await asyncio.wait(list(nodes), timeout=delay)
+
+            if not done:
+                second_node = self._balancer.choose(is_read=True, exclude=[first_node])
+
+                if second_node is not None:
+                    hedge = asyncio.ensure_future(self._balancer.send(node=second_node, call=call))
+                    nodes[hedge] = second_node
+                    self._hedging_policy.hedged += 1
+
+            pending, error = set(nodes), None
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._hedging_policy.hedge_wins += 1
+
+                        return task.result()
+
+                    error = task.exception()
+
+                    if not self._balancer.is_node_error(error=error):
+                        raise error
+
         finally:
-            await self._rpc_client.disconnect()
+            for task in nodes:
+                task.cancel()
+
+        if self._balancer.choose(is_read=True, exclude=list(nodes.values())) is None:
+            raise error
+
+        return await self._send(call=call, is_read=True, failed_nodes=list(nodes.values()))
+
+    async def send_batch(self, requests, batch_size=None, return_exceptions=False):
+        """
+        Make and send many requests in JSON-RPC batches over one connection.
+        Requests are split into batches of ``batch_size`` calls, each batch is sent as one frame
+        and responses are matched back to requests by identifier.
+
+        References::
+            - https://www.jsonrpc.org/specification#batch
+
+        Args:
+            requests (list): list of (RemmeMethods, dict) tuples with method and payload
+            batch_size (integer, optional): maximum number of calls in one batch, ``batch_size`` of network config
+                is used by default
+            return_exceptions (boolean): put errors of failed calls to results instead of raising the first one
+
+        Returns:
+            List of results in the same order as requests.
+
+        To use:
+            .. code-block:: python
+
+                balances = await remme_api.send_batch([
+                    (RemmeMethods.TOKEN, {'public_key_address': address}) for address in addresses
+                ])
+        """
+        if batch_size is None:
+            batch_size = self._network_config.get('batch_size', DEFAULT_BATCH_SIZE)
+
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size <= 0:
+            raise Exception('Batch size should be positive integer.')
+
+        requests = list(requests)
+
+        for method, _ in requests:
+            if not isinstance(method, RemmeMethods):
+                raise Exception('Invalid RPC method given.')
+
+        if not requests:
+            return []
+
+        async def call(connection):
+            return await asyncio.gather(*[
+                connection.call_batch(requests=chunk, timeout=DEFAULT_BATCH_TIMEOUT)
+                for chunk in split_into_chunks(items=requests, chunk_size=batch_size)
+            ])
+
+        chunks = await self._send(call=call, is_read=all(method in READ_METHODS for method, _ in requests))
+
+        results = [result for chunk in chunks for result in chunk]
+
+        errors = [result for result in results if isinstance(result, Exception)]
+
+        if errors and not return_exceptions:
+            raise errors[0]
+
+        return results
+
+    async def close(self):
+        """
+        Close long-lived connections to the nodes, if pool of connections is used, and stop probing failed nodes.
+
+        To use:
+            .. code-block:: python
+
+                await remme_api.close()
+        """
+        await self._balancer.close()
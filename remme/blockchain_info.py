@@ -1,8 +1,13 @@
-import base64
+import asyncio
+import collections
 import re
 
-from remme import protobuf
 from remme.models.blockchain_info.block_info import BlockInfo
+from remme.models.blockchain_info.decoder_registry import (
+    DEFAULT_DECODER_REGISTRY,
+    decode_states,
+    decode_transaction_payloads,
+)
 from remme.models.blockchain_info.network_status import NetworkStatus
 from remme.models.blockchain_info.query import (
     BatchQuery,
@@ -13,11 +18,18 @@ from remme.models.blockchain_info.query import (
 from remme.models.general.methods import RemmeMethods
 from remme.models.general.patterns import RemmePatterns
 from remme.models.interfaces.blockchain_info import IRemmeBlockchainInfo
-from remme.models.utils import (
-    RemmeFamilyName,
-    RemmeNamespace,
-)
-from remme.utils import get_namespace_params
+from remme.models.utils.namespace import RemmeNamespace
+
+DEFAULT_EXPORT_CONCURRENCY = 4
+DEFAULT_EXPORT_SEGMENT_SIZE = 100
+DEFAULT_PARSING_CHUNK_SIZE = 1000
+DEFAULT_SCAN_CONCURRENCY = 4
+DEFAULT_RECEIPTS_CHUNK_SIZE = 100
+DEFAULT_RECEIPTS_CONCURRENCY = 4
+DEFAULT_RECEIPTS_ATTEMPTS = 3
+RECEIPTS_RETRY_DELAY = 0.5
+
+HEADER_SIGNATURE_PATTERN = re.compile(RemmePatterns.HEADER_SIGNATURE.value)
 
 
 class RemmeBlockchainInfo(IRemmeBlockchainInfo):
@@ -25,87 +37,11 @@ class RemmeBlockchainInfo(IRemmeBlockchainInfo):
     Main class that works with blockchain data (blocks, batches, transactions, addresses, peers).
     """
 
-    _address = {
-        RemmeNamespace.SWAP.value: get_namespace_params(
-            type='info atomic swap', parser=protobuf.AtomicSwapInfo(),
-        ),
-        RemmeNamespace.ACCOUNT.value: get_namespace_params(
-            type='account', parser=protobuf.Account(),
-        ),
-        RemmeNamespace.NODE_ACCOUNT.value: get_namespace_params(
-            type='node account', parser=protobuf.NodeAccount(),
-        ),
-        RemmeNamespace.PUBLIC_KEY.value: get_namespace_params(
-            type='storage public key', parser=protobuf.PubKeyStorage(),
-        ),
-    }
-
-    _correspond = {
-        RemmeFamilyName.ACCOUNT.value: {
-            protobuf.AccountMethod.TRANSFER: get_namespace_params(
-                type='transfer token', parser=protobuf.TransferPayload(),
-            ),
-            protobuf.AccountMethod.GENESIS: get_namespace_params(
-                type='genesis', parser=protobuf.GenesisPayload(),
-            ),
-        },
-        RemmeFamilyName.NODE_ACCOUNT.value: {
-            protobuf.NodeAccountMethod.INITIALIZE_MASTERNODE: get_namespace_params(
-                type='initialize masternode',
-                parser=protobuf.NodeAccountInternalTransferPayload(),
-            ),
-            protobuf.NodeAccountMethod.INITIALIZE_NODE: get_namespace_params(
-                type='initialize node',
-                parser=protobuf.EmptyPayload(),
-            ),
-            protobuf.NodeAccountMethod.CLOSE_MASTERNODE: get_namespace_params(
-                type='close masternode',
-                parser=protobuf.EmptyPayload(),
-            ),
-            protobuf.NodeAccountMethod.SET_BET: get_namespace_params(
-                type='set bet',
-                parser=protobuf.SetBetPayload(),
-            ),
-            protobuf.NodeAccountMethod.TRANSFER_FROM_FROZEN_TO_UNFROZEN: get_namespace_params(
-                type='transfer from frozen to unfrozen',
-                parser=protobuf.EmptyPayload(),
-            ),
-            protobuf.NodeAccountMethod.TRANSFER_FROM_UNFROZEN_TO_OPERATIONAL: get_namespace_params(
-                type='transfer from unfrozen to operational',
-                parser=protobuf.NodeAccountInternalTransferPayload(),
-            ),
-        },
-        RemmeFamilyName.SWAP.value: {
-            protobuf.AtomicSwapMethod.INIT: get_namespace_params(
-                type='atomic-swap-init', parser=protobuf.AtomicSwapInitPayload(),
-            ),
-            protobuf.AtomicSwapMethod.APPROVE: get_namespace_params(
-                type='atomic-swap-approve', parser=protobuf.AtomicSwapApprovePayload(),
-            ),
-            protobuf.AtomicSwapMethod.EXPIRE: get_namespace_params(
-                type='atomic-swap-expire', parser=protobuf.AtomicSwapExpirePayload(),
-            ),
-            protobuf.AtomicSwapMethod.SET_SECRET_LOCK: get_namespace_params(
-                type='atomic-swap-set-secret-lock', parser=protobuf.AtomicSwapSetSecretLockPayload(),
-            ),
-            protobuf.AtomicSwapMethod.CLOSE: get_namespace_params(
-                type='atomic-swap-close', parser=protobuf.AtomicSwapClosePayload(),
-            ),
-        },
-        RemmeFamilyName.PUBLIC_KEY.value: {
-            protobuf.PubKeyMethod.STORE: get_namespace_params(
-                type='store public key', parser=protobuf.NewPubKeyPayload(),
-            ),
-            protobuf.PubKeyMethod.REVOKE: get_namespace_params(
-                type='revoke public key', parser=protobuf.RevokePubKeyPayload(),
-            ),
-        },
-    }
-
-    def __init__(self, remme_api):
+    def __init__(self, remme_api, decoder_registry=DEFAULT_DECODER_REGISTRY):
         """
         Args:
             remme_api: RemmeAPI
+            decoder_registry (RemmeDecoderRegistry, optional): decoders of state data and transaction payloads
 
         To use:
             Usage without remme main package.
@@ -116,10 +52,18 @@ class RemmeBlockchainInfo(IRemmeBlockchainInfo):
                 remme_blockchain_info = RemmeBlockchainInfo(remme_api)
         """
         self._remme_api = remme_api
+        self._decoder_registry = decoder_registry
+
+    @property
+    def decoder_registry(self):
+        """
+        Return registry of decoders of state data and transaction payloads.
+        """
+        return self._decoder_registry
 
     @staticmethod
     def _check_id(id_):
-        if id_ is None or re.match(RemmePatterns.HEADER_SIGNATURE.value, id_) is None:
+        if not isinstance(id_, str) or HEADER_SIGNATURE_PATTERN.match(id_) is None:
             raise Exception('Given `id` is not a valid.')
 
     @staticmethod
@@ -259,6 +203,32 @@ class RemmeBlockchainInfo(IRemmeBlockchainInfo):
 
         return BlockInfo(data=block_info[0])
 
+    async def get_blocks_info(self, query=None):
+        """
+        Get information about several blocks, e.g. their timestamps.
+
+        Args:
+            query (dict, optional): dictionary with specific parameters, as for ``get_block_info``
+
+        Returns:
+            List of information about blocks.
+
+        To use:
+            .. code-block:: python
+
+                blocks_info = await remme.blockchain_info.get_blocks_info({'start': 2, 'limit': 10})
+                print([block_info.timestamp for block_info in blocks_info])
+        """
+        blocks_info = await self._remme_api.send_request(
+            method=RemmeMethods.BLOCK_INFO,
+            params=query,
+        )
+
+        if blocks_info is None:
+            raise Exception('Unknown error occurs in the server.')
+
+        return [BlockInfo(data=block_info) for block_info in blocks_info]
+
     async def get_batches(self, query=None):
         """
         Get list of batches from REMChain.
@@ -471,23 +441,7 @@ class RemmeBlockchainInfo(IRemmeBlockchainInfo):
                 parsed_state = await remme.blockchain_info.parse_state_data(state)
                 print(parsed_state)
         """
-        address = state.get('address')
-
-        if address is None:
-            raise Exception('State should have address for parsing.')
-
-        if not RemmeBlockchainInfo._address.get(address[0:6]):
-            raise Exception(f'This address {address} don\'t supported for parsing.')
-
-        namespace_params = RemmeBlockchainInfo._address.get(address[0:6])
-        type_, parser = namespace_params.get('type'), namespace_params.get('parser')
-
-        parser.ParseFromString(base64.b64decode(state.get('data')))
-
-        return {
-            'data': parser,
-            'type': type_,
-        }
+        return self._decoder_registry.decode_state(state=state)
 
     async def get_transactions(self, query=None):
         """
@@ -592,29 +546,63 @@ class RemmeBlockchainInfo(IRemmeBlockchainInfo):
                 parsed_transaction = remme.blockchain_info.parse_transaction_payload(transaction.get('data'))
                 print(parsed_transaction)
         """
-        family_name = transaction.get('header').get('family_name')
+        return self._decoder_registry.decode_transaction_payload(transaction=transaction)
+
+    async def parse_many(self, transactions, executor=None, chunk_size=DEFAULT_PARSING_CHUNK_SIZE,
+                         return_exceptions=False):
+        """
+        Parse payloads of many transactions.
 
-        if family_name not in RemmeBlockchainInfo._correspond:
-            raise Exception(f'Family name {family_name} don\'t supported for parsing.')
+        Payloads are decoded in chunks of ``chunk_size`` transactions. If executor is given,
+        e.g. ``ProcessPoolExecutor``, chunks are decoded by it. Decoded payload is returned as dictionary
+        of message fields, so it is passed from worker processes without parsing messages in the event loop
+        process again.
 
-        payload = base64.b64decode(transaction.get('payload'))
+        Args:
+            transactions (list): list of transactions
+            executor (concurrent.futures.Executor, optional): executor to parse payloads in
+            chunk_size (integer, optional): number of transactions parsed by one executor job
+            return_exceptions (boolean, optional): whether to return exceptions of failed parsings instead of raising
 
-        transaction_payload = protobuf.TransactionPayload()
-        transaction_payload.ParseFromString(payload)
+        Returns:
+            List of dictionaries with parsed payload as dictionary and type, in the same order as transactions.
 
-        method = transaction_payload.method
-        data = transaction_payload.data
+        To use:
+            .. code-block:: python
 
-        namespace_params = RemmeBlockchainInfo._correspond.get(family_name).get(method)
+                block = await remme.blockchain_info.get_block_by_id(block_id)
+                transactions = [
+                    transaction for batch in block.get('batches') for transaction in batch.get('transactions')
+                ]
 
-        type_, parser = namespace_params.get('type'), namespace_params.get('parser')
+                with ProcessPoolExecutor() as executor:
+                    parsed_transactions = await remme.blockchain_info.parse_many(
+                        transactions, executor=executor, return_exceptions=True,
+                    )
+        """
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise Exception('Chunk size should be positive integer.')
 
-        parser.ParseFromString(data)
+        chunks = [transactions[index:index + chunk_size] for index in range(0, len(transactions), chunk_size)]
 
-        return {
-            'payload': parser,
-            'type': type_,
-        }
+        if executor is None:
+            chunks_results = [decode_transaction_payloads(self._decoder_registry, chunk) for chunk in chunks]
+        else:
+            loop = asyncio.get_event_loop()
+
+            chunks_results = await asyncio.gather(*[
+                loop.run_in_executor(executor, decode_transaction_payloads, self._decoder_registry, chunk)
+                for chunk in chunks
+            ])
+
+        results = [result for chunk_results in chunks_results for result in chunk_results]
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+        return results
 
     async def get_network_status(self):
         """
@@ -672,3 +660,374 @@ class RemmeBlockchainInfo(IRemmeBlockchainInfo):
         return (await self._remme_api.send_request(
             method=RemmeMethods.RECEIPTS, params={'ids': ids}
         )).get('data')
+
+    async def _get_receipts_chunk(self, ids, attempts):
+        """
+        Get receipts of chunk of transactions, retrying failed requests with exponential delay.
+        """
+        for attempt in range(attempts):
+            try:
+                return (await self._remme_api.send_request(
+                    method=RemmeMethods.RECEIPTS, params={'ids': ids}
+                ) or {}).get('data') or []
+
+            except Exception:
+                if attempt == attempts - 1:
+                    raise
+
+                await asyncio.sleep(RECEIPTS_RETRY_DELAY * 2 ** attempt)
+
+    async def get_receipts_bulk(self, ids, chunk_size=DEFAULT_RECEIPTS_CHUNK_SIZE,
+                                concurrency=DEFAULT_RECEIPTS_CONCURRENCY, attempts=DEFAULT_RECEIPTS_ATTEMPTS):
+        """
+        Get receipts of many transactions.
+
+        Ids are requested in chunks of ``chunk_size``, with at most ``concurrency`` chunks requested at the same
+        time. Failed chunk is requested again up to ``attempts`` times. Receipts are returned as soon as their chunk
+        is received, so they could be out of order of ids.
+
+        Args:
+            ids (list): list of string
+            chunk_size (integer, optional): number of ids in one request
+            concurrency (integer, optional): maximum number of chunks requested at the same time
+            attempts (integer, optional): maximum number of requests of one chunk
+
+        Returns:
+            Asynchronous iterator of transactions receipts.
+
+        To use:
+            .. code-block:: python
+
+                async for receipt in remme.blockchain_info.get_receipts_bulk(ids, chunk_size=100, concurrency=8):
+                    print(receipt.get('transaction_id'))
+        """
+        for value, name in ((chunk_size, 'Chunk size'), (concurrency, 'Concurrency'), (attempts, 'Attempts')):
+            if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+                raise Exception(f'{name} should be positive integer.')
+
+        for identifier in ids:
+            self._check_id(id_=identifier)
+
+        chunk_indexes = iter(range(0, len(ids), chunk_size))
+        requests = set()
+
+        def request_next_chunk():
+            index = next(chunk_indexes, None)
+
+            if index is not None:
+                requests.add(asyncio.ensure_future(
+                    self._get_receipts_chunk(ids=ids[index:index + chunk_size], attempts=attempts),
+                ))
+
+        for _ in range(concurrency):
+            request_next_chunk()
+
+        try:
+            while requests:
+                done, _ = await asyncio.wait(requests, return_when=asyncio.FIRST_COMPLETED)
+
+                for request in done:
+                    requests.discard(request)
+                    request_next_chunk()
+
+                for request in done:
+                    for receipt in request.result():
+                        yield receipt
+
+        finally:
+            for request in requests:
+                request.cancel()
+
+    async def _iter_pages(self, get_page, query=None, page_size=None):
+        """
+        Iterate over items of all pages of list, following paging cursor of each page.
+
+        The next page is requested while items of the current one are consumed, so at most two pages are
+        kept in memory. All pages are read from the head of the first page, so they are consistent
+        even if new blocks are committed during iteration.
+        """
+        query = dict(query or {})
+
+        if page_size is not None:
+            query['limit'] = page_size
+
+        page_request = asyncio.ensure_future(get_page(query=query))
+
+        try:
+            while page_request is not None:
+                page = await page_request or {}
+                page_request = None
+
+                next_position = (page.get('paging') or {}).get('next_position')
+
+                if next_position:
+                    query.update({'start': next_position, 'head': query.get('head') or page.get('head')})
+                    page_request = asyncio.ensure_future(get_page(query=dict(query)))
+
+                for item in page.get('data') or []:
+                    yield item
+
+        finally:
+            if page_request is not None:
+                page_request.cancel()
+
+    def iter_blocks(self, query=None, page_size=None):
+        """
+        Iterate over blocks of all pages of list of blocks from REMChain.
+
+        Args:
+            query (dict, optional): dictionary with specific parameters, as for ``get_blocks``
+            page_size (integer, optional): number of blocks requested at once
+
+        Returns:
+            Asynchronous iterator of blocks.
+
+        To use:
+            .. code-block:: python
+
+                async for block in remme.blockchain_info.iter_blocks(page_size=100):
+                    print(block.get('header_signature'))
+        """
+        return self._iter_pages(get_page=self.get_blocks, query=query, page_size=page_size)
+
+    def iter_batches(self, query=None, page_size=None):
+        """
+        Iterate over batches of all pages of list of batches from REMChain.
+
+        Args:
+            query (dict, optional): dictionary with specific parameters, as for ``get_batches``
+            page_size (integer, optional): number of batches requested at once
+
+        Returns:
+            Asynchronous iterator of batches.
+
+        To use:
+            .. code-block:: python
+
+                async for batch in remme.blockchain_info.iter_batches(page_size=100):
+                    print(batch.get('header_signature'))
+        """
+        return self._iter_pages(get_page=self.get_batches, query=query, page_size=page_size)
+
+    def iter_transactions(self, query=None, page_size=None):
+        """
+        Iterate over transactions of all pages of list of transactions from REMChain.
+
+        Args:
+            query (dict, optional): dictionary with specific parameters, as for ``get_transactions``
+            page_size (integer, optional): number of transactions requested at once
+
+        Returns:
+            Asynchronous iterator of transactions.
+
+        To use:
+            .. code-block:: python
+
+                async for transaction in remme.blockchain_info.iter_transactions({'family_name': 'account'}):
+                    print(transaction.get('header_signature'))
+        """
+        return self._iter_pages(get_page=self.get_transactions, query=query, page_size=page_size)
+
+    def iter_states(self, query=None, page_size=None):
+        """
+        Iterate over states of all pages of list of states in REMChain.
+
+        Args:
+            query (dict, optional): dictionary with specific parameters, as for ``get_states``
+            page_size (integer, optional): number of states requested at once
+
+        Returns:
+            Asynchronous iterator of states.
+
+        To use:
+            .. code-block:: python
+
+                async for state in remme.blockchain_info.iter_states(page_size=100):
+                    print(state.get('address'))
+        """
+        return self._iter_pages(get_page=self.get_states, query=query, page_size=page_size)
+
+    async def scan_namespace(self, namespace, page_size=None, executor=None, chunk_size=DEFAULT_PARSING_CHUNK_SIZE,
+                             concurrency=DEFAULT_SCAN_CONCURRENCY):
+        """
+        Iterate over decoded states of all addresses in namespace, e.g. all accounts.
+
+        States are listed page by page with namespace as address prefix, and decoded in chunks of ``chunk_size``
+        states. If executor is given, e.g. ``ProcessPoolExecutor``, chunks are decoded by it while next pages are
+        being fetched. Decoded data is returned as dictionary of message fields, so it is passed from worker
+        processes without parsing messages in the event loop process again.
+
+        Args:
+            namespace (RemmeNamespace or string): namespace or address prefix of supported namespace
+            page_size (integer, optional): number of states requested at once
+            executor (concurrent.futures.Executor, optional): executor to decode states in
+            chunk_size (integer, optional): number of states decoded by one executor job
+            concurrency (integer, optional): maximum number of chunks being decoded at the same time
+
+        Returns:
+            Asynchronous iterator of dictionaries with address, decoded data as dictionary and type.
+
+        To use:
+            .. code-block:: python
+
+                with ProcessPoolExecutor() as executor:
+                    async for account in remme.blockchain_info.scan_namespace(
+                        RemmeNamespace.ACCOUNT, page_size=1000, executor=executor,
+                    ):
+                        print(account.get('address'), account.get('data').get('balance'))
+        """
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise Exception('Chunk size should be positive integer.')
+
+        prefix = namespace.value if isinstance(namespace, RemmeNamespace) else namespace
+
+        if not isinstance(prefix, str) or not self._decoder_registry.is_state_supported(address=prefix):
+            raise Exception(f'Namespace {prefix} don\'t supported for parsing.')
+
+        loop = asyncio.get_event_loop()
+
+        async def decode(states):
+
+            if executor is None:
+                return decode_states(self._decoder_registry, states)
+
+            return await loop.run_in_executor(executor, decode_states, self._decoder_registry, states)
+
+        decodings = collections.deque()
+        states = []
+
+        async def get_records():
+
+            for result in await decodings.popleft():
+                if isinstance(result, Exception):
+                    raise result
+
+                yield result
+
+        try:
+            async for state in self.iter_states(query={'address': prefix}, page_size=page_size):
+                states.append(state)
+
+                if len(states) >= chunk_size:
+                    decodings.append(asyncio.ensure_future(decode(states=states)))
+                    states = []
+
+                if len(decodings) >= concurrency:
+                    async for record in get_records():
+                        yield record
+
+            if states:
+                decodings.append(asyncio.ensure_future(decode(states=states)))
+
+            while decodings:
+                async for record in get_records():
+                    yield record
+
+        finally:
+            for decoding in decodings:
+                decoding.cancel()
+
+    async def _get_blocks_segment(self, head, start_block, end_block):
+        """
+        Get blocks with numbers from start to end block, following paging cursor if node returns them
+        in several pages.
+
+        Returns:
+            List of blocks in ascending order of block numbers.
+        """
+        blocks = []
+        start = end_block
+
+        while start is not None and len(blocks) < end_block - start_block + 1:
+            page = await self.get_blocks(query={
+                'head': head,
+                'start': start,
+                'limit': end_block - start_block + 1 - len(blocks),
+            }) or {}
+
+            page_blocks = page.get('data') or []
+
+            if not page_blocks:
+                break
+
+            blocks.extend(page_blocks)
+            start = (page.get('paging') or {}).get('next_position')
+
+        return [
+            block for block in reversed(blocks) if start_block <= int(block.get('header').get('block_num'))
+        ]
+
+    async def export_range(self, start_block=0, end_block=None, concurrency=DEFAULT_EXPORT_CONCURRENCY,
+                           segment_size=DEFAULT_EXPORT_SEGMENT_SIZE):
+        """
+        Export blocks with numbers from start to end block, in ascending order of block numbers.
+
+        The range is split into segments of ``segment_size`` blocks, up to ``concurrency`` of which are fetched
+        at the same time, over pooled connections or several nodes if they are configured. Segments are yielded
+        in order, so at most ``concurrency`` segments are kept in memory. All segments are read from the same head.
+
+        Args:
+            start_block (integer, optional): number of the first block, genesis by default
+            end_block (integer, optional): number of the last block, current head by default
+            concurrency (integer, optional): maximum number of segments fetched at the same time
+            segment_size (integer, optional): number of blocks in segment
+
+        Returns:
+            Asynchronous iterator of blocks.
+
+        To use:
+            .. code-block:: python
+
+                async for block in remme.blockchain_info.export_range(0, 10000, concurrency=8):
+                    print(block.get('header').get('block_num'))
+        """
+        for name, value in (('concurrency', concurrency), ('segment_size', segment_size)):
+            if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+                raise Exception(f'Parameter `{name}` should be positive integer.')
+
+        if isinstance(start_block, bool) or not isinstance(start_block, int) or start_block < 0:
+            raise Exception('Parameter `start_block` should be not negative integer.')
+
+        head_page = await self.get_blocks(query={'limit': 1}) or {}
+        head_blocks = head_page.get('data') or []
+
+        if not head_blocks:
+            return
+
+        head_block = head_blocks[0]
+        head_block_num = int(head_block.get('header').get('block_num'))
+
+        end_block = head_block_num if end_block is None else min(end_block, head_block_num)
+
+        if start_block > end_block:
+            return
+
+        segments = iter([
+            (segment_start, min(segment_start + segment_size - 1, end_block))
+            for segment_start in range(start_block, end_block + 1, segment_size)
+        ])
+
+        requests = collections.deque()
+
+        def request_next_segment():
+            segment = next(segments, None)
+
+            if segment is not None:
+                requests.append(asyncio.ensure_future(self._get_blocks_segment(
+                    head=head_block.get('header_signature'), start_block=segment[0], end_block=segment[1],
+                )))
+
+        for _ in range(concurrency):
+            request_next_segment()
+
+        try:
+            while requests:
+                blocks = await requests.popleft()
+                request_next_segment()
+
+                for block in blocks:
+                    yield block
+
+        finally:
+            for request in requests:
+                request.cancel()
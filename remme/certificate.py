@@ -9,6 +9,7 @@ from cryptography.hazmat.primitives import hashes
 from remme.models.certificate.certificate_transaction_response import CertificateTransactionResponse
 from remme.models.certificate.x509_certificate_builder import X509CertificateBuilder
 from remme.models.interfaces.certificate import IRemmeCertificate
+from remme.models.keys.key_type import KeyType
 from remme.models.keys.rsa import RSA
 from remme.models.keys.rsa_signature_padding import RsaSignaturePadding
 from remme.utils import (
@@ -58,10 +59,11 @@ class RemmeCertificate(IRemmeCertificate):
 
     _rsa_key_size = 2048
 
-    def __init__(self, remme_public_key_storage):
+    def __init__(self, remme_public_key_storage, key_pool=None):
         """
         Args:
             remme_public_key_storage: RemmePublicKeyStorage
+            key_pool (RemmeKeyPool, optional): pool of pre-generated RSA key pairs for new certificates
 
         To use:
             Usage without main remme package.
@@ -73,8 +75,26 @@ class RemmeCertificate(IRemmeCertificate):
                 transaction = RemmeTransactionService()
                 public_key_storage = RemmePublicKeyStorage(api, account, transaction)
                 certificate = RemmeCertificate(public_key_storage)
+
+            Usage with key pool, so certificates are created without waiting for RSA key generation.
+
+            .. code-block:: python
+
+                key_pool = RemmeKeyPool(key_type=KeyType.RSA).start()
+                certificate = RemmeCertificate(public_key_storage, key_pool=key_pool)
         """
+        if key_pool is not None and key_pool.key_type != KeyType.RSA:
+            raise Exception('Key pool for certificates should contain RSA key pairs.')
+
         self._remme_public_key_storage = remme_public_key_storage
+        self._key_pool = key_pool
+
+    @property
+    def key_pool(self):
+        """
+        Return pool of pre-generated RSA key pairs, ``None`` if key pairs are generated for each certificate.
+        """
+        return self._key_pool
 
     @staticmethod
     def _get_params():
@@ -194,10 +214,12 @@ class RemmeCertificate(IRemmeCertificate):
                     'serial':str(datetime.now()),
                 })
         """
-        return self._create_certificate(
-            keys=RSA.generate_key_pair(),
-            certificate_data_to_create=certificate_data_to_create,
-        )
+        if self._key_pool is not None:
+            keys = self._key_pool.get()
+        else:
+            keys = RSA.generate_key_pair()
+
+        return self._create_certificate(keys=keys, certificate_data_to_create=certificate_data_to_create)
 
     async def create_and_store(self, **certificate_data_to_create):
         """
@@ -224,7 +246,15 @@ class RemmeCertificate(IRemmeCertificate):
                     serial=str(datetime.now())
                 )
         """
-        certificate = self.create(certificate_data_to_create=certificate_data_to_create)
+        if self._key_pool is not None:
+            certificate = self._create_certificate(
+                keys=await self._key_pool.acquire(),
+                certificate_data_to_create=certificate_data_to_create,
+            )
+
+        else:
+            certificate = self.create(certificate_data_to_create=certificate_data_to_create)
+
         return await self.store(certificate=certificate)
 
     async def store(self, certificate):
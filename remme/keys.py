@@ -2,6 +2,51 @@ from remme.models.keys.ecdsa import ECDSA
 from remme.models.keys.eddsa import EdDSA
 from remme.models.keys.key_type import KeyType
 from remme.models.keys.rsa import RSA
+from remme.models.keys.rsa_signature_padding import RsaSignaturePadding
+
+DEFAULT_VERIFYING_CHUNK_SIZE = 1000
+
+
+def verify_signatures(key_type, groups, rsa_signature_padding=RsaSignaturePadding.PSS):
+    """
+    Verify signatures grouped by public key, parsing each public key once.
+
+    Module-level function, so it could be run in worker processes.
+
+    Args:
+        key_type (KeyType): enum (RSA, ECDSA, EdDSA)
+        groups (list): list of (public_key, [(data, signature), ...]) tuples, public key in bytes or hex
+        rsa_signature_padding (RsaSignaturePadding, optional): RSA padding for signature
+
+    Returns:
+        List of lists of verification results, in the same order as groups and their signatures.
+    """
+    results = []
+
+    for public_key, signatures in groups:
+
+        try:
+            if isinstance(public_key, str):
+                public_key = bytes.fromhex(public_key)
+
+            key = RemmeKeys.construct(key_type=key_type, public_key=public_key)
+        except Exception:
+            results.append([False] * len(signatures))
+            continue
+
+        group_results = []
+
+        for data, signature in signatures:
+            try:
+                group_results.append(
+                    key.verify(data=data, signature=signature, rsa_signature_padding=rsa_signature_padding),
+                )
+            except Exception:
+                group_results.append(False)
+
+        results.append(group_results)
+
+    return results
 
 
 class RemmeKeys:
@@ -125,3 +170,80 @@ class RemmeKeys:
 
         if key_type == KeyType.EdDSA:
             return EdDSA(private_key=private_key, public_key=public_key)
+
+    @staticmethod
+    def verify_many(items, key_type, rsa_signature_padding=RsaSignaturePadding.PSS, executor=None,
+                    chunk_size=DEFAULT_VERIFYING_CHUNK_SIZE):
+        """
+        Verify many signatures.
+
+        Signatures are grouped by public key, so each key is parsed once. Groups are split into jobs of about
+        ``chunk_size`` signatures, which run in the executor if it is given, e.g. ``ProcessPoolExecutor``
+        to use all cores, or in the current thread otherwise.
+
+        Args:
+            items (list): list of (public_key, data, signature) tuples, public key in bytes or hex
+            key_type (KeyType): enum (RSA, ECDSA, EdDSA)
+            rsa_signature_padding (RsaSignaturePadding, optional): RSA padding for signature
+            executor (concurrent.futures.Executor, optional): executor to verify signatures in
+            chunk_size (integer, optional): number of signatures verified by one job
+
+        Returns:
+            List of booleans in the same order as items, ``True`` if signature is correct.
+
+        To use:
+            .. code-block:: python
+
+                from concurrent.futures import ProcessPoolExecutor
+                from remme.models.keys.key_type import KeyType
+
+                with ProcessPoolExecutor() as executor:
+                    results = RemmeKeys.verify_many(
+                        [(public_key, data, signature), ...], KeyType.RSA, executor=executor,
+                    )
+        """
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise Exception('Chunk size should be positive integer.')
+
+        groups = {}
+
+        for index, (public_key, data, signature) in enumerate(items):
+            groups.setdefault(public_key, []).append((index, data, signature))
+
+        jobs, job, job_size = [], [], 0
+
+        for public_key, signatures in groups.items():
+            job.append((public_key, signatures))
+            job_size += len(signatures)
+
+            if job_size >= chunk_size:
+                jobs.append(job)
+                job, job_size = [], 0
+
+        if job:
+            jobs.append(job)
+
+        arguments = [
+            (key_type, [
+                (public_key, [(data, signature) for _, data, signature in signatures])
+                for public_key, signatures in job
+            ], rsa_signature_padding) for job in jobs
+        ]
+
+        if executor is None:
+            jobs_results = [verify_signatures(*job_arguments) for job_arguments in arguments]
+        else:
+            jobs_results = [
+                future.result() for future in [
+                    executor.submit(verify_signatures, *job_arguments) for job_arguments in arguments
+                ]
+            ]
+
+        results = [False] * len(items)
+
+        for job, job_results in zip(jobs, jobs_results):
+            for (_, signatures), group_results in zip(job, job_results):
+                for (index, _, _), result in zip(signatures, group_results):
+                    results[index] = result
+
+        return results
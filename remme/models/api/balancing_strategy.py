@@ -0,0 +1,11 @@
+"""
+Provide enums for strategies of spreading reads across nodes.
+"""
+from enum import Enum
+
+
+class RemmeBalancingStrategy(Enum):
+
+    ROUND_ROBIN = 'round_robin'
+    LEAST_OUTSTANDING = 'least_outstanding'
+    EWMA_LATENCY = 'ewma_latency'
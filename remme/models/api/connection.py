@@ -0,0 +1,244 @@
+"""
+Pipelined JSON-RPC connection to a node.
+"""
+import asyncio
+import itertools
+import json
+import time
+
+from aiohttp import (
+    ClientSession,
+    WSMsgType,
+)
+
+from remme.models.api.json_rpc import (
+    decode_response_error,
+    get_request,
+)
+
+DEFAULT_REQUEST_TIMEOUT = 1
+
+
+class RemmeConnection:
+    """
+    One WebSocket connection to the node, that multiplexes many in-flight JSON-RPC requests.
+
+    Each request gets an identifier from monotonic per-connection counter and a future in the table of pending
+    requests. Single reader task resolves the futures as responses arrive, in any order.
+
+    With ``heartbeat`` the connection is pinged after that many seconds without messages and is closed,
+    if the node does not answer with pong, so half-open connections are not reused. Connection, which request
+    timed out, is considered broken too.
+
+    To use:
+        .. code-block:: python
+
+            connection = await RemmeConnection(url='http://localhost:8080').connect()
+
+            balance, node_config = await asyncio.gather(
+                connection.call(method=RemmeMethods.TOKEN, params={'public_key_address': address}),
+                connection.call(method=RemmeMethods.NODE_CONFIG),
+            )
+
+            await connection.close()
+    """
+
+    def __init__(self, url, heartbeat=None):
+        """
+        Args:
+            url (string): node url
+            heartbeat (float, optional): seconds without messages after which connection is pinged
+        """
+        self._url = url
+        self._heartbeat = heartbeat
+
+        self._session = None
+        self._web_socket = None
+        self._reader = None
+
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._last_used_at = time.monotonic()
+        self._is_timed_out = False
+
+    @property
+    def url(self):
+        """
+        Return node url.
+        """
+        return self._url
+
+    @property
+    def is_alive(self):
+        """
+        Return ``True`` if connection is open, its reader is running and no request timed out.
+        """
+        return self._web_socket is not None and not self._web_socket.closed \
+            and self._reader is not None and not self._reader.done() and not self._is_timed_out
+
+    @property
+    def in_flight(self):
+        """
+        Return number of requests waiting for response.
+        """
+        return len(self._pending)
+
+    @property
+    def idle_time(self):
+        """
+        Return seconds passed since the last request, zero if any request is in flight.
+        """
+        if self._pending:
+            return 0
+
+        return time.monotonic() - self._last_used_at
+
+    async def connect(self):
+        """
+        Open connection and start reading responses.
+
+        Returns:
+            Connection itself.
+        """
+        self._session = ClientSession()
+
+        try:
+            self._web_socket = await self._session.ws_connect(self._url, heartbeat=self._heartbeat)
+        except Exception:
+            await self._session.close()
+            raise Exception(f'Please check if your node running at {self._url}.')
+
+        self._reader = asyncio.ensure_future(self._read())
+
+        return self
+
+    def _resolve(self, response):
+
+        if not isinstance(response, dict):
+            return
+
+        future = self._pending.get(response.get('id'))
+
+        if future is None or future.done():
+            return
+
+        if response.get('error') is not None:
+            future.set_exception(decode_response_error(response=response))
+
+        else:
+            future.set_result(response.get('result'))
+
+    async def _read(self):
+
+        try:
+            async for message in self._web_socket:
+
+                if message.type != WSMsgType.TEXT:
+                    continue
+
+                try:
+                    response = json.loads(message.data)
+                except ValueError:
+                    continue
+
+                if isinstance(response, list):
+                    for item in response:
+                        self._resolve(response=item)
+
+                else:
+                    self._resolve(response=response)
+
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(Exception(f'Connection to the node at {self._url} was closed.'))
+
+    def _register(self, method, params):
+
+        request = get_request(method=method, params=params, id_=next(self._ids))
+
+        future = asyncio.get_event_loop().create_future()
+        self._pending[request.get('id')] = future
+
+        return request, future
+
+    async def _wait(self, futures, timeout):
+
+        try:
+            done, _ = await asyncio.wait(futures, timeout=timeout)
+
+            if len(done) != len(futures):
+                self._is_timed_out = True
+                raise asyncio.TimeoutError()
+
+        finally:
+            for future in futures:
+                future.cancel()
+
+            self._last_used_at = time.monotonic()
+
+    async def call(self, method, params=None, timeout=DEFAULT_REQUEST_TIMEOUT):
+        """
+        Send request and wait for its response.
+
+        Args:
+            method (RemmeMethods): enum
+            params (dict, optional): payload
+            timeout (integer, optional): seconds to wait for response
+
+        Returns:
+            Result of the call.
+        """
+        if not self.is_alive:
+            raise Exception(f'Connection to the node at {self._url} was closed.')
+
+        request, future = self._register(method=method, params=params)
+
+        try:
+            await self._web_socket.send_str(json.dumps(request))
+            await self._wait(futures=[future], timeout=timeout)
+
+        finally:
+            self._pending.pop(request.get('id'), None)
+
+        return future.result()
+
+    async def call_batch(self, requests, timeout=DEFAULT_REQUEST_TIMEOUT):
+        """
+        Send requests in one JSON-RPC batch frame and wait for all responses.
+
+        Args:
+            requests (list): list of (RemmeMethods, dict) tuples with method and payload
+            timeout (integer, optional): seconds to wait for responses
+
+        Returns:
+            List of results in the same order as requests, failed calls are represented by exceptions.
+        """
+        if not self.is_alive:
+            raise Exception(f'Connection to the node at {self._url} was closed.')
+
+        batch = [self._register(method=method, params=params) for method, params in requests]
+        futures = [future for _, future in batch]
+
+        try:
+            await self._web_socket.send_str(json.dumps([request for request, _ in batch]))
+            await self._wait(futures=futures, timeout=timeout)
+
+        finally:
+            for request, _ in batch:
+                self._pending.pop(request.get('id'), None)
+
+        return [future.exception() or future.result() for future in futures]
+
+    async def close(self):
+        """
+        Close connection, waiting requests fail.
+        """
+        if self._web_socket is not None:
+            await self._web_socket.close()
+
+        if self._reader is not None:
+            await asyncio.wait([self._reader])
+
+        if self._session is not None:
+            await self._session.close()
@@ -0,0 +1,133 @@
+"""
+Pool of long-lived JSON-RPC connections to a node.
+"""
+import asyncio
+
+from remme.models.api.connection import RemmeConnection
+
+
+class RemmeConnectionPool:
+    """
+    Keep up to ``size`` open pipelined JSON-RPC connections to one node address and share them between
+    concurrent callers.
+
+    Each caller gets the connection with the fewest requests in flight, a new connection is opened only if all
+    open ones are busy. Connections are pinged after ``health_check_interval`` seconds without messages and closed
+    if the node does not answer with pong. Closed connections and connections, which request timed out,
+    are discarded from the pool and replaced by new ones.
+
+    To use:
+        .. code-block:: python
+
+            pool = RemmeConnectionPool(url='http://localhost:8080', size=4)
+
+            connection = await pool.acquire()
+            response = await connection.call(method=RemmeMethods.NODE_CONFIG)
+
+            await pool.close()
+    """
+
+    def __init__(self, url, size=4, health_check_interval=30):
+        """
+        Args:
+            url (string): node url
+            size (integer): maximum number of open connections
+            health_check_interval (integer): seconds without messages after which connection is pinged
+        """
+        self._url = url
+        self._size = size
+        self._health_check_interval = health_check_interval
+
+        self._connections = []
+        self._opening = 0
+        self._closed = False
+
+    @property
+    def url(self):
+        """
+        Return node url connections are opened to.
+        """
+        return self._url
+
+    @property
+    def size(self):
+        """
+        Return maximum number of open connections.
+        """
+        return self._size
+
+    @property
+    def opened(self):
+        """
+        Return number of currently open connections.
+        """
+        return len(self._connections)
+
+    @property
+    def in_flight(self):
+        """
+        Return number of requests waiting for response over all connections.
+        """
+        return sum(connection.in_flight for connection in self._connections)
+
+    async def _open(self):
+
+        self._opening += 1
+
+        try:
+            connection = await RemmeConnection(url=self._url, heartbeat=self._health_check_interval).connect()
+        finally:
+            self._opening -= 1
+
+        if self._closed:
+            await connection.close()
+            raise Exception('Connection pool is closed.')
+
+        self._connections.append(connection)
+
+        return connection
+
+    async def _discard(self, connection):
+
+        if connection in self._connections:
+            self._connections.remove(connection)
+
+        await connection.close()
+
+    async def acquire(self):
+        """
+        Get the least loaded connection from the pool. Open a new one if all open connections are busy
+        and the pool is not full.
+
+        Returns:
+            Connection.
+        """
+        while True:
+
+            if self._closed:
+                raise Exception('Connection pool is closed.')
+
+            for connection in [connection for connection in self._connections if not connection.is_alive]:
+                await self._discard(connection=connection)
+
+            connection = min(self._connections, key=lambda item: item.in_flight, default=None)
+
+            if (connection is None or connection.in_flight) and self.opened + self._opening < self._size:
+                return await self._open()
+
+            if connection is None:
+                await asyncio.sleep(0.01)
+                continue
+
+            return connection
+
+    async def close(self):
+        """
+        Close all connections and reject further acquiring.
+        """
+        self._closed = True
+
+        connections, self._connections = self._connections, []
+
+        for connection in connections:
+            await connection.close()
@@ -0,0 +1,83 @@
+"""
+Policy of hedged reads.
+"""
+import math
+from collections import deque
+
+DEFAULT_HEDGING_PERCENTILE = 95
+DEFAULT_HEDGING_MIN_DELAY = 0.01
+DEFAULT_HEDGING_WINDOW = 1000
+DEFAULT_HEDGING_MIN_SAMPLES = 20
+
+
+class RemmeHedgingPolicy:
+    """
+    Decide when read request that was not answered yet should be also sent to another node.
+
+    Delay before hedging is the given percentile of latencies of recent reads, so only the slowest
+    ``100 - percentile`` percent of reads are duplicated. Until enough latencies are collected reads are not hedged.
+
+    To use:
+        .. code-block:: python
+
+            policy = RemmeHedgingPolicy(percentile=95)
+            policy.record(latency=0.012)
+
+            delay = policy.get_delay()  # None while there are not enough samples
+    """
+
+    def __init__(self, percentile=DEFAULT_HEDGING_PERCENTILE, min_delay=DEFAULT_HEDGING_MIN_DELAY,
+                 window=DEFAULT_HEDGING_WINDOW, min_samples=DEFAULT_HEDGING_MIN_SAMPLES):
+        """
+        Args:
+            percentile (float): percentile of recent latencies used as delay before hedging
+            min_delay (float): lower bound of delay in seconds
+            window (integer): number of recent latencies the percentile is computed over
+            min_samples (integer): number of latencies needed before reads are hedged
+        """
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._min_samples = min_samples
+
+        self._latencies = deque(maxlen=window)
+        self._records_since_update = 0
+        self._delay = None
+
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    @property
+    def percentile(self):
+        """
+        Return percentile of recent latencies used as delay before hedging.
+        """
+        return self._percentile
+
+    def record(self, latency):
+        """
+        Remember latency of answered read.
+
+        Args:
+            latency (float): seconds from sending request to getting response
+        """
+        self._latencies.append(latency)
+        self._records_since_update += 1
+
+    def get_delay(self):
+        """
+        Get delay before hedging.
+
+        Returns:
+            Delay in seconds or ``None`` if there are not enough latencies to estimate it.
+        """
+        if len(self._latencies) < self._min_samples:
+            return None
+
+        if self._delay is None or self._records_since_update >= self._latencies.maxlen // 10:
+            latencies = sorted(self._latencies)
+            index = min(len(latencies) - 1, math.ceil(len(latencies) * self._percentile / 100) - 1)
+
+            self._delay = max(self._min_delay, latencies[max(index, 0)])
+            self._records_since_update = 0
+
+        return self._delay
@@ -0,0 +1,77 @@
+"""
+Helpers for encoding JSON-RPC requests and decoding responses.
+
+References::
+    - https://www.jsonrpc.org/specification
+"""
+from aiohttp_json_rpc import RpcError
+from aiohttp_json_rpc.protocol import (
+    JSONRPC,
+    JsonRpcMsg,
+    JsonRpcMsgTyp,
+    decode_error,
+)
+
+from remme.models.general.methods import RemmeMethods
+
+
+def get_request(method, params, id_):
+    """
+    Get JSON-RPC request object.
+
+    Args:
+        method (RemmeMethods): enum
+        params (dict): payload
+        id_ (integer): request identifier
+
+    Returns:
+        Request dictionary.
+    """
+    if not isinstance(method, RemmeMethods):
+        raise Exception('Invalid RPC method given.')
+
+    request = {
+        'jsonrpc': JSONRPC,
+        'method': method.value,
+        'id': id_,
+    }
+
+    if params:
+        request.update({'params': params})
+
+    return request
+
+
+def decode_response_error(response):
+    """
+    Convert error member of JSON-RPC response to exception of ``aiohttp_json_rpc``.
+
+    Args:
+        response (dict): JSON-RPC response object with error member
+
+    Returns:
+        Exception.
+    """
+    error = response.get('error')
+
+    if not isinstance(error, dict):
+        return RpcError(msg_id=response.get('id'), data=response, message=str(error))
+
+    try:
+        return decode_error(JsonRpcMsg(JsonRpcMsgTyp.ERROR, response))
+    except KeyError:
+        return RpcError(msg_id=response.get('id'), data=response, message=error.get('message', ''))
+
+
+def split_into_chunks(items, chunk_size):
+    """
+    Split list into consecutive chunks of given size, the last chunk may be shorter.
+
+    Args:
+        items (list): items to split
+        chunk_size (integer): maximum size of chunk
+
+    Returns:
+        List of chunks.
+    """
+    return [items[index:index + chunk_size] for index in range(0, len(items), chunk_size)]
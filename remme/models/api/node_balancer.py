@@ -0,0 +1,279 @@
+"""
+Spread requests across several nodes.
+"""
+import asyncio
+import itertools
+import time
+
+from aiohttp_json_rpc import RpcError
+
+from remme.models.api.balancing_strategy import RemmeBalancingStrategy
+from remme.models.api.connection import RemmeConnection
+from remme.models.general.methods import RemmeMethods
+
+DEFAULT_EWMA_DECAY = 0.3
+DEFAULT_PROBE_INTERVAL = 5
+
+
+class RemmeNode:
+    """
+    Node of the network with its statistics used for balancing.
+    """
+
+    def __init__(self, address, url, connection_pool=None):
+        """
+        Args:
+            address (string): node address without protocol
+            url (string): node url
+            connection_pool (RemmeConnectionPool, optional): pool of connections to the node
+        """
+        self._address = address
+        self._url = url
+        self._connection_pool = connection_pool
+
+        self.outstanding = 0
+        self.latency = 0
+        self.is_ejected = False
+
+    @property
+    def address(self):
+        """
+        Return node address.
+        """
+        return self._address
+
+    @property
+    def url(self):
+        """
+        Return node url.
+        """
+        return self._url
+
+    @property
+    def connection_pool(self):
+        """
+        Return pool of connections to the node, ``None`` if each request opens its own connection.
+        """
+        return self._connection_pool
+
+    async def get_connection(self):
+        """
+        Get connection from the pool, or open a new one if pool of connections is not used.
+
+        Returns:
+            Connection and boolean flag whether the connection should be closed after use.
+        """
+        if self._connection_pool is not None:
+            return await self._connection_pool.acquire(), False
+
+        return await RemmeConnection(url=self._url).connect(), True
+
+
+class RemmeNodeBalancer:
+    """
+    Choose a node for each request.
+
+    Reads are spread across all healthy nodes with the given strategy, other requests always go to the primary node,
+    which is the first node in the list. Nodes that failed reads are ejected from reads and probed in the background
+    until they respond again.
+
+    To use:
+        .. code-block:: python
+
+            balancer = RemmeNodeBalancer(
+                nodes=[RemmeNode(address, f'http://{address}') for address in addresses],
+                strategy=RemmeBalancingStrategy.EWMA_LATENCY,
+            )
+
+            node = balancer.choose(is_read=True)
+    """
+
+    def __init__(self, nodes, strategy=RemmeBalancingStrategy.ROUND_ROBIN, probe_interval=DEFAULT_PROBE_INTERVAL,
+                 ewma_decay=DEFAULT_EWMA_DECAY):
+        """
+        Args:
+            nodes (list): list of RemmeNode, the first one is primary
+            strategy (RemmeBalancingStrategy): strategy of spreading reads
+            probe_interval (integer): seconds between attempts to bring ejected nodes back
+            ewma_decay (float): weight of the latest latency in exponentially weighted moving average
+        """
+        self._nodes = nodes
+        self._strategy = RemmeBalancingStrategy(strategy)
+        self._probe_interval = probe_interval
+        self._ewma_decay = ewma_decay
+
+        self._counter = itertools.count()
+        self._prober = None
+
+    @property
+    def nodes(self):
+        """
+        Return list of nodes.
+        """
+        return self._nodes
+
+    @property
+    def strategy(self):
+        """
+        Return strategy of spreading reads.
+        """
+        return self._strategy
+
+    def _get_healthy_nodes(self, exclude):
+
+        nodes = [node for node in self._nodes if node not in exclude]
+        healthy_nodes = [node for node in nodes if not node.is_ejected]
+
+        return healthy_nodes or nodes
+
+    def choose(self, is_read, exclude=()):
+        """
+        Choose node for request.
+
+        Args:
+            is_read (boolean): whether request can be answered by any node
+            exclude (list, optional): nodes that should not be chosen, e.g. already failed for this request
+
+        Returns:
+            RemmeNode or ``None`` if all nodes are excluded.
+        """
+        if not is_read:
+            primary_node = self._nodes[0]
+            return primary_node if primary_node not in exclude else None
+
+        nodes = self._get_healthy_nodes(exclude=exclude)
+
+        if not nodes:
+            return None
+
+        if len(nodes) == 1:
+            return nodes[0]
+
+        turn = next(self._counter)
+
+        if self._strategy == RemmeBalancingStrategy.ROUND_ROBIN:
+            return nodes[turn % len(nodes)]
+
+        nodes = nodes[turn % len(nodes):] + nodes[:turn % len(nodes)]
+
+        if self._strategy == RemmeBalancingStrategy.LEAST_OUTSTANDING:
+            return min(nodes, key=lambda node: node.outstanding)
+
+        return min(nodes, key=lambda node: node.latency * (node.outstanding + 1))
+
+    async def send(self, node, call, is_read=True):
+        """
+        Run call on a connection to the node and record its outcome for balancing.
+
+        Args:
+            node (RemmeNode): node to send request to
+            call (callable): coroutine function that takes connection and sends request over it
+            is_read (boolean, optional): whether request can be answered by any node, only failed reads eject node
+
+        Returns:
+            Result of the call.
+        """
+        node.outstanding += 1
+        started_at = time.monotonic()
+
+        try:
+            connection, is_disposable = await node.get_connection()
+
+            try:
+                result = await call(connection)
+            finally:
+                if is_disposable:
+                    await connection.close()
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as error:
+            if not self.is_node_error(error=error):
+                self._record_latency(node=node, latency=time.monotonic() - started_at)
+                raise
+
+            if is_read:
+                self.eject(node=node)
+
+            raise
+
+        finally:
+            node.outstanding -= 1
+
+        self._record_latency(node=node, latency=time.monotonic() - started_at)
+
+        return result
+
+    @staticmethod
+    def is_node_error(error):
+        """
+        Check whether error means the node is unavailable, rather than it rejected the request.
+
+        Args:
+            error (Exception): error of request
+
+        Returns:
+            Boolean.
+        """
+        return not isinstance(error, RpcError)
+
+    def _record_latency(self, node, latency):
+
+        if not node.latency:
+            node.latency = latency
+
+        else:
+            node.latency = self._ewma_decay * latency + (1 - self._ewma_decay) * node.latency
+
+    def eject(self, node):
+        """
+        Stop sending requests to the node until it responds to background probe.
+
+        Args:
+            node (RemmeNode): failed node
+        """
+        if node.is_ejected or len(self._nodes) == 1:
+            return
+
+        node.is_ejected = True
+
+        if self._prober is None or self._prober.done():
+            self._prober = asyncio.ensure_future(self._probe())
+
+    async def _is_available(self, node):
+
+        connection = RemmeConnection(url=node.url)
+
+        try:
+            await connection.connect()
+            await connection.call(method=RemmeMethods.NETWORK_STATUS)
+
+        except Exception:
+            return False
+
+        finally:
+            await connection.close()
+
+        return True
+
+    async def _probe(self):
+
+        while any(node.is_ejected for node in self._nodes):
+            await asyncio.sleep(self._probe_interval)
+
+            for node in [node for node in self._nodes if node.is_ejected]:
+                if await self._is_available(node=node):
+                    node.latency = 0
+                    node.is_ejected = False
+
+    async def close(self):
+        """
+        Stop probing ejected nodes and close pools of connections.
+        """
+        if self._prober is not None:
+            self._prober.cancel()
+
+        for node in self._nodes:
+            if node.connection_pool is not None:
+                await node.connection_pool.close()
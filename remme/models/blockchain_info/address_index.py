@@ -0,0 +1,171 @@
+"""
+Index of transactions by addresses they touch.
+"""
+import base64
+import json
+import re
+
+from remme import protobuf
+from remme.models.general.patterns import RemmePatterns
+from remme.models.utils.family_name import RemmeFamilyName
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS address_transactions (
+    address TEXT NOT NULL,
+    block_num INTEGER NOT NULL,
+    transaction_id TEXT NOT NULL,
+    PRIMARY KEY (address, block_num, transaction_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS address_transactions_block_num ON address_transactions (block_num);
+"""
+
+# Payload fields with addresses, that could be missed in inputs and outputs of transaction header
+# (e.g. address of another chain in atomic swap), by family name and method.
+PAYLOAD_ADDRESS_FIELDS = {
+    (RemmeFamilyName.ACCOUNT.value, protobuf.AccountMethod.TRANSFER): (
+        protobuf.TransferPayload, ('address_to',),
+    ),
+    (RemmeFamilyName.SWAP.value, protobuf.AtomicSwapMethod.INIT): (
+        protobuf.AtomicSwapInitPayload, ('receiver_address', 'sender_address_non_local'),
+    ),
+    (RemmeFamilyName.PUBLIC_KEY.value, protobuf.PubKeyMethod.REVOKE): (
+        protobuf.RevokePubKeyPayload, ('address',),
+    ),
+}
+
+
+def get_payload_addresses(family_name, payload):
+    """
+    Get addresses from transaction payload.
+
+    Args:
+        family_name (string): family name of transaction
+        payload (bytes): transaction payload
+
+    Returns:
+        Set of addresses, empty if payload could not be decoded.
+    """
+    try:
+        transaction_payload = protobuf.TransactionPayload.FromString(payload)
+    except Exception:
+        return set()
+
+    message_type, fields = PAYLOAD_ADDRESS_FIELDS.get((family_name, transaction_payload.method), (None, ()))
+
+    if message_type is None:
+        return set()
+
+    try:
+        message = message_type.FromString(transaction_payload.data)
+    except Exception:
+        return set()
+
+    return {getattr(message, field) for field in fields if getattr(message, field)}
+
+
+def get_transaction_addresses(transaction):
+    """
+    Get addresses transaction touches: full addresses of its inputs and outputs and addresses from its payload.
+
+    Args:
+        transaction (dict): transaction
+
+    Returns:
+        Set of addresses.
+    """
+    header = transaction.get('header') or {}
+
+    addresses = {
+        address for address in (header.get('inputs') or []) + (header.get('outputs') or [])
+        if re.match(RemmePatterns.ADDRESS.value, address)
+    }
+
+    if transaction.get('payload'):
+        addresses |= get_payload_addresses(
+            family_name=header.get('family_name'), payload=base64.b64decode(transaction.get('payload')),
+        )
+
+    return addresses
+
+
+class RemmeAddressIndex:
+    """
+    Inverted index from address to identifiers of transactions touching it, kept in the block store database
+    and updated while the store syncs.
+
+    To use:
+        .. code-block:: python
+
+            block_store = RemmeBlockStore(remme.blockchain_info, path='chain.sqlite3')
+            address_index = RemmeAddressIndex(block_store)
+
+            await block_store.sync()
+
+            transaction_ids = address_index.transactions_for_address(address, since=1000)
+    """
+
+    def __init__(self, block_store):
+        """
+        Index transactions already in the store and register the index to be updated on sync.
+
+        Args:
+            block_store (RemmeBlockStore): block store
+        """
+        self._connection = block_store.connection
+        self._connection.executescript(SCHEMA)
+
+        block_store.add_index(index=self)
+
+        self.rebuild()
+
+    def index_transaction(self, transaction, block_num):
+        """
+        Add transaction to the index.
+
+        Args:
+            transaction (dict): transaction
+            block_num (integer): number of block with transaction
+        """
+        self._connection.executemany('INSERT OR IGNORE INTO address_transactions VALUES (?, ?, ?)', [
+            (address, block_num, transaction.get('header_signature'))
+            for address in get_transaction_addresses(transaction=transaction)
+        ])
+
+    def remove_from(self, block_num):
+        """
+        Remove transactions of blocks starting from the block number.
+
+        Args:
+            block_num (integer): block number
+        """
+        self._connection.execute('DELETE FROM address_transactions WHERE block_num >= ?', (block_num,))
+
+    def rebuild(self):
+        """
+        Index all transactions of the store from scratch.
+        """
+        with self._connection:
+            self._connection.execute('DELETE FROM address_transactions')
+
+            for block_num, data in self._connection.execute('SELECT block_num, data FROM transactions').fetchall():
+                self.index_transaction(transaction=json.loads(data), block_num=block_num)
+
+    def transactions_for_address(self, address, since=None, limit=None):
+        """
+        Get identifiers of transactions touching address, from the oldest to the newest.
+
+        Args:
+            address (string): address
+            since (integer, optional): number of the first block to search transactions in
+            limit (integer, optional): maximum number of transactions
+
+        Returns:
+            List of transaction identifiers.
+        """
+        rows = self._connection.execute(
+            'SELECT transaction_id FROM address_transactions WHERE address = ? AND block_num >= ? '
+            'ORDER BY block_num, transaction_id LIMIT ?',
+            (address, since or 0, -1 if limit is None else limit),
+        ).fetchall()
+
+        return [transaction_id for transaction_id, in rows]
@@ -0,0 +1,357 @@
+"""
+Local on-disk store of blockchain data.
+"""
+import json
+import sqlite3
+
+DEFAULT_SYNC_CONCURRENCY = 4
+DEFAULT_RECEIPTS_CHUNK_SIZE = 100
+MAX_SYNC_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    header_signature TEXT PRIMARY KEY,
+    block_num INTEGER NOT NULL UNIQUE,
+    previous_block_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS batches (
+    header_signature TEXT PRIMARY KEY,
+    block_num INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    header_signature TEXT PRIMARY KEY,
+    batch_id TEXT NOT NULL,
+    block_num INTEGER NOT NULL,
+    family_name TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS receipts (
+    transaction_id TEXT PRIMARY KEY,
+    block_num INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS batches_block_num ON batches (block_num);
+CREATE INDEX IF NOT EXISTS transactions_block_num ON transactions (block_num);
+CREATE INDEX IF NOT EXISTS receipts_block_num ON receipts (block_num);
+"""
+
+
+class RemmeBlockStore:
+    """
+    SQLite database (in WAL mode) with blocks, batches, transactions and their receipts, keyed by header signature.
+
+    ``sync`` fetches only blocks committed after the last stored one. If the chain was reorganized,
+    stored blocks of the abandoned branch are found by comparing header signatures with the node
+    and by checking ``previous_block_id`` of new blocks, then replaced by blocks of the current branch.
+
+    To use:
+        .. code-block:: python
+
+            block_store = RemmeBlockStore(remme.blockchain_info, path='chain.sqlite3')
+
+            await block_store.sync()
+
+            transaction = block_store.get_transaction(transaction_id)
+            print(block_store.head_block_num)
+
+            block_store.close()
+    """
+
+    def __init__(self, remme_blockchain_info, path=':memory:', with_receipts=True,
+                 concurrency=DEFAULT_SYNC_CONCURRENCY):
+        """
+        Args:
+            remme_blockchain_info: RemmeBlockchainInfo
+            path (string, optional): path to database file, in memory by default
+            with_receipts (boolean, optional): whether to store receipts of transactions
+            concurrency (integer, optional): maximum number of segments of blocks fetched at the same time
+        """
+        self._remme_blockchain_info = remme_blockchain_info
+        self._with_receipts = with_receipts
+        self._concurrency = concurrency
+
+        self._connection = sqlite3.connect(path)
+
+        if path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+
+        self._connection.executescript(SCHEMA)
+
+        self._indexes = []
+
+    @property
+    def connection(self):
+        """
+        Return database connection for custom queries.
+        """
+        return self._connection
+
+    @property
+    def head_block_num(self):
+        """
+        Return number of the last stored block, ``None`` if store is empty.
+        """
+        return self._connection.execute('SELECT MAX(block_num) FROM blocks').fetchone()[0]
+
+    def add_index(self, index):
+        """
+        Register index, that is updated with transactions of stored blocks and cleaned on chain reorganization.
+
+        Args:
+            index: object with ``index_transaction(transaction, block_num)`` and ``remove_from(block_num)`` methods
+        """
+        self._indexes.append(index)
+
+    def _get_data(self, query, parameters):
+
+        row = self._connection.execute(query, parameters).fetchone()
+
+        return json.loads(row[0]) if row is not None else None
+
+    def get_block(self, block_id):
+        """
+        Get stored block by id (header_signature).
+
+        Args:
+            block_id (string): block id
+
+        Returns:
+            Block or ``None`` if it is not stored.
+        """
+        return self._get_data('SELECT data FROM blocks WHERE header_signature = ?', (block_id,))
+
+    def get_block_by_num(self, block_num):
+        """
+        Get stored block by number.
+
+        Args:
+            block_num (integer): block number
+
+        Returns:
+            Block or ``None`` if it is not stored.
+        """
+        return self._get_data('SELECT data FROM blocks WHERE block_num = ?', (block_num,))
+
+    def get_batch(self, batch_id):
+        """
+        Get stored batch by id (header_signature).
+
+        Args:
+            batch_id (string): batch id
+
+        Returns:
+            Batch or ``None`` if it is not stored.
+        """
+        return self._get_data('SELECT data FROM batches WHERE header_signature = ?', (batch_id,))
+
+    def get_transaction(self, transaction_id):
+        """
+        Get stored transaction by id (header_signature).
+
+        Args:
+            transaction_id (string): transaction id
+
+        Returns:
+            Transaction or ``None`` if it is not stored.
+        """
+        return self._get_data('SELECT data FROM transactions WHERE header_signature = ?', (transaction_id,))
+
+    def get_receipt(self, transaction_id):
+        """
+        Get stored receipt of transaction.
+
+        Args:
+            transaction_id (string): transaction id
+
+        Returns:
+            Receipt or ``None`` if it is not stored.
+        """
+        return self._get_data('SELECT data FROM receipts WHERE transaction_id = ?', (transaction_id,))
+
+    def _get_stored_block_id(self, block_num):
+
+        row = self._connection.execute('SELECT header_signature FROM blocks WHERE block_num = ?', (block_num,)) \
+            .fetchone()
+
+        return row[0] if row is not None else None
+
+    async def _get_node_block_id(self, block_num):
+
+        page = await self._remme_blockchain_info.get_blocks(query={'start': block_num, 'limit': 1}) or {}
+        blocks = page.get('data') or []
+
+        if not blocks or int(blocks[0].get('header').get('block_num')) != block_num:
+            return None
+
+        return blocks[0].get('header_signature')
+
+    async def _find_fork_block_num(self):
+        """
+        Find number of the first stored block, that is not in the current chain of the node.
+
+        Returns:
+            Block number or ``None`` if stored blocks are in the current chain.
+        """
+        block_num = self.head_block_num
+        fork_block_num = None
+
+        while block_num is not None and block_num >= 0:
+            if await self._get_node_block_id(block_num=block_num) == self._get_stored_block_id(block_num=block_num):
+                break
+
+            fork_block_num = block_num
+            block_num -= 1
+
+        return fork_block_num
+
+    def _remove_from(self, block_num):
+
+        with self._connection:
+            for table in ('blocks', 'batches', 'transactions', 'receipts'):
+                self._connection.execute(f'DELETE FROM {table} WHERE block_num >= ?', (block_num,))
+
+            for index in self._indexes:
+                index.remove_from(block_num=block_num)
+
+    async def _get_receipts(self, transaction_ids):
+
+        receipts = []
+
+        for index in range(0, len(transaction_ids), DEFAULT_RECEIPTS_CHUNK_SIZE):
+            receipts.extend(await self._remme_blockchain_info.get_receipts(
+                ids=transaction_ids[index:index + DEFAULT_RECEIPTS_CHUNK_SIZE],
+            ) or [])
+
+        return receipts
+
+    def _store_block(self, block):
+
+        block_num = int(block.get('header').get('block_num'))
+
+        self._connection.execute('INSERT OR REPLACE INTO blocks VALUES (?, ?, ?, ?)', (
+            block.get('header_signature'), block_num, block.get('header').get('previous_block_id'), json.dumps(block),
+        ))
+
+        transactions = []
+
+        for batch in block.get('batches') or []:
+            self._connection.execute('INSERT OR REPLACE INTO batches VALUES (?, ?, ?)', (
+                batch.get('header_signature'), block_num, json.dumps(batch),
+            ))
+
+            for transaction in batch.get('transactions') or []:
+                self._connection.execute('INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?)', (
+                    transaction.get('header_signature'),
+                    batch.get('header_signature'),
+                    block_num,
+                    transaction.get('header').get('family_name'),
+                    json.dumps(transaction),
+                ))
+
+                for index in self._indexes:
+                    index.index_transaction(transaction=transaction, block_num=block_num)
+
+                transactions.append((transaction.get('header_signature'), block_num))
+
+        return transactions
+
+    async def _store_blocks(self, blocks):
+        """
+        Store blocks together with receipts of their transactions in one database transaction,
+        so blocks are not stored without receipts, if receipts could not be fetched.
+        """
+        receipts = []
+
+        if self._with_receipts:
+            receipts = await self._get_receipts(transaction_ids=[
+                transaction.get('header_signature')
+                for block in blocks
+                for batch in block.get('batches') or []
+                for transaction in batch.get('transactions') or []
+            ])
+
+        with self._connection:
+            block_nums = {}
+
+            for block in blocks:
+                block_nums.update(self._store_block(block=block))
+
+            self._connection.executemany('INSERT OR REPLACE INTO receipts VALUES (?, ?, ?)', [
+                (
+                    receipt.get('transaction_id'),
+                    block_nums.get(receipt.get('transaction_id')),
+                    json.dumps(receipt),
+                ) for receipt in receipts
+            ])
+
+    async def _sync_new_blocks(self):
+        """
+        Store blocks after the last stored one.
+
+        Returns:
+            Tuple of number of stored blocks and boolean flag whether new blocks do not continue stored ones.
+        """
+        head_block_num = self.head_block_num
+
+        previous_block_id = self._get_stored_block_id(block_num=head_block_num)
+        start_block = 0 if head_block_num is None else head_block_num + 1
+
+        stored_blocks_count = 0
+        blocks, transactions_count = [], 0
+        is_forked = False
+
+        async for block in self._remme_blockchain_info.export_range(
+            start_block=start_block, concurrency=self._concurrency,
+        ):
+            if previous_block_id is not None and block.get('header').get('previous_block_id') != previous_block_id:
+                is_forked = True
+                break
+
+            blocks.append(block)
+            transactions_count += sum(len(batch.get('transactions') or []) for batch in block.get('batches') or [])
+
+            previous_block_id = block.get('header_signature')
+
+            if not self._with_receipts or transactions_count >= DEFAULT_RECEIPTS_CHUNK_SIZE:
+                await self._store_blocks(blocks=blocks)
+                stored_blocks_count += len(blocks)
+                blocks, transactions_count = [], 0
+
+        if blocks:
+            await self._store_blocks(blocks=blocks)
+            stored_blocks_count += len(blocks)
+
+        return stored_blocks_count, is_forked
+
+    async def sync(self):
+        """
+        Fetch blocks committed after the last stored one, with their batches, transactions and receipts.
+        Stored blocks of abandoned branch are replaced by blocks of the current chain.
+
+        Returns:
+            Number of stored blocks.
+        """
+        stored_blocks_count = 0
+
+        for _ in range(MAX_SYNC_ATTEMPTS):
+            fork_block_num = await self._find_fork_block_num()
+
+            if fork_block_num is not None:
+                self._remove_from(block_num=fork_block_num)
+
+            count, is_forked = await self._sync_new_blocks()
+            stored_blocks_count += count
+
+            if not is_forked:
+                return stored_blocks_count
+
+        raise Exception('Chain is being reorganized, please try to sync later.')
+
+    def close(self):
+        """
+        Close database connection.
+        """
+        self._connection.close()
@@ -0,0 +1,247 @@
+"""
+Export of blocks into columnar chunks.
+"""
+from remme import protobuf
+from remme.models.blockchain_info.decoder_registry import decode_transaction_payload_envelope
+from remme.models.utils.family_name import RemmeFamilyName
+from remme.utils import generate_address
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+DEFAULT_CHUNK_SIZE = 10000
+DEFAULT_BLOCKS_INFO_PAGE_SIZE = 100
+
+COLUMNS = (
+    ('block_num', 'i8'),
+    ('timestamp', 'i8'),
+    ('transaction_id', 'U128'),
+    ('signer', 'U66'),
+    ('family_name', 'U32'),
+    ('method', 'i4'),
+    ('amount', 'u8'),
+    ('from', 'U70'),
+    ('to', 'U70'),
+)
+
+# Payload fields with amount and receiver address, by family name and method.
+PAYLOAD_TRANSFER_FIELDS = {
+    (RemmeFamilyName.ACCOUNT.value, protobuf.AccountMethod.TRANSFER): (
+        protobuf.TransferPayload, 'value', 'address_to',
+    ),
+    (RemmeFamilyName.SWAP.value, protobuf.AtomicSwapMethod.INIT): (
+        protobuf.AtomicSwapInitPayload, 'amount', 'receiver_address',
+    ),
+}
+
+
+def get_transaction_row(block_num, timestamp, transaction):
+    """
+    Get values of columns for transaction.
+
+    Args:
+        block_num (integer): number of block with transaction
+        timestamp (integer): timestamp of block
+        transaction (dict): transaction
+
+    Returns:
+        Tuple of values in order of columns.
+    """
+    header = transaction.get('header') or {}
+
+    family_name = header.get('family_name') or ''
+    signer = header.get('signer_public_key') or ''
+
+    method, amount, address_from, address_to = -1, 0, '', ''
+
+    try:
+        method, data = decode_transaction_payload_envelope(transaction=transaction)
+
+        transfer_fields = PAYLOAD_TRANSFER_FIELDS.get((family_name, method))
+
+        if transfer_fields is not None:
+            message_type, amount_field, address_to_field = transfer_fields
+            message = message_type.FromString(data)
+
+            amount, address_to = getattr(message, amount_field), getattr(message, address_to_field)
+            address_from = generate_address(RemmeFamilyName.ACCOUNT.value, signer) if signer else ''
+
+    except Exception:
+        pass
+
+    return (
+        block_num, timestamp, transaction.get('header_signature') or '', signer, family_name,
+        method, amount, address_from, address_to,
+    )
+
+
+class RemmeColumnarExporter:
+    """
+    Streaming stage, that turns blocks into columnar chunks of ``chunk_size`` transactions with columns
+    block_num, timestamp, transaction_id, signer, family_name, method, amount, from and to.
+
+    Block headers have no timestamp, so timestamps are taken from information about blocks, requested for blocks
+    of each chunk in pages of at most ``blocks_info_page_size`` blocks. Export fails if information about a block
+    is missing. Only one chunk is kept in memory.
+
+    Chunks are NumPy structured arrays if ``numpy`` is installed, or dictionaries of column lists otherwise.
+    Both are indexed by column name, e.g. ``chunk['amount']``. Chunks could be written into Parquet file
+    if ``pyarrow`` is installed.
+
+    To use:
+        .. code-block:: python
+
+            exporter = RemmeColumnarExporter(remme.blockchain_info, chunk_size=10000)
+
+            async for chunk in exporter.iter_chunks(remme.blockchain_info.export_range(0, 10000)):
+                print(sum(chunk['amount']))
+
+            await exporter.write_parquet(remme.blockchain_info.export_range(0, 10000), 'transactions.parquet')
+    """
+
+    def __init__(self, remme_blockchain_info, chunk_size=DEFAULT_CHUNK_SIZE,
+                 blocks_info_page_size=DEFAULT_BLOCKS_INFO_PAGE_SIZE):
+        """
+        Args:
+            remme_blockchain_info (RemmeBlockchainInfo): source of information about blocks
+            chunk_size (integer): number of transactions in chunk
+            blocks_info_page_size (integer): maximum number of blocks in one request of information about blocks
+        """
+        for name, value in (('Chunk size', chunk_size), ('Blocks info page size', blocks_info_page_size)):
+            if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+                raise Exception(f'{name} should be positive integer.')
+
+        self._remme_blockchain_info = remme_blockchain_info
+        self._chunk_size = chunk_size
+        self._blocks_info_page_size = blocks_info_page_size
+
+    @staticmethod
+    def _to_chunk(rows):
+
+        if numpy is not None:
+            return numpy.array(rows, dtype=list(COLUMNS))
+
+        return {name: [row[index] for row in rows] for index, (name, _) in enumerate(COLUMNS)}
+
+    async def _get_timestamps(self, blocks):
+        """
+        Get timestamps of blocks by their ids, requested in pages, that start from the first block without one.
+        """
+        blocks_ids = {
+            int(block.get('header').get('block_num')): block.get('header_signature') for block in blocks
+        }
+
+        timestamps = {}
+        missing_blocks_nums = sorted(blocks_ids)
+
+        while missing_blocks_nums:
+            start = missing_blocks_nums[0]
+
+            blocks_info = await self._remme_blockchain_info.get_blocks_info(query={
+                'start': start,
+                'limit': min(self._blocks_info_page_size, missing_blocks_nums[-1] - start + 1),
+            })
+
+            for block_info in blocks_info:
+                if block_info.timestamp is not None:
+                    timestamps[block_info.header_signature] = int(block_info.timestamp)
+
+            if blocks_ids.get(start) not in timestamps:
+                raise Exception(f'Information about block {blocks_ids.get(start)} was not found.')
+
+            missing_blocks_nums = [
+                block_num for block_num in missing_blocks_nums if blocks_ids.get(block_num) not in timestamps
+            ]
+
+        return timestamps
+
+    async def _get_rows(self, blocks):
+        """
+        Get rows of transactions of blocks, with timestamps of blocks.
+        """
+        timestamps = await self._get_timestamps(blocks=blocks)
+
+        return [
+            get_transaction_row(
+                block_num=int(block.get('header').get('block_num')),
+                timestamp=timestamps.get(block.get('header_signature')),
+                transaction=transaction,
+            )
+            for block in blocks
+            for batch in block.get('batches') or []
+            for transaction in batch.get('transactions') or []
+        ]
+
+    async def iter_chunks(self, blocks):
+        """
+        Turn blocks into columnar chunks.
+
+        Args:
+            blocks (async iterable): blocks, e.g. from ``RemmeBlockchainInfo.export_range``
+
+        Returns:
+            Asynchronous iterator of chunks.
+        """
+        rows, pending_blocks, pending_count = [], [], 0
+
+        async for block in blocks:
+            pending_blocks.append(block)
+            pending_count += sum(len(batch.get('transactions') or []) for batch in block.get('batches') or [])
+
+            if len(rows) + pending_count < self._chunk_size:
+                continue
+
+            rows.extend(await self._get_rows(blocks=pending_blocks))
+            pending_blocks, pending_count = [], 0
+
+            while len(rows) >= self._chunk_size:
+                yield self._to_chunk(rows=rows[:self._chunk_size])
+                rows = rows[self._chunk_size:]
+
+        if pending_blocks:
+            rows.extend(await self._get_rows(blocks=pending_blocks))
+
+        for index in range(0, len(rows), self._chunk_size):
+            yield self._to_chunk(rows=rows[index:index + self._chunk_size])
+
+    async def write_parquet(self, blocks, path):
+        """
+        Write transactions of blocks into Parquet file chunk by chunk. Requires ``pyarrow``.
+
+        Args:
+            blocks (async iterable): blocks, e.g. from ``RemmeBlockchainInfo.export_range``
+            path (string): path to Parquet file
+
+        Returns:
+            Number of written transactions.
+        """
+        if pyarrow is None:
+            raise Exception('Please install `pyarrow` to write Parquet files.')
+
+        schema = pyarrow.schema([
+            (name, pyarrow.string() if type_.startswith('U') else pyarrow.from_numpy_dtype(type_))
+            for name, type_ in COLUMNS
+        ])
+
+        written_count = 0
+        writer = pyarrow.parquet.ParquetWriter(path, schema)
+
+        try:
+            async for chunk in self.iter_chunks(blocks=blocks):
+                columns = {name: list(chunk[name]) for name, _ in COLUMNS}
+
+                writer.write_table(pyarrow.Table.from_pydict(columns, schema=schema))
+                written_count += len(columns.get('block_num'))
+
+        finally:
+            writer.close()
+
+        return written_count
@@ -0,0 +1,365 @@
+"""
+Registry of protobuf decoders for state data and transaction payloads.
+"""
+import base64
+import threading
+
+from remme import protobuf
+from remme.models.utils import (
+    RemmeFamilyName,
+    RemmeNamespace,
+)
+
+
+class RemmeDecoderRegistry:
+    """
+    Map address namespaces and transaction family methods to protobuf message types.
+
+    Registry keeps message types, not message instances, so each decoding creates a new message.
+    Results do not share state and could be decoded from several coroutines, threads or processes at the same time.
+    Registry could be pickled, so it is passed to worker processes together with data to decode.
+
+    To use:
+        .. code-block:: python
+
+            registry = RemmeDecoderRegistry()
+            registry.register_payload(
+                family_name='account', method=protobuf.AccountMethod.TRANSFER,
+                type_='transfer token', message_type=protobuf.TransferPayload,
+            )
+
+            parsed_transaction = registry.decode_transaction_payload(transaction)
+            print(parsed_transaction.get('type'), parsed_transaction.get('payload'))
+    """
+
+    def __init__(self):
+        self._states = {}
+        self._payloads = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {'states': self._states, 'payloads': self._payloads}
+
+    def __setstate__(self, state):
+        self._states = state.get('states')
+        self._payloads = state.get('payloads')
+        self._lock = threading.Lock()
+
+    def register_state(self, namespace, type_, message_type):
+        """
+        Register decoder of state data for address namespace.
+
+        Args:
+            namespace (string): first 6 characters of address
+            type_ (string): human readable type of state
+            message_type (class): protobuf message type
+        """
+        with self._lock:
+            self._states = {**self._states, namespace: (type_, message_type)}
+
+    def register_payload(self, family_name, method, type_, message_type):
+        """
+        Register decoder of transaction payload for family method.
+
+        Args:
+            family_name (string): transaction family name
+            method (integer): method of family
+            type_ (string): human readable type of transaction
+            message_type (class): protobuf message type
+        """
+        with self._lock:
+            methods = {**self._payloads.get(family_name, {}), method: (type_, message_type)}
+            self._payloads = {**self._payloads, family_name: methods}
+
+    def is_state_supported(self, address):
+        """
+        Check whether state data of address could be decoded.
+        """
+        return address[0:6] in self._states
+
+    def is_family_supported(self, family_name):
+        """
+        Check whether payloads of family transactions could be decoded.
+        """
+        return family_name in self._payloads
+
+    def decode_state(self, state):
+        """
+        Decode state data.
+
+        Args:
+            state (dict): state with address and data in base64
+
+        Returns:
+            Dictionary with decoded data and type.
+        """
+        address = state.get('address')
+
+        if address is None:
+            raise Exception('State should have address for parsing.')
+
+        return self.decode_state_data(address=address, data=base64.b64decode(state.get('data')))
+
+    def decode_state_data(self, address, data):
+        """
+        Decode state data of address.
+
+        Args:
+            address (string): state address
+            data (bytes): serialized state data
+
+        Returns:
+            Dictionary with decoded data and type.
+        """
+        if not self.is_state_supported(address=address):
+            raise Exception(f'This address {address} don\'t supported for parsing.')
+
+        type_, message_type = self._states.get(address[0:6])
+
+        return {
+            'data': message_type.FromString(data),
+            'type': type_,
+        }
+
+    def decode_transaction_payload(self, transaction):
+        """
+        Decode transaction payload.
+
+        Args:
+            transaction (dict): transaction with header and payload in base64
+
+        Returns:
+            Dictionary with decoded payload and type.
+        """
+        family_name = transaction.get('header').get('family_name')
+
+        if not self.is_family_supported(family_name=family_name):
+            raise Exception(f'Family name {family_name} don\'t supported for parsing.')
+
+        method, data = decode_transaction_payload_envelope(transaction=transaction)
+
+        return self.decode_payload(family_name=family_name, method=method, data=data)
+
+    def decode_payload(self, family_name, method, data):
+        """
+        Decode data of transaction payload for family method.
+
+        Args:
+            family_name (string): transaction family name
+            method (integer): method of family
+            data (bytes): serialized payload data
+
+        Returns:
+            Dictionary with decoded payload and type.
+        """
+        if not self.is_family_supported(family_name=family_name):
+            raise Exception(f'Family name {family_name} don\'t supported for parsing.')
+
+        decoder = self._payloads.get(family_name).get(method)
+
+        if decoder is None:
+            raise Exception(f'Method {method} of family {family_name} don\'t supported for parsing.')
+
+        type_, message_type = decoder
+
+        return {
+            'payload': message_type.FromString(data),
+            'type': type_,
+        }
+
+
+def decode_transaction_payload_envelope(transaction):
+    """
+    Decode transaction payload envelope, without decoding its data.
+
+    Args:
+        transaction (dict): transaction with payload in base64
+
+    Returns:
+        Tuple of method and serialized payload data.
+    """
+    transaction_payload = protobuf.TransactionPayload.FromString(base64.b64decode(transaction.get('payload')))
+
+    return transaction_payload.method, transaction_payload.data
+
+
+def create_default_decoder_registry():
+    """
+    Create registry with decoders of all REMChain states and transaction families.
+
+    Returns:
+        RemmeDecoderRegistry.
+    """
+    registry = RemmeDecoderRegistry()
+
+    for namespace, type_, message_type in (
+        (RemmeNamespace.SWAP.value, 'info atomic swap', protobuf.AtomicSwapInfo),
+        (RemmeNamespace.ACCOUNT.value, 'account', protobuf.Account),
+        (RemmeNamespace.NODE_ACCOUNT.value, 'node account', protobuf.NodeAccount),
+        (RemmeNamespace.PUBLIC_KEY.value, 'storage public key', protobuf.PubKeyStorage),
+    ):
+        registry.register_state(namespace=namespace, type_=type_, message_type=message_type)
+
+    for family_name, method, type_, message_type in (
+        (RemmeFamilyName.ACCOUNT.value, protobuf.AccountMethod.TRANSFER, 'transfer token', protobuf.TransferPayload),
+        (RemmeFamilyName.ACCOUNT.value, protobuf.AccountMethod.GENESIS, 'genesis', protobuf.GenesisPayload),
+        (
+            RemmeFamilyName.NODE_ACCOUNT.value, protobuf.NodeAccountMethod.INITIALIZE_MASTERNODE,
+            'initialize masternode', protobuf.NodeAccountInternalTransferPayload,
+        ),
+        (
+            RemmeFamilyName.NODE_ACCOUNT.value, protobuf.NodeAccountMethod.INITIALIZE_NODE,
+            'initialize node', protobuf.EmptyPayload,
+        ),
+        (
+            RemmeFamilyName.NODE_ACCOUNT.value, protobuf.NodeAccountMethod.CLOSE_MASTERNODE,
+            'close masternode', protobuf.EmptyPayload,
+        ),
+        (
+            RemmeFamilyName.NODE_ACCOUNT.value, protobuf.NodeAccountMethod.SET_BET,
+            'set bet', protobuf.SetBetPayload,
+        ),
+        (
+            RemmeFamilyName.NODE_ACCOUNT.value, protobuf.NodeAccountMethod.TRANSFER_FROM_FROZEN_TO_UNFROZEN,
+            'transfer from frozen to unfrozen', protobuf.EmptyPayload,
+        ),
+        (
+            RemmeFamilyName.NODE_ACCOUNT.value, protobuf.NodeAccountMethod.TRANSFER_FROM_UNFROZEN_TO_OPERATIONAL,
+            'transfer from unfrozen to operational', protobuf.NodeAccountInternalTransferPayload,
+        ),
+        (
+            RemmeFamilyName.SWAP.value, protobuf.AtomicSwapMethod.INIT,
+            'atomic-swap-init', protobuf.AtomicSwapInitPayload,
+        ),
+        (
+            RemmeFamilyName.SWAP.value, protobuf.AtomicSwapMethod.APPROVE,
+            'atomic-swap-approve', protobuf.AtomicSwapApprovePayload,
+        ),
+        (
+            RemmeFamilyName.SWAP.value, protobuf.AtomicSwapMethod.EXPIRE,
+            'atomic-swap-expire', protobuf.AtomicSwapExpirePayload,
+        ),
+        (
+            RemmeFamilyName.SWAP.value, protobuf.AtomicSwapMethod.SET_SECRET_LOCK,
+            'atomic-swap-set-secret-lock', protobuf.AtomicSwapSetSecretLockPayload,
+        ),
+        (
+            RemmeFamilyName.SWAP.value, protobuf.AtomicSwapMethod.CLOSE,
+            'atomic-swap-close', protobuf.AtomicSwapClosePayload,
+        ),
+        (
+            RemmeFamilyName.PUBLIC_KEY.value, protobuf.PubKeyMethod.STORE,
+            'store public key', protobuf.NewPubKeyPayload,
+        ),
+        (
+            RemmeFamilyName.PUBLIC_KEY.value, protobuf.PubKeyMethod.REVOKE,
+            'revoke public key', protobuf.RevokePubKeyPayload,
+        ),
+    ):
+        registry.register_payload(family_name=family_name, method=method, type_=type_, message_type=message_type)
+
+    return registry
+
+
+DEFAULT_DECODER_REGISTRY = create_default_decoder_registry()
+
+
+def message_to_dict(message):
+    """
+    Convert protobuf message to dictionary of all its fields, nested messages are converted too.
+
+    Args:
+        message: protobuf message
+
+    Returns:
+        Dictionary, that could be pickled.
+    """
+    result = {}
+
+    for field in message.DESCRIPTOR.fields:
+        value = getattr(message, field.name)
+
+        if field.message_type is not None and field.message_type.GetOptions().map_entry:
+            value_field = field.message_type.fields_by_name.get('value')
+            result[field.name] = {
+                key: message_to_dict(item) if value_field.message_type is not None else item
+                for key, item in value.items()
+            }
+
+        elif field.label == field.LABEL_REPEATED:
+            result[field.name] = [
+                message_to_dict(item) if field.message_type is not None else item for item in value
+            ]
+
+        elif field.message_type is not None:
+            result[field.name] = message_to_dict(value) if message.HasField(field.name) else None
+
+        else:
+            result[field.name] = value
+
+    return result
+
+
+def decode_states(registry, states):
+    """
+    Decode states into dictionaries.
+
+    Module-level function, so it could be run in worker processes. Decoded messages are converted to dictionaries,
+    because passing messages back to the event loop process would parse them there again.
+
+    Args:
+        registry (RemmeDecoderRegistry): registry of decoders
+        states (list): list of states with address and data in base64
+
+    Returns:
+        List of dictionaries with address, decoded data as dictionary and type, or exceptions of failed decodings,
+        in the same order as states.
+    """
+    results = []
+
+    for state in states:
+        try:
+            decoded_state = registry.decode_state(state=state)
+
+            results.append({
+                'address': state.get('address'),
+                'data': message_to_dict(decoded_state.get('data')),
+                'type': decoded_state.get('type'),
+            })
+
+        except Exception as error:
+            results.append(error)
+
+    return results
+
+
+def decode_transaction_payloads(registry, transactions):
+    """
+    Decode payloads of transactions into dictionaries.
+
+    Module-level function, so it could be run in worker processes. Decoded messages are converted to dictionaries,
+    because passing messages back to the event loop process would parse them there again.
+
+    Args:
+        registry (RemmeDecoderRegistry): registry of decoders
+        transactions (list): list of transactions with header and payload in base64
+
+    Returns:
+        List of dictionaries with decoded payload as dictionary and type, or exceptions of failed decodings,
+        in the same order as transactions.
+    """
+    results = []
+
+    for transaction in transactions:
+        try:
+            decoded_transaction = registry.decode_transaction_payload(transaction=transaction)
+
+            results.append({
+                'payload': message_to_dict(decoded_transaction.get('payload')),
+                'type': decoded_transaction.get('type'),
+            })
+
+        except Exception as error:
+            results.append(error)
+
+    return results
@@ -148,7 +148,7 @@ class StateQuery(BaseQuery):
         if self.address is not None:
 
             if not isinstance(self.address, str) \
-                    or re.match(RemmePatterns.ADDRESS.value, self.address) is None:
+                    or re.match(RemmePatterns.ADDRESS_PREFIX.value, self.address) is None:
                 raise Exception('Parameter `address` need to a valid.')
 
         if self.start is not None:
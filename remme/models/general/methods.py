@@ -29,3 +29,26 @@ class RemmeMethods(Enum):
     PEERS = 'fetch_peers'
     RECEIPTS = 'list_receipts'
     NODE_ACCOUNT = 'get_node_account'
+
+
+# Methods that read committed chain data, so any node of the network answers them the same way.
+# Other methods either change state or return information about a particular node (its keys, config, peers,
+# status of batches it received), so they are always sent to the primary node.
+READ_METHODS = frozenset([
+    RemmeMethods.PUBLIC_KEY,
+    RemmeMethods.TOKEN,
+    RemmeMethods.ATOMIC_SWAP,
+    RemmeMethods.ATOMIC_SWAP_PUBLIC_KEY,
+    RemmeMethods.USER_PUBLIC_KEY,
+    RemmeMethods.BLOCK_INFO,
+    RemmeMethods.BLOCKS,
+    RemmeMethods.FETCH_BLOCK,
+    RemmeMethods.BATCHES,
+    RemmeMethods.FETCH_BATCH,
+    RemmeMethods.TRANSACTIONS,
+    RemmeMethods.FETCH_TRANSACTION,
+    RemmeMethods.STATE,
+    RemmeMethods.FETCH_STATE,
+    RemmeMethods.RECEIPTS,
+    RemmeMethods.NODE_ACCOUNT,
+])
@@ -9,6 +9,7 @@ class RemmePatterns(Enum):
     PRIVATE_KEY = r"^[a-f0-9]{64}$"
     PUBLIC_KEY = r"^[a-f0-9]{66}$"
     ADDRESS = r"^[a-f0-9]{70}$"
+    ADDRESS_PREFIX = r"^([a-f0-9]{2}){1,35}$"
     SWAP_ID = r"^[a-f0-9]{64}$"
     HEADER_SIGNATURE = r"^[a-f0-9]{128}$"
     BLOCK_NUMBER = r"^0x[a-f0-9]{16}$"
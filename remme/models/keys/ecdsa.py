@@ -1,9 +1,6 @@
-import binascii
-
 import secp256k1
 from sawtooth_signing.secp256k1 import (
     __CTX__,
-    Secp256k1Context,
     Secp256k1PrivateKey,
     Secp256k1PublicKey,
 )
@@ -22,6 +19,9 @@ class ECDSA(KeyDto, IRemmeKeys):
     """
     ``ECDSA (secp256k1)`` class implementation.
 
+    All keys share one secp256k1 context, created once with precomputed tables for signing and verification.
+    The context is only read while signing and verifying, so keys could be used from several threads.
+
     References::
         - https://github.com/hyperledger/sawtooth-core/
     """
@@ -109,14 +109,27 @@ class ECDSA(KeyDto, IRemmeKeys):
         Returns:
             Hex string of signature.
         """
+        if isinstance(data, str):
+            data = utf8_to_bytes(data)
+
+        return self.sign_bytes(data=data).hex()
+
+    def sign_bytes(self, data):
+        """
+        Sign provided bytes, without conversions of data and signature.
+
+        Args:
+            data (bytes): data which will be signed
+
+        Returns:
+            Compact signature in bytes.
+        """
         if self._private_key is None:
             raise Exception('Private key is not provided!')
 
-        if isinstance(data, str):
-            data = utf8_to_bytes(data)
+        private_key = self._private_key_obj.secp256k1_private_key
 
-        sig = Secp256k1Context().sign(message=data, private_key=self._private_key_obj)
-        return sig
+        return private_key.ecdsa_serialize_compact(private_key.ecdsa_sign(data))
 
     def verify(self, data, signature, rsa_signature_padding=None):
         """
@@ -133,11 +146,29 @@ class ECDSA(KeyDto, IRemmeKeys):
         if isinstance(data, str):
             data = utf8_to_bytes(data)
 
-        try:
-            if isinstance(signature, bytes):
-                signature = binascii.hexlify(signature).decode('utf-8')
+        if isinstance(signature, str):
+            try:
+                signature = bytes.fromhex(signature)
+            except ValueError:
+                return False
+
+        return self.verify_bytes(data=data, signature=signature)
+
+    def verify_bytes(self, data, signature):
+        """
+        Verify compact signature of provided bytes, without conversions of data and signature.
+
+        Args:
+            data (bytes): data which will be verified
+            signature (bytes): compact signature in bytes
+
+        Returns:
+            Boolean ``True`` if signature is correct, or ``False`` if invalid.
+        """
+        public_key = self._public_key_obj.secp256k1_public_key
 
-            return Secp256k1Context().verify(signature, data, self._public_key_obj)
+        try:
+            return public_key.ecdsa_verify(data, public_key.ecdsa_deserialize_compact(signature))
 
         except Exception:
             return False
@@ -0,0 +1,219 @@
+"""
+Pool of pre-generated key pairs.
+"""
+import asyncio
+import collections
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from remme.models.keys.ecdsa import ECDSA
+from remme.models.keys.eddsa import EdDSA
+from remme.models.keys.key_type import KeyType
+from remme.models.keys.rsa import RSA
+
+DEFAULT_KEY_POOL_LOW_WATERMARK = 4
+DEFAULT_KEY_POOL_HIGH_WATERMARK = 16
+
+
+def generate_key_pair(key_type, options=None):
+    """
+    Generate key pair of the type.
+
+    Module-level function, so it could be run in worker processes.
+
+    Args:
+        key_type (KeyType): enum (RSA, ECDSA, EdDSA)
+        options (integer, optional): RSA key size
+
+    Returns:
+        Generated key pair in bytes.
+    """
+    if key_type == KeyType.RSA:
+        return RSA.generate_key_pair(options=options)
+
+    if key_type == KeyType.ECDSA:
+        return ECDSA.generate_key_pair()
+
+    if key_type == KeyType.EdDSA:
+        return EdDSA.generate_key_pair()
+
+    raise Exception('Invalid key type given.')
+
+
+class RemmeKeyPool:
+    """
+    Keep fresh key pairs generated in background worker processes, so taking a key pair does not wait for
+    key generation.
+
+    When number of ready and being generated key pairs falls to ``low_watermark``, workers generate new ones up to
+    ``high_watermark``. If the pool is empty, key pair is generated on demand and counted as a miss.
+
+    To use:
+        .. code-block:: python
+
+            key_pool = RemmeKeyPool(key_type=KeyType.RSA, low_watermark=4, high_watermark=16).start()
+
+            private_key, public_key = await key_pool.acquire()
+            print(key_pool.depth, key_pool.hits, key_pool.misses)
+
+            key_pool.close()
+    """
+
+    def __init__(self, key_type=KeyType.RSA, options=None, low_watermark=DEFAULT_KEY_POOL_LOW_WATERMARK,
+                 high_watermark=DEFAULT_KEY_POOL_HIGH_WATERMARK, executor=None):
+        """
+        Args:
+            key_type (KeyType): enum (RSA, ECDSA, EdDSA)
+            options (integer, optional): RSA key size
+            low_watermark (integer): number of ready key pairs at which the pool is topped up
+            high_watermark (integer): maximum number of ready key pairs
+            executor (concurrent.futures.Executor, optional): executor to generate key pairs in,
+                ``ProcessPoolExecutor`` by default
+        """
+        if isinstance(high_watermark, bool) or not isinstance(high_watermark, int) or high_watermark <= 0:
+            raise Exception('High watermark should be positive integer.')
+
+        if isinstance(low_watermark, bool) or not isinstance(low_watermark, int) \
+                or not 0 <= low_watermark <= high_watermark:
+            raise Exception('Low watermark should be not negative integer not greater than high watermark.')
+
+        self._key_type = KeyType(key_type)
+        self._options = options
+        self._low_watermark = low_watermark
+        self._high_watermark = high_watermark
+
+        self._executor = executor
+        self._is_own_executor = executor is None
+
+        self._key_pairs = collections.deque()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._generating = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @property
+    def key_type(self):
+        """
+        Return type of key pairs in the pool.
+        """
+        return self._key_type
+
+    @property
+    def depth(self):
+        """
+        Return number of ready key pairs.
+        """
+        return len(self._key_pairs)
+
+    @property
+    def generating(self):
+        """
+        Return number of key pairs being generated.
+        """
+        return self._generating
+
+    def start(self):
+        """
+        Start generating key pairs up to high watermark.
+
+        Returns:
+            Pool itself.
+        """
+        self._refill()
+        return self
+
+    def _get_executor(self):
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor()
+
+        return self._executor
+
+    def _refill(self):
+
+        with self._lock:
+            available = len(self._key_pairs) + self._generating
+
+            if self._closed or available > self._low_watermark:
+                return
+
+            count = self._high_watermark - available
+
+            self._generating += count
+
+        executor = self._get_executor()
+
+        for _ in range(count):
+            executor.submit(generate_key_pair, self._key_type, self._options).add_done_callback(self._add)
+
+    def _add(self, future):
+
+        with self._lock:
+            self._generating -= 1
+
+            if future.cancelled() or future.exception() is not None:
+                self.errors += 1
+                return
+
+            if not self._closed and len(self._key_pairs) < self._high_watermark:
+                self._key_pairs.append(future.result())
+
+    def _take(self):
+
+        with self._lock:
+            key_pair = self._key_pairs.popleft() if self._key_pairs else None
+
+            if key_pair is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        self._refill()
+
+        return key_pair
+
+    def get(self):
+        """
+        Take key pair from the pool, or generate it in the current thread if the pool is empty.
+
+        Returns:
+            Key pair in bytes.
+        """
+        if self._closed:
+            raise Exception('Key pool is closed.')
+
+        return self._take() or generate_key_pair(key_type=self._key_type, options=self._options)
+
+    async def acquire(self):
+        """
+        Take key pair from the pool, or generate it in the pool executor if the pool is empty,
+        without blocking the event loop.
+
+        Returns:
+            Key pair in bytes.
+        """
+        if self._closed:
+            raise Exception('Key pool is closed.')
+
+        key_pair = self._take()
+
+        if key_pair is not None:
+            return key_pair
+
+        return await asyncio.get_event_loop().run_in_executor(
+            self._get_executor(), generate_key_pair, self._key_type, self._options,
+        )
+
+    def close(self):
+        """
+        Stop generating key pairs and drop ready ones.
+        """
+        with self._lock:
+            self._closed = True
+            self._key_pairs.clear()
+
+        if self._is_own_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
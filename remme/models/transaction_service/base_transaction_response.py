@@ -11,7 +11,7 @@ class BaseTransactionResponse(RemmeWebSocket):
     Main class for response on transaction request, which contain identifier of batch and communication with WebSockets.
     """
 
-    def __init__(self, network_config, batch_id):
+    def __init__(self, network_config, batch_id, web_socket_hub=None):
         """
         Get address of node, ssl mode, and identifier of batch.
         Then implement RemmeWebSocket class and provide data to it.
@@ -19,13 +19,15 @@ class BaseTransactionResponse(RemmeWebSocket):
         Args:
             network_config (dict): config of network (node address and ssl mode)
             batch_id (string): batch id
+            web_socket_hub (RemmeWebSocketHub, optional): shared connection to receive batch events through
         """
         super(BaseTransactionResponse, self).__init__(network_config=network_config)
         self._batch_id = batch_id
+        self.web_socket_hub = web_socket_hub
         self.data = RemmeRequestParams({
             'event_type': RemmeEvents.Batch.value,
             'id': batch_id,
-        })
+        }).get_data()
 
     @property
     def batch_id(self):
@@ -47,11 +49,11 @@ class BaseTransactionResponse(RemmeWebSocket):
         if re.match(RemmePatterns.HEADER_SIGNATURE.value, value) is None:
             raise Exception('Given batch id is invalid.')
 
-        if self._socket:
+        if self._socket or self._subscription:
             await self.close_web_socket()
 
         self._batch_id = value
-        self.data = self.data.update({'id': value})
+        self.data = {**self.data, 'id': value}
 
     async def __aenter__(self):
         return await super().__aenter__()
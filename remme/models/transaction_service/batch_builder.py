@@ -0,0 +1,174 @@
+"""
+Builder of JSON-RPC batches of transactions sent to the node together.
+"""
+import asyncio
+import base64
+
+from aiohttp_json_rpc import RpcError
+from sawtooth_sdk.protobuf.transaction_pb2 import Transaction
+
+from remme.models.general.methods import RemmeMethods
+from remme.models.transaction_service.base_transaction_response import BaseTransactionResponse
+
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 1
+
+
+class RemmeBatchBuilder:
+    """
+    Class that collects transactions and sends them to the node together, as ``send_raw_transaction`` calls
+    of one JSON-RPC batch.
+
+    Pending transactions are sent when ``max_batch_size`` of them are collected, or when ``flush_interval`` seconds
+    passed since the first of them was added. The node accepts transactions only through ``send_raw_transaction``
+    and packs each of them into a batch signed by the node, so transactions should be created with node public key
+    as batcher public key, as ``RemmeTransactionService.create`` does, and each of them gets its own batch id.
+
+    To use:
+        .. code-block:: python
+
+            batch_builder = remme.transaction.create_batch_builder(max_batch_size=100, flush_interval=1)
+
+            transaction = await remme.transaction.create(
+                family_name, family_version, inputs, outputs, payload_bytes,
+            )
+
+            transaction_result = await batch_builder.add(transaction)
+            print(transaction_result.batch_id)
+
+            await batch_builder.close()
+    """
+
+    def __init__(self, remme_api, max_batch_size=DEFAULT_MAX_BATCH_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 node_config_cache=None, web_socket_hub=None):
+        """
+        Args:
+            remme_api: RemmeAPI
+            max_batch_size (integer): maximum number of transactions in one JSON-RPC batch
+            flush_interval (float): seconds pending transactions wait for others before they are sent
+            node_config_cache (RemmeNodeConfigCache, optional): cache of node config, that is dropped
+                when the node rejects transaction
+            web_socket_hub (RemmeWebSocketHub, optional): shared connection to receive batch events through
+
+        To use:
+            Usage without main remme package.
+
+            .. code-block:: python
+
+                remme_api = RemmeAPI() # See RemmeAPI implementation
+                batch_builder = RemmeBatchBuilder(remme_api)
+        """
+        if isinstance(max_batch_size, bool) or not isinstance(max_batch_size, int) or max_batch_size <= 0:
+            raise Exception('Maximum batch size should be positive integer.')
+
+        self._remme_api = remme_api
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._node_config_cache = node_config_cache
+        self._web_socket_hub = web_socket_hub
+
+        self._pending = []
+        self._timer = None
+        self._flushes = set()
+        self._batch_ids = {}
+
+    @property
+    def pending(self):
+        """
+        Return number of transactions waiting to be sent.
+        """
+        return len(self._pending)
+
+    def get_batch_id(self, transaction_id):
+        """
+        Get identifier of batch the transaction was sent in.
+
+        Args:
+            transaction_id (string): header signature of transaction
+
+        Returns:
+            Batch id or ``None`` if transaction was not sent yet.
+        """
+        return self._batch_ids.get(transaction_id)
+
+    def add(self, transaction):
+        """
+        Add transaction to the next JSON-RPC batch.
+
+        Args:
+            transaction (string): transaction in base64, as returned by ``RemmeTransactionService.create``
+
+        Returns:
+            Future of transaction result, which is resolved with ``BaseTransactionResponse`` of the batch,
+            when the transaction is sent, or with exception, if the node rejected it.
+        """
+        transaction_id = Transaction.FromString(base64.b64decode(transaction)).header_signature
+
+        future = asyncio.get_event_loop().create_future()
+        self._pending.append((transaction_id, transaction, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._start_flush()
+
+        elif self._timer is None:
+            self._timer = asyncio.get_event_loop().call_later(self._flush_interval, self._start_flush)
+
+        return future
+
+    def _start_flush(self):
+
+        flush = asyncio.ensure_future(self.flush())
+
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+
+    async def flush(self):
+        """
+        Send all pending transactions now, in JSON-RPC batches of ``max_batch_size`` transactions.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+
+        if not pending:
+            return
+
+        try:
+            results = await self._remme_api.send_batch(
+                requests=[(RemmeMethods.TRANSACTION, {'data': transaction}) for _, transaction, _ in pending],
+                batch_size=self._max_batch_size,
+                return_exceptions=True,
+            )
+
+        except Exception as error:
+            results = [error] * len(pending)
+
+        if self._node_config_cache is not None and any(isinstance(result, RpcError) for result in results):
+            self._node_config_cache.invalidate()
+
+        for (transaction_id, _, future), result in zip(pending, results):
+            if future.done():
+                continue
+
+            if isinstance(result, Exception):
+                future.set_exception(result)
+                continue
+
+            self._batch_ids[transaction_id] = result
+
+            future.set_result(BaseTransactionResponse(
+                network_config=self._remme_api.network_config,
+                batch_id=result,
+                web_socket_hub=self._web_socket_hub,
+            ))
+
+    async def close(self):
+        """
+        Send pending transactions and wait until all started sendings finish.
+        """
+        await self.flush()
+
+        if self._flushes:
+            await asyncio.wait(list(self._flushes))
@@ -0,0 +1,72 @@
+"""
+Cache of node config.
+"""
+import asyncio
+import time
+
+from remme.models.general.methods import RemmeMethods
+
+DEFAULT_NODE_CONFIG_TTL = 300
+
+
+class RemmeNodeConfigCache:
+    """
+    Keep node config (node public key used as batcher public key of transactions) for ``ttl`` seconds,
+    so creating transactions does not request it from the node every time.
+
+    Concurrent callers share one request to the node while the config is being fetched.
+
+    To use:
+        .. code-block:: python
+
+            node_config_cache = RemmeNodeConfigCache(remme_api, ttl=300)
+
+            node_config = await node_config_cache.get()
+            print(node_config.get('node_public_key'))
+
+            node_config_cache.invalidate()  # e.g. after node rejected transaction
+    """
+
+    def __init__(self, remme_api, ttl=DEFAULT_NODE_CONFIG_TTL):
+        """
+        Args:
+            remme_api: RemmeAPI
+            ttl (integer): seconds the config is kept for
+        """
+        self._remme_api = remme_api
+        self._ttl = ttl
+
+        self._node_config = None
+        self._expires_at = 0
+        self._fetching = None
+
+    async def _fetch(self):
+
+        node_config = await self._remme_api.send_request(method=RemmeMethods.NODE_CONFIG)
+
+        self._node_config = node_config
+        self._expires_at = time.monotonic() + self._ttl
+
+        return node_config
+
+    async def get(self):
+        """
+        Get node config from cache, or request it from the node if cached one is missing or expired.
+
+        Returns:
+            Node config.
+        """
+        if self._node_config is not None and time.monotonic() < self._expires_at:
+            return self._node_config
+
+        if self._fetching is None or self._fetching.done():
+            self._fetching = asyncio.ensure_future(self._fetch())
+
+        return await asyncio.shield(self._fetching)
+
+    def invalidate(self):
+        """
+        Drop cached node config, so the next ``get`` requests it from the node.
+        """
+        self._node_config = None
+        self._expires_at = 0
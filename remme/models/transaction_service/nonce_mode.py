@@ -0,0 +1,10 @@
+"""
+Provide enums for modes of generating transaction nonces.
+"""
+from enum import Enum
+
+
+class RemmeNonceMode(Enum):
+
+    COUNTER = 'counter'
+    RANDOM = 'random'
@@ -0,0 +1,144 @@
+"""
+Providers of unique transaction nonces.
+"""
+import os
+import threading
+
+from remme.models.transaction_service.nonce_mode import RemmeNonceMode
+
+DEFAULT_NONCE_PREFIX_SIZE = 16
+DEFAULT_NONCE_SIZE = 32
+DEFAULT_NONCE_BUFFER_SIZE = 1024
+
+
+class RemmeCounterNonceProvider:
+    """
+    Nonce is random prefix of the provider followed by value of its counter, so nonces of one provider never repeat
+    and nonces of different providers (processes, clients) repeat only if their random prefixes do.
+
+    To use:
+        .. code-block:: python
+
+            nonce_provider = RemmeCounterNonceProvider()
+
+            nonce = nonce_provider.get()
+            nonces = nonce_provider.get_many(count=100000)
+    """
+
+    def __init__(self, prefix_size=DEFAULT_NONCE_PREFIX_SIZE):
+        """
+        Args:
+            prefix_size (integer): number of random bytes in prefix
+        """
+        self._prefix = os.urandom(prefix_size).hex()
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self, count):
+
+        with self._lock:
+            start = self._counter
+            self._counter += count
+
+        return start
+
+    def get(self):
+        """
+        Get nonce.
+
+        Returns:
+            Nonce in hex format.
+        """
+        return f'{self._prefix}{self._reserve(count=1):016x}'
+
+    def get_many(self, count):
+        """
+        Get several nonces at once.
+
+        Args:
+            count (integer): number of nonces
+
+        Returns:
+            List of nonces in hex format.
+        """
+        start = self._reserve(count=count)
+        prefix = self._prefix
+
+        return [f'{prefix}{value:016x}' for value in range(start, start + count)]
+
+
+class RemmeRandomNonceProvider:
+    """
+    Nonce is ``size`` random bytes from ``os.urandom``. Random bytes are read from the system for many nonces at once
+    and cut into nonces.
+
+    To use:
+        .. code-block:: python
+
+            nonce_provider = RemmeRandomNonceProvider()
+
+            nonce = nonce_provider.get()
+            nonces = nonce_provider.get_many(count=100000)
+    """
+
+    def __init__(self, size=DEFAULT_NONCE_SIZE, buffer_size=DEFAULT_NONCE_BUFFER_SIZE):
+        """
+        Args:
+            size (integer): number of random bytes in nonce
+            buffer_size (integer): number of nonces read from the system at once
+        """
+        self._size = size
+        self._buffer_size = buffer_size
+
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    def _generate(self, count):
+
+        random_hex = os.urandom(self._size * count).hex()
+        length = 2 * self._size
+
+        return [random_hex[index:index + length] for index in range(0, len(random_hex), length)]
+
+    def get(self):
+        """
+        Get nonce.
+
+        Returns:
+            Nonce in hex format.
+        """
+        with self._lock:
+            if not self._buffer:
+                self._buffer = self._generate(count=self._buffer_size)
+
+            return self._buffer.pop()
+
+    def get_many(self, count):
+        """
+        Get several nonces at once.
+
+        Args:
+            count (integer): number of nonces
+
+        Returns:
+            List of nonces in hex format.
+        """
+        return self._generate(count=count)
+
+
+def create_nonce_provider(mode=RemmeNonceMode.COUNTER):
+    """
+    Create nonce provider for mode.
+
+    Args:
+        mode (RemmeNonceMode): mode of generating nonces
+
+    Returns:
+        Nonce provider.
+    """
+    mode = RemmeNonceMode(mode)
+
+    if mode == RemmeNonceMode.RANDOM:
+        return RemmeRandomNonceProvider()
+
+    return RemmeCounterNonceProvider()
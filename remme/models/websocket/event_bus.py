@@ -0,0 +1,261 @@
+"""
+Dispatcher of events from shared WebSocket connection to many in-process handlers.
+"""
+import asyncio
+import inspect
+
+from remme.models.websocket.events import RemmeEvents
+from remme.models.websocket.hub import (
+    EVENTS_ROUTES,
+    get_subscription_route,
+)
+from remme.models.websocket.reconnect import (
+    DEFAULT_RECONNECT_INITIAL_DELAY,
+    DEFAULT_RECONNECT_MAX_DELAY,
+    get_reconnect_delay,
+)
+from remme.models.websocket.request_params import RemmeRequestParams
+
+
+class RemmeEventHandler:
+    """
+    Registration of handler in ``RemmeEventBus``.
+    """
+
+    def __init__(self, event_type, key, handler, predicate=None):
+        """
+        Args:
+            event_type (string): type of events
+            key (string): batch id, address or swap id of events, ``None`` for all events of type
+            handler (callable): function or coroutine function, that takes event
+            predicate (callable, optional): function, that takes event and returns whether to handle it
+        """
+        self.event_type = event_type
+        self.key = key
+        self.handler = handler
+        self.predicate = predicate
+
+
+class RemmeEventBus:
+    """
+    Deliver events to many handlers through one subscription of the node for each event type and key.
+
+    Handlers are indexed by event type and key (batch id for ``Batch``, address for ``Transfer``, swap id for
+    ``AtomicSwap``), so routing an event costs one dictionary lookup regardless of number of handlers.
+    Handlers of an event run concurrently. Exception of handler does not affect other handlers,
+    it is counted in ``errors`` and passed to ``on_error``. Loss of connection is passed to ``on_error``
+    without handler registration and event, then handlers are subscribed again with delays growing
+    exponentially from ``initial_delay`` up to ``max_delay`` seconds. Events sent while connection was lost are missed.
+
+    To use:
+        .. code-block:: python
+
+            event_bus = remme.events.create_event_bus()
+
+            async def notify(transfer_info):
+                print(transfer_info.transfer_from, transfer_info.transfer_to)
+
+            registration = await event_bus.on(RemmeEvents.Transfer, notify, key=address)
+            await event_bus.on(RemmeEvents.Blocks, lambda block_info: print(block_info.id))
+
+            ...
+
+            await event_bus.off(registration)
+            await event_bus.close()
+    """
+
+    def __init__(self, web_socket_hub, on_error=None, is_own_web_socket_hub=False,
+                 initial_delay=DEFAULT_RECONNECT_INITIAL_DELAY, max_delay=DEFAULT_RECONNECT_MAX_DELAY):
+        """
+        Args:
+            web_socket_hub (RemmeWebSocketHub): shared connection to the node
+            on_error (callable, optional): function, that takes handler registration, event and exception
+            is_own_web_socket_hub (boolean, optional): whether to close connection together with event bus
+            initial_delay (float, optional): seconds before the first subscription again after connection loss
+            max_delay (float, optional): maximum seconds between subscriptions again
+        """
+        self._web_socket_hub = web_socket_hub
+        self._on_error = on_error
+        self._is_own_web_socket_hub = is_own_web_socket_hub
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+
+        self._handlers = {}
+        self._subscriptions = {}
+        self._dispatchers = {}
+
+        self.errors = 0
+
+    @property
+    def handlers_count(self):
+        """
+        Return number of registered handlers.
+        """
+        return sum(len(handlers) for handlers in self._handlers.values())
+
+    async def on(self, event, handler, key=None, predicate=None):
+        """
+        Register handler of events.
+
+        Args:
+            event (RemmeEvents): type of events
+            handler (callable): function or coroutine function, that takes event
+            key (string, optional): batch id, address or swap id of events, all events of type by default;
+                required for ``Batch`` and ``Transfer``
+            predicate (callable, optional): function, that takes event and returns whether to handle it,
+                checked only for events matching key
+
+        Returns:
+            RemmeEventHandler.
+        """
+        event_type = RemmeEvents(event).value
+        filter_param, _ = EVENTS_ROUTES.get(event_type, (None, ()))
+
+        if key is not None and filter_param is None:
+            raise Exception(f'Events {event_type} could not be filtered by key.')
+
+        data = {'event_type': event_type}
+
+        if key is not None:
+            data[filter_param] = key
+
+        params = RemmeRequestParams(data=data).get_data()
+        route = get_subscription_route(params=params)
+
+        registration = RemmeEventHandler(event_type=event_type, key=key, handler=handler, predicate=predicate)
+
+        if route not in self._handlers:
+            self._handlers[route] = set()
+
+            try:
+                subscription = await self._web_socket_hub.subscribe(params=params)
+            except Exception:
+                if not self._handlers.get(route):
+                    self._handlers.pop(route, None)
+                raise
+
+            self._subscriptions[route] = subscription
+            self._dispatchers[route] = asyncio.ensure_future(self._dispatch(route=route, subscription=subscription))
+
+        self._handlers[route].add(registration)
+
+        return registration
+
+    async def off(self, registration):
+        """
+        Remove handler of events. Node is unsubscribed when no handler of the same type and key is left.
+
+        Args:
+            registration (RemmeEventHandler): handler registration returned by ``on``
+        """
+        data = {'event_type': registration.event_type}
+
+        if registration.key is not None:
+            filter_param, _ = EVENTS_ROUTES.get(registration.event_type)
+            data[filter_param] = registration.key
+
+        route = get_subscription_route(params=data)
+        handlers = self._handlers.get(route)
+
+        if handlers is None or registration not in handlers:
+            return
+
+        handlers.discard(registration)
+
+        if not handlers:
+            await self._remove_route(route=route)
+
+    async def _remove_route(self, route):
+
+        self._handlers.pop(route, None)
+
+        dispatcher = self._dispatchers.pop(route, None)
+
+        if dispatcher is not None:
+            dispatcher.cancel()
+            await asyncio.wait([dispatcher])
+
+        subscription = self._subscriptions.pop(route, None)
+
+        if subscription is not None:
+            await subscription.close()
+
+    async def _call(self, registration, event):
+
+        try:
+            if registration.predicate is not None and not registration.predicate(event):
+                return
+
+            result = registration.handler(event)
+
+            if inspect.isawaitable(result):
+                await result
+
+        except Exception as error:
+            self.errors += 1
+
+            if self._on_error is not None:
+                self._on_error(registration, event, error)
+
+    def _report_connection_error(self, error):
+
+        self.errors += 1
+
+        if self._on_error is not None:
+            self._on_error(None, None, error)
+
+    async def _resubscribe(self, route, params):
+        """
+        Subscribe to events of route again after connection loss, until subscription succeeds.
+        """
+        failed_attempts = 0
+
+        while True:
+            await asyncio.sleep(get_reconnect_delay(
+                failed_attempts=failed_attempts, initial_delay=self._initial_delay, max_delay=self._max_delay,
+            ))
+
+            try:
+                subscription = await self._web_socket_hub.subscribe(params=params)
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as error:
+                failed_attempts += 1
+                self._report_connection_error(error=error)
+                continue
+
+            self._subscriptions[route] = subscription
+
+            return subscription
+
+    async def _dispatch(self, route, subscription):
+
+        while True:
+            try:
+                async for event in subscription:
+                    await asyncio.gather(*[
+                        self._call(registration=registration, event=event)
+                        for registration in list(self._handlers.get(route, ()))
+                    ])
+
+                return
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as error:
+                self._report_connection_error(error=error)
+
+            subscription = await self._resubscribe(route=route, params=subscription.params)
+
+    async def close(self):
+        """
+        Remove all handlers and unsubscribe from events.
+        """
+        for route in list(self._handlers):
+            await self._remove_route(route=route)
+
+        if self._is_own_web_socket_hub:
+            await self._web_socket_hub.close()
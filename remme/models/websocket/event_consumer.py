@@ -0,0 +1,209 @@
+"""
+Bounded queue of events between WebSocket reader and slow consumer.
+"""
+import asyncio
+import pickle
+import struct
+import tempfile
+import time
+
+from remme.models.websocket.queue_policy import RemmeQueuePolicy
+
+DEFAULT_EVENT_QUEUE_SIZE = 1000
+
+SPILLED_EVENT_HEADER = struct.Struct('>I')
+
+
+class RemmeEventSpill:
+    """
+    File with events, that did not fit into the queue, in order they were received.
+    """
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (string, optional): path to spill file, temporary file by default
+        """
+        self._file = open(path, 'w+b') if path is not None else tempfile.TemporaryFile()
+        self._read_position = 0
+        self._write_position = 0
+
+        self.count = 0
+
+    def append(self, item):
+        """
+        Write item to the end of file.
+        """
+        data = pickle.dumps(item)
+
+        self._file.seek(self._write_position)
+        self._file.write(SPILLED_EVENT_HEADER.pack(len(data)) + data)
+        self._write_position = self._file.tell()
+
+        self.count += 1
+
+    def pop(self):
+        """
+        Read the oldest item from file.
+        """
+        self._file.seek(self._read_position)
+        size, = SPILLED_EVENT_HEADER.unpack(self._file.read(SPILLED_EVENT_HEADER.size))
+        item = pickle.loads(self._file.read(size))
+
+        self._read_position = self._file.tell()
+        self.count -= 1
+
+        if not self.count:
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_position = self._write_position = 0
+
+        return item
+
+    def close(self):
+        """
+        Close file.
+        """
+        self._file.close()
+
+
+class RemmeEventConsumer:
+    """
+    Read events by background task into bounded queue, so slow processing of events does not stall reading
+    from the socket and the node does not drop the connection.
+
+    When the queue is full, policy decides what happens with a new event:
+        - ``DROP_OLDEST``: the oldest queued event is dropped and counted in ``dropped``,
+        - ``BLOCK``: reading waits until the consumer takes an event,
+        - ``SPILL_TO_DISK``: events are written to a file and returned to the queue in order, counted in ``spilled``.
+
+    To use:
+        .. code-block:: python
+
+            await remme.events.subscribe(event_type=RemmeEvents.Transfer.value, address=address)
+
+            consumer = RemmeEventConsumer(
+                remme.events.stream(), max_size=1000, policy=RemmeQueuePolicy.SPILL_TO_DISK,
+            ).start()
+
+            async for transfer_info in consumer:
+                await process(transfer_info)
+                print(consumer.depth, consumer.lag)
+
+            await consumer.close()
+    """
+
+    def __init__(self, events, max_size=DEFAULT_EVENT_QUEUE_SIZE, policy=RemmeQueuePolicy.DROP_OLDEST,
+                 spill_path=None):
+        """
+        Args:
+            events (async iterable): events, e.g. from ``RemmeWebSocket.stream``
+            max_size (integer, optional): maximum number of events in the queue
+            policy (RemmeQueuePolicy, optional): what to do with new event when the queue is full
+            spill_path (string, optional): path to spill file of ``SPILL_TO_DISK`` policy, temporary file by default
+        """
+        if isinstance(max_size, bool) or not isinstance(max_size, int) or max_size <= 0:
+            raise Exception('Maximum queue size should be positive integer.')
+
+        self._events = events
+        self._policy = RemmeQueuePolicy(policy)
+
+        self._queue = asyncio.Queue(maxsize=max_size)
+        self._spill = RemmeEventSpill(path=spill_path) if self._policy == RemmeQueuePolicy.SPILL_TO_DISK else None
+
+        self._reader = None
+        self._finished = False
+        self._error = None
+
+        self.lag = 0
+        self.dropped = 0
+        self.spilled = 0
+
+    @property
+    def depth(self):
+        """
+        Return number of events waiting for the consumer, including spilled ones.
+        """
+        return self._queue.qsize() + (self._spill.count if self._spill is not None else 0)
+
+    def start(self):
+        """
+        Start reading events.
+
+        Returns:
+            Consumer itself.
+        """
+        if self._reader is None:
+            self._reader = asyncio.ensure_future(self._read())
+
+        return self
+
+    async def _put(self, item):
+
+        if self._policy == RemmeQueuePolicy.BLOCK:
+            await self._queue.put(item)
+            return
+
+        if self._spill is not None and (self._spill.count or self._queue.full()):
+            self._spill.append(item)
+            self.spilled += 1
+            return
+
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+
+        self._queue.put_nowait(item)
+
+    async def _read(self):
+
+        try:
+            async for event in self._events:
+                await self._put(item=(time.monotonic(), event))
+
+        except Exception as error:
+            self._error = error
+
+        finally:
+            self._finished = True
+
+            if self._queue.empty():
+                self._queue.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+
+        if self._finished and not self.depth:
+            if self._error is not None:
+                raise self._error
+
+            raise StopAsyncIteration
+
+        item = await self._queue.get()
+
+        if item is None:
+            return await self.__anext__()
+
+        if self._spill is not None and self._spill.count and not self._queue.full():
+            self._queue.put_nowait(self._spill.pop())
+
+        received_at, event = item
+        self.lag = time.monotonic() - received_at
+
+        return event
+
+    async def close(self):
+        """
+        Stop reading events and drop queued ones.
+        """
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.wait([self._reader])
+
+        if hasattr(self._events, 'aclose'):
+            await self._events.aclose()
+
+        if self._spill is not None:
+            self._spill.close()
@@ -0,0 +1,432 @@
+"""
+Shared WebSocket connection to a node for many event subscriptions.
+"""
+import asyncio
+import itertools
+import json
+
+from aiohttp import (
+    ClientSession,
+    WSMsgType,
+)
+
+from remme.models.websocket.batch_info import BatchInfoDto
+from remme.models.websocket.block_info import BlockInfoDto
+from remme.models.websocket.events import RemmeEvents
+from remme.models.websocket.json_rpc_request import JsonRpcRequest
+from remme.models.websocket.methods import RemmeWebSocketMethods
+from remme.models.websocket.swap_info import SwapInfo
+from remme.models.websocket.transfer_info import TransferInfoDto
+from remme.utils import validate_node_config
+
+DEFAULT_SUBSCRIBE_TIMEOUT = 10
+
+EVENTS_INFO = {
+    RemmeEvents.Batch.value: BatchInfoDto,
+    RemmeEvents.Blocks.value: BlockInfoDto,
+    RemmeEvents.AtomicSwap.value: SwapInfo,
+    RemmeEvents.Transfer.value: TransferInfoDto,
+}
+
+# Subscription parameter, that filters events of type, and event attributes, that are matched against it.
+EVENTS_ROUTES = {
+    RemmeEvents.Batch.value: ('id', ('id',)),
+    RemmeEvents.Transfer.value: ('address', ('from', 'to')),
+    RemmeEvents.AtomicSwap.value: ('id', ('swap_id',)),
+}
+
+
+def get_event_info(event_type, attributes):
+    """
+    Map attributes of event to information object of its type.
+
+    Args:
+        event_type (string): type of event
+        attributes (dict): attributes of event
+
+    Returns:
+        Information object or ``None`` for unknown event type.
+    """
+    event_info = EVENTS_INFO.get(event_type)
+
+    return event_info(data=attributes) if event_info is not None else None
+
+
+def get_subscription_route(params):
+    """
+    Get key of events routed to subscription with params.
+
+    Args:
+        params (dict): subscription params with event type and filter
+
+    Returns:
+        Tuple of event type and filter value, ``None`` if subscription receives all events of type.
+    """
+    event_type = params.get('event_type')
+    filter_param, _ = EVENTS_ROUTES.get(event_type, (None, ()))
+
+    return event_type, params.get(filter_param) if filter_param is not None else None
+
+
+def get_event_routes(event_type, attributes):
+    """
+    Get keys of subscriptions which receive event.
+
+    Args:
+        event_type (string): type of event
+        attributes (dict): attributes of event
+
+    Returns:
+        Set of tuples of event type and filter value.
+    """
+    _, filter_attributes = EVENTS_ROUTES.get(event_type, (None, ()))
+
+    routes = {(event_type, None)}
+    routes.update((event_type, attributes.get(attribute)) for attribute in filter_attributes)
+
+    return routes
+
+
+class RemmeWebSocketSubscription:
+    """
+    Subscription to events, that are received through shared connection of ``RemmeWebSocketHub``.
+
+    To use:
+        .. code-block:: python
+
+            subscription = await web_socket_hub.subscribe({'event_type': 'batch', 'id': batch_id})
+
+            async for batch_info in subscription:
+                print(batch_info.status)
+                await subscription.close()
+    """
+
+    def __init__(self, web_socket_hub, params):
+        """
+        Args:
+            web_socket_hub (RemmeWebSocketHub): hub, that delivers events
+            params (dict): subscription params with event type and filter
+        """
+        self._web_socket_hub = web_socket_hub
+        self._params = params
+        self._events = asyncio.Queue()
+        self._closed = False
+
+        self.response = None
+
+    @property
+    def params(self):
+        """
+        Return subscription params.
+        """
+        return self._params
+
+    @property
+    def closed(self):
+        """
+        Return ``True`` if subscription is closed.
+        """
+        return self._closed
+
+    def put(self, event):
+        """
+        Add received event, or exception if connection failed, to subscription.
+        """
+        self._events.put_nowait(event)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+
+        if self._closed and self._events.empty():
+            raise StopAsyncIteration
+
+        event = await self._events.get()
+
+        if event is None:
+            raise StopAsyncIteration
+
+        if isinstance(event, Exception):
+            raise event
+
+        return event
+
+    async def close(self):
+        """
+        Stop receiving events. Node is unsubscribed when no other subscription has the same params.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        self._events.put_nowait(None)
+
+        await self._web_socket_hub.unsubscribe(subscription=self)
+
+
+class RemmeWebSocketHub:
+    """
+    One WebSocket connection to the node, shared by many event subscriptions.
+
+    Subscriptions with the same params share one subscription of the node. Each received event is routed
+    by its type and attributes (batch id, transfer addresses, swap id) only to matching subscriptions,
+    so memory and number of sockets do not grow with number of subscriptions.
+
+    To use:
+        .. code-block:: python
+
+            web_socket_hub = RemmeWebSocketHub(network_config={'node_address': 'localhost:8080', 'ssl_mode': False})
+
+            subscriptions = [
+                await web_socket_hub.subscribe({'event_type': 'batch', 'id': batch_id}) for batch_id in batch_ids
+            ]
+
+            async for batch_info in subscriptions[0]:
+                print(batch_info.status)
+
+            await web_socket_hub.close()
+    """
+
+    def __init__(self, network_config, subscribe_timeout=DEFAULT_SUBSCRIBE_TIMEOUT):
+        """
+        Args:
+            network_config (dict): config of network (node address and ssl mode)
+            subscribe_timeout (integer, optional): seconds to wait for node to confirm subscription
+        """
+        validate_node_config(network_config=network_config)
+
+        self._network_config = network_config
+        self._subscribe_timeout = subscribe_timeout
+
+        self._session = None
+        self._web_socket = None
+        self._reader = None
+        self._connecting = None
+
+        self._ids = itertools.count(1)
+        self._pending = {}
+
+        self._subscribing = {}
+        self._subscriptions = {}
+        self._responses = {}
+        self._routes = {}
+
+    @property
+    def url(self):
+        """
+        Return node url.
+        """
+        protocol = 'wss://' if self._network_config.get('ssl_mode') else 'ws://'
+        return f'{protocol}{self._network_config.get("node_address")}'
+
+    @property
+    def is_connected(self):
+        """
+        Return ``True`` if connection is open and its reader is running.
+        """
+        return self._web_socket is not None and not self._web_socket.closed \
+            and self._reader is not None and not self._reader.done()
+
+    @property
+    def subscriptions_count(self):
+        """
+        Return number of active subscriptions.
+        """
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    async def _open(self):
+
+        if self._session is not None:
+            await self._session.close()
+
+        self._session = ClientSession()
+
+        try:
+            self._web_socket = await self._session.ws_connect(self.url)
+        except Exception:
+            await self._session.close()
+            self._session = None
+            raise ConnectionError(f'Please check if your node running at {self.url}.')
+
+        self._reader = asyncio.ensure_future(self._read())
+
+    async def _connect(self):
+
+        if self.is_connected:
+            return
+
+        if self._connecting is None or self._connecting.done():
+            self._connecting = asyncio.ensure_future(self._open())
+
+        await asyncio.shield(self._connecting)
+
+    def _route(self, result):
+
+        event_type, attributes = result.get('event_type'), result.get('attributes') or {}
+
+        subscriptions = set()
+
+        for route in get_event_routes(event_type=event_type, attributes=attributes):
+            subscriptions.update(self._routes.get(route, ()))
+
+        if not subscriptions:
+            return
+
+        event_info = get_event_info(event_type=event_type, attributes=attributes)
+
+        for subscription in subscriptions:
+            subscription.put(event_info)
+
+    def _handle(self, response):
+
+        if not isinstance(response, dict):
+            return
+
+        future = self._pending.get(response.get('id'))
+
+        if future is not None:
+            if not future.done():
+                future.set_result(response)
+            return
+
+        result = response.get('result')
+
+        if isinstance(result, dict) and result.get('event_type') is not None:
+            self._route(result=result)
+
+    async def _read(self):
+
+        try:
+            async for message in self._web_socket:
+
+                if message.type != WSMsgType.TEXT:
+                    continue
+
+                try:
+                    response = json.loads(message.data)
+                except ValueError:
+                    continue
+
+                self._handle(response=response)
+
+        finally:
+            error = ConnectionError(f'Connection to the node at {self.url} was closed.')
+
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+            for subscriptions in self._subscriptions.values():
+                for subscription in subscriptions:
+                    subscription.put(error)
+
+            self._subscriptions.clear()
+            self._responses.clear()
+            self._routes.clear()
+
+    async def _send(self, method, params):
+
+        if not self.is_connected:
+            raise ConnectionError(f'Connection to the node at {self.url} was closed.')
+
+        id_ = next(self._ids)
+        request = dict(JsonRpcRequest(method=method.value, params=params).get_query(), id=id_)
+
+        future = asyncio.get_event_loop().create_future()
+        self._pending[id_] = future
+
+        try:
+            await self._web_socket.send_str(json.dumps(request))
+            response = await asyncio.wait_for(future, timeout=self._subscribe_timeout)
+
+        finally:
+            self._pending.pop(id_, None)
+
+        if response.get('error'):
+            raise Exception(response.get('error'))
+
+        return response
+
+    async def subscribe(self, params):
+        """
+        Subscribe to events.
+
+        Args:
+            params (dict): serialized request params with event type and filter, see ``RemmeRequestParams``
+
+        Returns:
+            RemmeWebSocketSubscription.
+        """
+        await self._connect()
+
+        key = json.dumps(params, sort_keys=True)
+
+        if key not in self._subscriptions:
+            request = self._subscribing.get(key)
+
+            if request is None:
+                request = asyncio.ensure_future(self._send(method=RemmeWebSocketMethods.Subscribe, params=params))
+                request.add_done_callback(lambda _: self._subscribing.pop(key, None))
+                self._subscribing[key] = request
+
+            response = await asyncio.shield(request)
+
+            if key not in self._subscriptions:
+                self._subscriptions[key] = set()
+                self._responses[key] = response
+
+        subscription = RemmeWebSocketSubscription(web_socket_hub=self, params=params)
+        subscription.response = self._responses.get(key)
+
+        self._subscriptions[key].add(subscription)
+        self._routes.setdefault(get_subscription_route(params=params), set()).add(subscription)
+
+        return subscription
+
+    async def unsubscribe(self, subscription):
+        """
+        Remove subscription. Node is unsubscribed when no other subscription has the same params.
+
+        Args:
+            subscription (RemmeWebSocketSubscription): subscription to remove
+        """
+        key = json.dumps(subscription.params, sort_keys=True)
+        route = get_subscription_route(params=subscription.params)
+
+        subscriptions = self._subscriptions.get(key)
+
+        if subscriptions is None or subscription not in subscriptions:
+            return
+
+        subscriptions.discard(subscription)
+
+        routed_subscriptions = self._routes.get(route)
+        routed_subscriptions.discard(subscription)
+
+        if not routed_subscriptions:
+            del self._routes[route]
+
+        if subscriptions:
+            return
+
+        del self._subscriptions[key]
+        del self._responses[key]
+
+        if self.is_connected:
+            await self._send(method=RemmeWebSocketMethods.Unsubscribe, params=subscription.params)
+
+    async def close(self):
+        """
+        Close connection, active subscriptions stop with exception.
+        """
+        if self._web_socket is not None:
+            await self._web_socket.close()
+
+        if self._reader is not None:
+            await asyncio.wait([self._reader])
+
+        if self._session is not None:
+            await self._session.close()
+
+        self._session, self._web_socket, self._reader = None, None, None
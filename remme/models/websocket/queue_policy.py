@@ -0,0 +1,11 @@
+"""
+Provide enums for policies of full event queues.
+"""
+from enum import Enum
+
+
+class RemmeQueuePolicy(Enum):
+
+    DROP_OLDEST = 'drop_oldest'
+    BLOCK = 'block'
+    SPILL_TO_DISK = 'spill_to_disk'
@@ -0,0 +1,25 @@
+"""
+Delays between reconnections to the node.
+"""
+import random
+
+DEFAULT_RECONNECT_INITIAL_DELAY = 0.5
+DEFAULT_RECONNECT_MAX_DELAY = 30
+
+
+def get_reconnect_delay(failed_attempts, initial_delay=DEFAULT_RECONNECT_INITIAL_DELAY,
+                        max_delay=DEFAULT_RECONNECT_MAX_DELAY):
+    """
+    Get seconds before reconnection, that grow exponentially with number of failed attempts, with random jitter.
+
+    Args:
+        failed_attempts (integer): number of reconnections in a row, that failed
+        initial_delay (float, optional): seconds before the first reconnection
+        max_delay (float, optional): maximum seconds between reconnections
+
+    Returns:
+        Seconds to wait.
+    """
+    delay = min(max_delay, initial_delay * 2 ** failed_attempts)
+
+    return random.uniform(delay / 2, delay)
@@ -1,3 +1,6 @@
+import re
+
+from remme.models.general.patterns import RemmePatterns
 
 
 class WebSocketsBlocksEventRequestParams:
@@ -6,9 +9,21 @@ class WebSocketsBlocksEventRequestParams:
     """
 
     def __init__(self, data):
+
         self.event_type = data.get('event_type')
+        self.from_block = data.get('last_known_block_id')
+
+        if self.from_block is not None:
+
+            if not isinstance(self.from_block, str) \
+                    or re.match(RemmePatterns.HEADER_SIGNATURE.value, self.from_block) is None:
+                raise Exception('The `last_known_block_id` parameter is not correct.')
 
     def serialize_to_json(self):
-        return {
-            'event_type': self.event_type,
-        }
+
+        params = {'event_type': self.event_type}
+
+        if self.from_block is not None:
+            params['from_block'] = self.from_block
+
+        return params
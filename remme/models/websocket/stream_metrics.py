@@ -0,0 +1,20 @@
+
+
+class RemmeStreamMetrics:
+    """
+    Class for counters of event stream.
+    """
+
+    def __init__(self):
+        """
+        Counters:
+            reconnects (integer): number of connections opened again after connection loss
+            gaps (integer): number of reconnections, that could not be resumed from the last seen block,
+                so events sent while connection was lost could be missed
+            duplicates (integer): number of events, that were received again after reconnection and skipped
+            last_block_id (string): id of the last block, that stream resumes from
+        """
+        self.reconnects = 0
+        self.gaps = 0
+        self.duplicates = 0
+        self.last_block_id = None
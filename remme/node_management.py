@@ -34,12 +34,14 @@ class RemmeNodeManagement(IRemmeNodeManagement):
     _family_name = RemmeFamilyName.NODE_ACCOUNT.value
     _family_version = '0.1'
 
-    def __init__(self, remme_api, remme_account, remme_transaction):
+    def __init__(self, remme_api, remme_account, remme_transaction, node_config_cache=None):
         """
         Args:
             remme_api: RemmeAPI
             remme_account: RemmeAccount
             remme_transaction: RemmeTransactionService
+            node_config_cache (RemmeNodeConfigCache, optional): cache of node config, the one of transaction service
+                is used by default
 
         To use:
             Usage without remme main package.
@@ -53,6 +55,7 @@ class RemmeNodeManagement(IRemmeNodeManagement):
         self._remme_api = remme_api
         self._remme_account = remme_account
         self._remme_transaction = remme_transaction
+        self._node_config_cache = node_config_cache or remme_transaction.node_config_cache
 
     async def _check_node(self):
         node_account = await self.get_node_account()
@@ -287,5 +290,5 @@ class RemmeNodeManagement(IRemmeNodeManagement):
 
                 node_config = await remme.node_management.get_node_config()
         """
-        api_result = await self._remme_api.send_request(method=RemmeMethods.NODE_CONFIG)
+        api_result = await self._node_config_cache.get()
         return NodeConfig(data=api_result)
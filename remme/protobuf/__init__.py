@@ -35,3 +35,17 @@ from remme.protobuf.transaction_pb2 import (
     TransactionPayload,
     EmptyPayload,
 )
+from remme.protobuf import (
+    account_pb2,
+    atomic_swap_pb2,
+    block_info_pb2,
+    node_account_pb2,
+    pub_key_pb2,
+    transaction_pb2,
+)
+
+# Generated modules are named without package, so message types could not be found by pickle.
+# Set their real module, so messages and message types could be sent to worker processes.
+for _module in (account_pb2, atomic_swap_pb2, block_info_pb2, node_account_pb2, pub_key_pb2, transaction_pb2):
+    for _name in _module.DESCRIPTOR.message_types_by_name:
+        getattr(_module, _name).__module__ = _module.__name__
@@ -13,6 +13,8 @@ from remme.atomic_swap import RemmeSwap
 from remme.blockchain_info import RemmeBlockchainInfo
 from remme.certificate import RemmeCertificate
 from remme.keys import RemmeKeys
+from remme.models.transaction_service.node_config_cache import RemmeNodeConfigCache
+from remme.models.websocket.hub import RemmeWebSocketHub
 from remme.node_management import RemmeNodeManagement
 from remme.public_key_storage import RemmePublicKeyStorage
 from remme.token import RemmeToken
@@ -39,13 +41,21 @@ class Remme:
         self._remme_api = RemmeAPI(self.network_config)
         self._account = RemmeAccount(**self.account_config)
 
-        self.transaction = RemmeTransactionService(self._remme_api, self._account)
+        self._node_config_cache = RemmeNodeConfigCache(self._remme_api)
+
+        self._web_socket_hub = RemmeWebSocketHub(self._remme_api.network_config)
+
+        self.transaction = RemmeTransactionService(
+            self._remme_api, self._account, self._node_config_cache, web_socket_hub=self._web_socket_hub,
+        )
         self.public_key_storage = RemmePublicKeyStorage(self._remme_api, self._account, self.transaction)
         self.certificate = RemmeCertificate(self.public_key_storage)
         self.token = RemmeToken(self._remme_api, self.transaction, self._account)
         self.swap = RemmeSwap(self._remme_api, self.transaction)
         self.blockchain_info = RemmeBlockchainInfo(self._remme_api)
-        self.node_management = RemmeNodeManagement(self._remme_api, self._account, self.transaction)
+        self.node_management = RemmeNodeManagement(
+            self._remme_api, self._account, self.transaction, self._node_config_cache,
+        )
 
         self._events = RemmeWebSocketEvents(self._remme_api.network_config)
 
@@ -93,6 +103,26 @@ class Remme:
         """
         return RemmeAccount()
 
+    async def close(self):
+        """
+        Close long-lived connections to the node, if pool of connections is used in network config,
+        and connection shared by responses of sent transactions.
+
+        To use:
+            .. code-block:: python
+
+                remme = Remme(network_config={
+                    'node_address': 'localhost:8080',
+                    'pool_size': 8,
+                })
+
+                ...
+
+                await remme.close()
+        """
+        await self._remme_api.close()
+        await self._web_socket_hub.close()
+
     @property
     def events(self):
         """
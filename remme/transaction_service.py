@@ -1,17 +1,56 @@
+import asyncio
 import base64
 
+from aiohttp_json_rpc import RpcError
 from sawtooth_sdk.protobuf.transaction_pb2 import (
     Transaction,
     TransactionHeader,
 )
+from remme.models.general.batch_status import BatchStatus
 from remme.models.general.methods import RemmeMethods
 from remme.models.interfaces.transaction_service import IRemmeTransactionService
+from remme.models.keys.ecdsa import ECDSA
+from remme.models.transaction_service.batch_builder import (
+    DEFAULT_FLUSH_INTERVAL,
+    DEFAULT_MAX_BATCH_SIZE,
+    RemmeBatchBuilder,
+)
 from remme.models.transaction_service.base_transaction_response import BaseTransactionResponse
+from remme.models.transaction_service.node_config_cache import RemmeNodeConfigCache
+from remme.models.transaction_service.nonce_provider import RemmeCounterNonceProvider
+from remme.models.websocket.batch_info import BatchInfoDto
+from remme.models.websocket.events import RemmeEvents
+from remme.models.websocket.hub import RemmeWebSocketHub
 from remme.utils import (
-    create_nonce,
+    hex_to_bytes,
     sha512_hexdigest,
 )
 
+DEFAULT_SIGNING_CHUNK_SIZE = 1000
+DEFAULT_BATCHES_WAIT_TIMEOUT = 300
+DEFAULT_BATCHES_POLL_INTERVAL = 5
+DEFAULT_BATCHES_POLL_CONCURRENCY = 20
+DEFAULT_BATCHES_GRACE_PERIOD = 60
+
+FINAL_BATCH_STATUSES = (BatchStatus.COMMITTED.value, BatchStatus.INVALID.value)
+
+
+def sign_transaction_headers(private_key_hex, transaction_headers_bytes):
+    """
+    Sign transaction headers with account private key.
+
+    Module-level function, so it could be run in worker processes.
+
+    Args:
+        private_key_hex (string): private key of account in hex format
+        transaction_headers_bytes (list): list of serialized transaction headers
+
+    Returns:
+        List of hex signatures in the same order as headers.
+    """
+    key = ECDSA(private_key=hex_to_bytes(private_key_hex))
+    return [key.sign(transaction_header_bytes) for transaction_header_bytes in transaction_headers_bytes]
+
 
 class RemmeTransactionService(IRemmeTransactionService):
     """
@@ -31,11 +70,15 @@ class RemmeTransactionService(IRemmeTransactionService):
             send_response = await remme.transaction.send(transaction)
     """
 
-    def __init__(self, remme_api, remme_account):
+    def __init__(self, remme_api, remme_account, node_config_cache=None, nonce_provider=None, web_socket_hub=None):
         """
         Args:
             remme_api: RemmeAPI
             remme_account: RemmeAccount
+            node_config_cache (RemmeNodeConfigCache, optional): cache of node config shared with other services
+            nonce_provider (optional): provider of transaction nonces, ``RemmeCounterNonceProvider`` by default
+            web_socket_hub (RemmeWebSocketHub, optional): shared connection, that responses of sent transactions
+                receive batch events through, each response opens own connection by default
 
         To use:
             Usage without main remme package.
@@ -48,6 +91,23 @@ class RemmeTransactionService(IRemmeTransactionService):
         """
         self._remme_account = remme_account
         self._remme_api = remme_api
+        self._node_config_cache = node_config_cache or RemmeNodeConfigCache(remme_api=remme_api)
+        self._nonce_provider = nonce_provider or RemmeCounterNonceProvider()
+        self._web_socket_hub = web_socket_hub
+
+    @property
+    def node_config_cache(self):
+        """
+        Return cache of node config, which provides batcher public key for transactions.
+        """
+        return self._node_config_cache
+
+    @property
+    def web_socket_hub(self):
+        """
+        Return shared connection, that responses of sent transactions receive batch events through.
+        """
+        return self._web_socket_hub
 
     async def create(self, family_name, family_version, inputs, outputs, payload_bytes):
         """
@@ -77,22 +137,113 @@ class RemmeTransactionService(IRemmeTransactionService):
                     family_name, family_version, inputs, outputs, payload_bytes,
                 )
         """
-        node_config = await self._remme_api.send_request(method=RemmeMethods.NODE_CONFIG)
-        batcher_public_key = node_config.get('node_public_key')
+        batcher_public_key = await self._get_node_public_key()
+
+        transaction_header_bytes = self._create_transaction_header(
+            family_name=family_name,
+            family_version=family_version,
+            inputs=inputs,
+            outputs=outputs,
+            payload_bytes=payload_bytes,
+            batcher_public_key=batcher_public_key,
+            nonce=self._nonce_provider.get(),
+        )
+
+        signature = self._remme_account.sign(transaction_header_bytes)
+
+        return self._encode_transaction(
+            transaction_header_bytes=transaction_header_bytes, signature=signature, payload_bytes=payload_bytes,
+        )
+
+    async def create_many(self, specs, executor=None, chunk_size=DEFAULT_SIGNING_CHUNK_SIZE):
+        """
+        Create many transactions, signing them outside of the event loop.
 
-        transaction_header_bytes = TransactionHeader(
+        Headers are built on the event loop, then signed in chunks of ``chunk_size`` by the executor.
+        By default it is the event loop thread pool, which uses several cores because secp256k1 binding releases
+        the GIL while signing. ``ProcessPoolExecutor`` could be passed instead.
+
+        Args:
+            specs (list): list of dicts with ``create`` arguments (family_name, family_version, inputs, outputs
+                and payload_bytes)
+            executor (concurrent.futures.Executor, optional): executor to sign transactions in
+            chunk_size (integer, optional): number of transactions signed by one executor job
+
+        Returns:
+            List of transactions in the same order as specs.
+
+        To use:
+            .. code-block:: python
+
+                specs = [{
+                    'family_name': 'account',
+                    'family_version': '0.1',
+                    'inputs': [],
+                    'outputs': [],
+                    'payload_bytes': payload_bytes,
+                } for payload_bytes in payloads]
+
+                with ProcessPoolExecutor() as executor:
+                    transactions = await remme_transaction.create_many(specs, executor=executor)
+        """
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise Exception('Chunk size should be positive integer.')
+
+        batcher_public_key = await self._get_node_public_key()
+
+        transaction_headers_bytes = [
+            self._create_transaction_header(
+                family_name=spec.get('family_name'),
+                family_version=spec.get('family_version'),
+                inputs=spec.get('inputs'),
+                outputs=spec.get('outputs'),
+                payload_bytes=spec.get('payload_bytes'),
+                batcher_public_key=batcher_public_key,
+                nonce=nonce,
+            ) for spec, nonce in zip(specs, self._nonce_provider.get_many(count=len(specs)))
+        ]
+
+        loop = asyncio.get_event_loop()
+
+        signatures_chunks = await asyncio.gather(*[
+            loop.run_in_executor(
+                executor, sign_transaction_headers,
+                self._remme_account.private_key_hex, transaction_headers_bytes[index:index + chunk_size],
+            ) for index in range(0, len(transaction_headers_bytes), chunk_size)
+        ])
+
+        signatures = [signature for signatures_chunk in signatures_chunks for signature in signatures_chunk]
+
+        return [
+            self._encode_transaction(
+                transaction_header_bytes=transaction_header_bytes,
+                signature=signature,
+                payload_bytes=spec.get('payload_bytes'),
+            ) for spec, transaction_header_bytes, signature in zip(specs, transaction_headers_bytes, signatures)
+        ]
+
+    async def _get_node_public_key(self):
+
+        node_config = await self._node_config_cache.get()
+        return node_config.get('node_public_key')
+
+    def _create_transaction_header(self, family_name, family_version, inputs, outputs, payload_bytes,
+                                   batcher_public_key, nonce):
+
+        return TransactionHeader(
             family_name=family_name,
             family_version=family_version,
             inputs=inputs + [self._remme_account.address],
             outputs=outputs + [self._remme_account.address],
             signer_public_key=self._remme_account.public_key_hex,
             batcher_public_key=batcher_public_key,
-            nonce=create_nonce(),
+            nonce=nonce,
             dependencies=[],
             payload_sha512=sha512_hexdigest(payload_bytes)
         ).SerializeToString()
 
-        signature = self._remme_account.sign(transaction_header_bytes)
+    @staticmethod
+    def _encode_transaction(transaction_header_bytes, signature, payload_bytes):
 
         transaction = Transaction(
             header=transaction_header_bytes,
@@ -106,6 +257,9 @@ class RemmeTransactionService(IRemmeTransactionService):
         """
         Send transactions.
 
+        If the node rejects transaction, cached node config is dropped, so the next transaction
+        is created with fresh batcher public key.
+
         Args:
             payload (bytes): transaction in base64
 
@@ -118,12 +272,182 @@ class RemmeTransactionService(IRemmeTransactionService):
                 send_response = await remme_transaction.send(transaction)
                 print(send_request.batch_id)
         """
-        batch_id = await self._remme_api.send_request(
-            method=RemmeMethods.TRANSACTION,
-            params={"data": payload},
-        )
+        try:
+            batch_id = await self._remme_api.send_request(
+                method=RemmeMethods.TRANSACTION,
+                params={"data": payload},
+            )
+
+        except RpcError:
+            self._node_config_cache.invalidate()
+            raise
 
         return BaseTransactionResponse(
             network_config=self._remme_api.network_config,
             batch_id=batch_id,
+            web_socket_hub=self._web_socket_hub,
+        )
+
+    async def _watch_batch(self, web_socket_hub, batch_id, statuses, last_event_times):
+        """
+        Put final status of batch from its events to queue of statuses.
+
+        Time of the last event of batch is kept in ``last_event_times``, it is set to ``None``
+        if subscription failed, so batch is polled instead.
+        """
+        loop = asyncio.get_event_loop()
+
+        try:
+            subscription = await web_socket_hub.subscribe(params={
+                'event_type': RemmeEvents.Batch.value,
+                'id': batch_id,
+            })
+        except Exception:
+            last_event_times[batch_id] = None
+            return
+
+        try:
+            async for batch_info in subscription:
+                last_event_times[batch_id] = loop.time()
+
+                if batch_info.status in FINAL_BATCH_STATUSES:
+                    statuses.put_nowait(batch_info)
+                    break
+
+        except Exception:
+            last_event_times[batch_id] = None
+
+        finally:
+            await subscription.close()
+
+    async def _poll_batches(self, batch_ids, statuses, last_event_times, poll_interval, grace_period):
+        """
+        Put final statuses of batches, whose events were missed, to queue of statuses.
+
+        All batches are polled once at start, as they could be committed before subscription.
+        Then only batches, whose subscription failed or that had no events for ``grace_period`` seconds, are polled.
+        """
+        loop = asyncio.get_event_loop()
+        semaphore = asyncio.Semaphore(DEFAULT_BATCHES_POLL_CONCURRENCY)
+
+        async def poll(batch_id):
+
+            async with semaphore:
+                try:
+                    status = await self._remme_api.send_request(
+                        method=RemmeMethods.BATCH_STATUS, params={'id': batch_id},
+                    )
+                except Exception:
+                    return
+
+            if status in FINAL_BATCH_STATUSES:
+                statuses.put_nowait(BatchInfoDto(data={'id': batch_id, 'status': status}))
+
+        polled_batch_ids = list(batch_ids)
+
+        while batch_ids:
+            await asyncio.gather(*[poll(batch_id=batch_id) for batch_id in polled_batch_ids])
+            await asyncio.sleep(poll_interval)
+
+            silence_start = loop.time() - grace_period
+
+            polled_batch_ids = [
+                batch_id for batch_id in batch_ids
+                if last_event_times.get(batch_id) is None or last_event_times.get(batch_id) < silence_start
+            ]
+
+    async def wait_for_batches(self, batch_ids, timeout=DEFAULT_BATCHES_WAIT_TIMEOUT,
+                               poll_interval=DEFAULT_BATCHES_POLL_INTERVAL, grace_period=DEFAULT_BATCHES_GRACE_PERIOD):
+        """
+        Wait until batches are committed or found invalid.
+
+        Statuses come from ``batch`` events received through one shared connection. Statuses of all batches
+        are requested once at start, as batches could be committed before subscription. Then every
+        ``poll_interval`` seconds statuses are requested only for batches, whose subscription failed
+        or that had no events for ``grace_period`` seconds.
+
+        Args:
+            batch_ids (list): list of batch ids
+            timeout (integer, optional): seconds to wait for all batches
+            poll_interval (integer, optional): seconds between requests of statuses of waiting batches
+            grace_period (integer, optional): seconds without events of batch, after which its status is requested
+
+        Returns:
+            Asynchronous iterator of BatchInfoDto with final status, in order batches complete.
+
+        To use:
+            .. code-block:: python
+
+                batch_ids = [(await remme.transaction.send(transaction)).batch_id for transaction in transactions]
+
+                async for batch_info in remme.transaction.wait_for_batches(batch_ids, timeout=600):
+                    print(batch_info.batch_id, batch_info.status)
+        """
+        waiting_batch_ids = set(batch_ids)
+
+        web_socket_hub = self._web_socket_hub or RemmeWebSocketHub(network_config=self._remme_api.network_config)
+
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+
+        statuses = asyncio.Queue()
+        last_event_times = {batch_id: loop.time() for batch_id in waiting_batch_ids}
+
+        watchers = [
+            asyncio.ensure_future(self._watch_batch(
+                web_socket_hub=web_socket_hub, batch_id=batch_id, statuses=statuses, last_event_times=last_event_times,
+            )) for batch_id in waiting_batch_ids
+        ]
+        poller = asyncio.ensure_future(self._poll_batches(
+            batch_ids=waiting_batch_ids,
+            statuses=statuses,
+            last_event_times=last_event_times,
+            poll_interval=poll_interval,
+            grace_period=grace_period,
+        ))
+
+        try:
+            while waiting_batch_ids:
+                batch_info = await asyncio.wait_for(statuses.get(), timeout=max(deadline - loop.time(), 0))
+
+                if batch_info.batch_id in waiting_batch_ids:
+                    waiting_batch_ids.discard(batch_info.batch_id)
+                    yield batch_info
+
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f'{len(waiting_batch_ids)} batches were not completed in {timeout} seconds.')
+
+        finally:
+            poller.cancel()
+
+            for watcher in watchers:
+                watcher.cancel()
+
+            await asyncio.wait(watchers + [poller])
+
+            if web_socket_hub is not self._web_socket_hub:
+                await web_socket_hub.close()
+
+    def create_batch_builder(self, max_batch_size=DEFAULT_MAX_BATCH_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        """
+        Create builder, that sends transactions to the node together in JSON-RPC batches.
+
+        Args:
+            max_batch_size (integer): maximum number of transactions in one JSON-RPC batch
+            flush_interval (float): seconds pending transactions wait for others before they are sent
+
+        Returns:
+            RemmeBatchBuilder.
+
+        To use:
+            .. code-block:: python
+
+                batch_builder = remme_transaction.create_batch_builder(max_batch_size=100)
+        """
+        return RemmeBatchBuilder(
+            remme_api=self._remme_api,
+            max_batch_size=max_batch_size,
+            flush_interval=flush_interval,
+            node_config_cache=self._node_config_cache,
+            web_socket_hub=self._web_socket_hub,
         )
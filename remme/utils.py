@@ -2,8 +2,7 @@ import base64
 import codecs
 import hashlib
 import json
-import math
-import random
+import os
 import re
 
 from Crypto.Hash import keccak
@@ -11,6 +10,7 @@ from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 
+from remme.models.api.balancing_strategy import RemmeBalancingStrategy
 from remme.models.general.patterns import RemmePatterns
 from remme.models.keys.rsa_signature_padding import RsaSignaturePadding
 from remme.protobuf.pub_key_pb2 import NewPubKeyPayload
@@ -97,9 +97,7 @@ def hex_to_bytes(message):
 
 
 def create_nonce():
-    hash_o = hashlib.sha512(str(math.floor(1000 * random.random())).encode('UTF-8'))
-    result = hash_o.hexdigest()
-    return result
+    return os.urandom(32).hex()
 
 
 def check_sha256(data):
@@ -131,6 +129,59 @@ def validate_node_config(network_config):
     elif not isinstance(ssl_mode, bool):
         raise Exception('You try construct with invalid `ssl_mode`, `ssl_mode` should has boolean type.')
 
+    nodes = network_config.get('nodes')
+
+    if nodes is not None:
+        if not isinstance(nodes, list) or not nodes:
+            raise Exception('You try construct with invalid `nodes`, `nodes` should be not empty list of addresses.')
+
+        for node in nodes:
+            if not isinstance(node, str) or re.match(RemmePatterns.PROTOCOL.value, node) is None:
+                raise Exception(
+                    f'You try construct with invalid node `{node}` in `nodes`, remove protocol and try again.'
+                )
+
+    balancing_strategy = network_config.get('balancing_strategy')
+
+    if balancing_strategy is not None:
+        try:
+            RemmeBalancingStrategy(balancing_strategy)
+        except ValueError:
+            raise Exception(
+                'You try construct with invalid `balancing_strategy`, available strategies are '
+                f'{", ".join(strategy.value for strategy in RemmeBalancingStrategy)}.'
+            )
+
+    hedging_percentile = network_config.get('hedging_percentile')
+
+    if hedging_percentile is not None \
+            and (isinstance(hedging_percentile, bool) or not isinstance(hedging_percentile, (int, float))
+                 or not 0 < hedging_percentile <= 100):
+        raise Exception(
+            'You try construct with invalid `hedging_percentile`, '
+            '`hedging_percentile` should be number greater than 0 and not greater than 100.'
+        )
+
+    pool_size = network_config.get('pool_size')
+
+    if pool_size is not None and (isinstance(pool_size, bool) or not isinstance(pool_size, int) or pool_size < 0):
+        raise Exception('You try construct with invalid `pool_size`, `pool_size` should be not negative integer.')
+
+    batch_size = network_config.get('batch_size')
+
+    if batch_size is not None and (isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size <= 0):
+        raise Exception('You try construct with invalid `batch_size`, `batch_size` should be positive integer.')
+
+    health_check_interval = network_config.get('pool_health_check_interval')
+
+    if health_check_interval is not None \
+            and (isinstance(health_check_interval, bool) or not isinstance(health_check_interval, (int, float))
+                 or health_check_interval <= 0):
+        raise Exception(
+            'You try construct with invalid `pool_health_check_interval`, '
+            '`pool_health_check_interval` should be positive number.'
+        )
+
 
 def sha512_hexdigest(data):
     return hashlib.sha512(data.encode('utf-8') if isinstance(data, str) else data).hexdigest()
@@ -1,18 +1,55 @@
+import asyncio
+import collections
 import json
 
-from aiohttp import ClientSession
+from aiohttp import (
+    ClientError,
+    ClientSession,
+    WSMsgType,
+)
 
 from remme.models.general.batch_status import BatchStatus
 from remme.models.interfaces.websocket import IRemmeWebSocket
 from remme.models.websocket.batch_info import BatchInfoDto
 from remme.models.websocket.block_info import BlockInfoDto
 from remme.models.websocket.events import RemmeEvents
+from remme.models.websocket.hub import get_event_info
 from remme.models.websocket.json_rpc_request import JsonRpcRequest
 from remme.models.websocket.methods import RemmeWebSocketMethods
+from remme.models.websocket.reconnect import (
+    DEFAULT_RECONNECT_INITIAL_DELAY,
+    DEFAULT_RECONNECT_MAX_DELAY,
+    get_reconnect_delay,
+)
+from remme.models.websocket.stream_metrics import RemmeStreamMetrics
 from remme.models.websocket.swap_info import SwapInfo
-from remme.models.websocket.transfer_info import TransferInfoDto
 from remme.utils import validate_node_config
 
+DEFAULT_DEDUPLICATION_WINDOW = 10000
+
+# Events, which subscription could be resumed from block with ``from_block`` parameter.
+RESUMABLE_EVENTS = (RemmeEvents.Blocks.value, RemmeEvents.AtomicSwap.value)
+
+
+def get_replay_key(event_type, event_info):
+    """
+    Get key of event, that is equal for the same event replayed after subscription is resumed from block.
+
+    Args:
+        event_type (string): type of events of subscription
+        event_info: information object of event
+
+    Returns:
+        Tuple or ``None`` for events, which subscription could not be resumed.
+    """
+    if event_type == RemmeEvents.Blocks.value:
+        return event_info.id,
+
+    if event_type == RemmeEvents.AtomicSwap.value:
+        return event_info.data.get('block_id'), event_info.swap_id, event_info.state
+
+    return None
+
 
 class RemmeWebSocket(IRemmeWebSocket):
     """
@@ -58,9 +95,12 @@ class RemmeWebSocket(IRemmeWebSocket):
                     "id":transaction_result.batch_id,
                 }
             )
+
+        Set ``web_socket_hub`` to receive events through connection shared with other subscriptions,
+        instead of opening own connection.
     """
 
-    _session, _socket, data = None, None, None
+    _session, _socket, _subscription, data, web_socket_hub = None, None, None, None, None
 
     def __init__(self, network_config):
         """
@@ -86,14 +126,7 @@ class RemmeWebSocket(IRemmeWebSocket):
 
     def _map(self, event, data):
 
-        events_data = {
-            RemmeEvents.Batch.value: BatchInfoDto(data=data),
-            RemmeEvents.Blocks.value: BlockInfoDto(data=data),
-            RemmeEvents.AtomicSwap.value: SwapInfo(data=data),
-            RemmeEvents.Transfer.value: TransferInfoDto(data=data),
-        }
-
-        return events_data.get(event)
+        return get_event_info(event_type=event, attributes=data)
 
     def _get_subscribe_url(self):
         """
@@ -141,6 +174,11 @@ class RemmeWebSocket(IRemmeWebSocket):
         Returns:
             Messages.
         """
+        if self.web_socket_hub is not None:
+            async for message in self._connect_to_web_socket_hub():
+                yield message
+            return
+
         self._session = ClientSession()
         self._socket = await self._session.ws_connect(self._get_subscribe_url())
 
@@ -148,6 +186,9 @@ class RemmeWebSocket(IRemmeWebSocket):
 
         async for msg in self._socket:
 
+            if msg.type != WSMsgType.TEXT:
+                continue
+
             response = json.loads(msg.data)
             result, error = response.get('result'), response.get('error')
 
@@ -165,10 +206,143 @@ class RemmeWebSocket(IRemmeWebSocket):
 
                 yield self._map(result.get('event_type'), result.get('attributes'))
 
+    async def _connect_to_web_socket_hub(self):
+
+        if not self.data:
+            raise Exception('Data for subscribe was not provided.')
+
+        self._subscription = await self.web_socket_hub.subscribe(params=self.data)
+
+        yield self._subscription.response
+
+        async for event_info in self._subscription:
+
+            if isinstance(event_info, BatchInfoDto) and event_info.status == BatchStatus.INVALID.value:
+                raise Exception(event_info.data)
+
+            yield event_info
+
+    async def _drop_connection(self):
+
+        if self._subscription is not None:
+            await self._subscription.close()
+
+        if self._socket is not None:
+            await self._socket.close()
+
+        if self._session is not None:
+            await self._session.close()
+
+        self._subscription, self._socket, self._session = None, None, None
+
+    async def stream(self, max_reconnects=None, initial_delay=DEFAULT_RECONNECT_INITIAL_DELAY,
+                     max_delay=DEFAULT_RECONNECT_MAX_DELAY, deduplication_window=DEFAULT_DEDUPLICATION_WINDOW,
+                     metrics=None):
+        """
+        Listen to events and connect again when connection is lost.
+        For this method you should set property data.
+
+        Delays between reconnections grow exponentially from ``initial_delay`` up to ``max_delay`` seconds,
+        with random jitter, and start again from ``initial_delay`` after successful subscription.
+        Subscriptions to ``blocks`` and ``atomic_swap`` events are resumed from the last seen block
+        (id of block event or ``block_id`` of swap event), or from ``last_known_block_id`` given for subscription, and events replayed after resumption are skipped
+        by block id, or by block id, swap id and state. Other events are never skipped, as equal events could be
+        different transfers, and their reconnections are counted as gaps in ``metrics``.
+
+        Args:
+            max_reconnects (integer, optional): maximum number of reconnections in a row, unlimited by default
+            initial_delay (float, optional): seconds before the first reconnection
+            max_delay (float, optional): maximum seconds between reconnections
+            deduplication_window (integer, optional): number of the last events remembered to skip replayed ones
+            metrics (RemmeStreamMetrics, optional): counters of reconnections, gaps and duplicates
+
+        Returns:
+            Events, without confirmations of subscription.
+
+        To use:
+            .. code-block:: python
+
+                metrics = RemmeStreamMetrics()
+
+                await remme.events.subscribe(event_type=RemmeEvents.Blocks.value)
+
+                async for block_info in remme.events.stream(metrics=metrics):
+                    print(block_info.id, metrics.reconnects, metrics.gaps)
+        """
+        if not self.data:
+            raise Exception('Data for subscribe was not provided.')
+
+        metrics = metrics if metrics is not None else RemmeStreamMetrics()
+
+        event_type = self.data.get('event_type')
+        metrics.last_block_id = self.data.get('from_block') or metrics.last_block_id
+
+        seen_events = collections.OrderedDict()
+        failed_attempts = 0
+        is_resumed = False
+
+        try:
+            while True:
+                try:
+                    async for message in self.connect_to_web_socket():
+
+                        if isinstance(message, dict):
+                            failed_attempts = 0
+                            continue
+
+                        if isinstance(message, BlockInfoDto):
+                            metrics.last_block_id = message.id
+
+                        elif isinstance(message, SwapInfo) and message.data.get('block_id'):
+                            metrics.last_block_id = message.data.get('block_id')
+
+                        key = get_replay_key(event_type=event_type, event_info=message)
+
+                        if key is not None:
+                            if is_resumed and key in seen_events:
+                                metrics.duplicates += 1
+                                continue
+
+                            seen_events[key] = True
+
+                            if len(seen_events) > deduplication_window:
+                                seen_events.popitem(last=False)
+
+                        yield message
+
+                except (ClientError, ConnectionError, asyncio.TimeoutError):
+                    pass
+
+                await self._drop_connection()
+
+                if max_reconnects is not None and failed_attempts >= max_reconnects:
+                    raise ConnectionError(f'Could not reconnect to the node at {self._get_subscribe_url()}.')
+
+                await asyncio.sleep(get_reconnect_delay(
+                    failed_attempts=failed_attempts, initial_delay=initial_delay, max_delay=max_delay,
+                ))
+
+                failed_attempts += 1
+                metrics.reconnects += 1
+
+                if event_type in RESUMABLE_EVENTS and metrics.last_block_id is not None:
+                    self.data = {**self.data, 'from_block': metrics.last_block_id}
+                    is_resumed = True
+                else:
+                    metrics.gaps += 1
+
+        finally:
+            await self._drop_connection()
+
     async def close_web_socket(self):
         """
         Call this method when your connection is open for close it.
         """
+        if self._subscription:
+            await self._subscription.close()
+            self._subscription = None
+            return
+
         if not self._socket:
             raise Exception('WebSocket is not running.')
 
@@ -179,11 +353,11 @@ class RemmeWebSocket(IRemmeWebSocket):
         self._socket, self._session = None, None
 
     async def __aenter__(self):
-        if not self._socket:
+        if not self._socket and not self._subscription:
             yield self.connect_to_web_socket()
         yield self._socket
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._socket:
+        if self._socket or self._subscription:
             await self.close_web_socket()
         return False
@@ -1,4 +1,10 @@
 from remme.models.interfaces.websocket_events import IRemmeWebSocketsEvents
+from remme.models.websocket.event_bus import RemmeEventBus
+from remme.models.websocket.hub import RemmeWebSocketHub
+from remme.models.websocket.reconnect import (
+    DEFAULT_RECONNECT_INITIAL_DELAY,
+    DEFAULT_RECONNECT_MAX_DELAY,
+)
 from remme.models.websocket.request_params import RemmeRequestParams
 from remme.websocket import RemmeWebSocket
 
@@ -78,3 +84,37 @@ class RemmeWebSocketEvents(RemmeWebSocket, IRemmeWebSocketsEvents):
         self.data = data
 
         await self.close_web_socket()
+
+    def create_event_bus(self, on_error=None, initial_delay=DEFAULT_RECONNECT_INITIAL_DELAY,
+                         max_delay=DEFAULT_RECONNECT_MAX_DELAY):
+        """
+        Create dispatcher of events to many handlers, that shares one connection to the node.
+        Connection of ``web_socket_hub`` is used if it is set, otherwise event bus opens its own.
+
+        Args:
+            on_error (callable, optional): function, that takes handler registration, event and exception
+            initial_delay (float, optional): seconds before the first subscription again after connection loss
+            max_delay (float, optional): maximum seconds between subscriptions again
+
+        Returns:
+            RemmeEventBus.
+
+        To use:
+            .. code-block:: python
+
+                event_bus = remme.events.create_event_bus()
+
+                await event_bus.on(RemmeEvents.Transfer, lambda transfer_info: print(transfer_info.data), address)
+        """
+        if self.web_socket_hub is not None:
+            return RemmeEventBus(
+                web_socket_hub=self.web_socket_hub, on_error=on_error, initial_delay=initial_delay, max_delay=max_delay,
+            )
+
+        return RemmeEventBus(
+            web_socket_hub=RemmeWebSocketHub(network_config=self.network_config),
+            on_error=on_error,
+            is_own_web_socket_hub=True,
+            initial_delay=initial_delay,
+            max_delay=max_delay,
+        )
@@ -0,0 +1,341 @@
+"""
+Provide tests for RemmeAPI implementation.
+"""
+import asyncio
+
+import aiohttp_json_rpc
+import pytest
+
+from remme.api import RemmeAPI
+from remme.models.general.methods import RemmeMethods
+from tests.utils import JsonRpcTestNode
+
+
+@pytest.mark.asyncio
+async def test_send_request_without_pool():
+    """
+    Case: send requests without pool of connections.
+    Expect: each request opens its own connection to the node.
+    """
+    node = await JsonRpcTestNode(methods={'get_balance': 100}).start()
+    remme_api = RemmeAPI({'node_address': node.address})
+
+    try:
+        for _ in range(3):
+            assert 100 == await remme_api.send_request(method=RemmeMethods.TOKEN)
+
+    finally:
+        await node.stop()
+
+    assert 3 == node.handshakes
+
+
+@pytest.mark.asyncio
+async def test_send_concurrent_requests_with_pool():
+    """
+    Case: send many concurrent requests with pool of connections.
+    Expect: responses are matched to requests and got through not more connections than pool size.
+    """
+    node = await JsonRpcTestNode(methods={'get_balance': lambda params: params.get('public_key_address')}).start()
+    remme_api = RemmeAPI({'node_address': node.address, 'pool_size': 3})
+
+    try:
+        responses = await asyncio.gather(*[
+            remme_api.send_request(method=RemmeMethods.TOKEN, params={'public_key_address': str(index)})
+            for index in range(300)
+        ])
+
+        await remme_api.close()
+
+    finally:
+        await node.stop()
+
+    assert [str(index) for index in range(300)] == responses
+    assert 3 >= node.handshakes
+
+
+@pytest.mark.asyncio
+async def test_pool_recycles_broken_connection():
+    """
+    Case: reuse pooled connection after it was closed.
+    Expect: broken connection is replaced by a new one.
+    """
+    node = await JsonRpcTestNode(methods={'get_balance': 100}).start()
+    remme_api = RemmeAPI({'node_address': node.address, 'pool_size': 1})
+
+    try:
+        await remme_api.send_request(method=RemmeMethods.TOKEN)
+
+        connection = await remme_api.nodes[0].connection_pool.acquire()
+        await connection.close()
+
+        assert 100 == await remme_api.send_request(method=RemmeMethods.TOKEN)
+
+        await remme_api.close()
+
+    finally:
+        await node.stop()
+
+    assert 2 == node.handshakes
+
+
+@pytest.mark.asyncio
+async def test_pool_discards_timed_out_connection():
+    """
+    Case: send request, that the node never answers, over pooled connection, then send another request.
+    Expect: request times out, its connection is discarded and the next request goes through a new one.
+    """
+    async def get_balance(params):
+        if params.get('public_key_address') == 'lost':
+            await asyncio.sleep(10)
+
+        return 100
+
+    node = await JsonRpcTestNode(methods={'get_balance': get_balance}).start()
+    remme_api = RemmeAPI({'node_address': node.address, 'pool_size': 1})
+
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            await remme_api.send_request(method=RemmeMethods.TOKEN, params={'public_key_address': 'lost'})
+
+        assert 100 == await remme_api.send_request(method=RemmeMethods.TOKEN, params={'public_key_address': 'ok'})
+        assert 1 == remme_api.nodes[0].connection_pool.opened
+
+        await remme_api.close()
+
+    finally:
+        await node.stop()
+
+    assert 2 == node.handshakes
+
+
+def test_create_remme_api_with_invalid_pool_size():
+    """
+    Case: create RemmeAPI with negative pool size.
+    Expect: invalid pool size error message.
+    """
+    expected_result = 'You try construct with invalid `pool_size`, `pool_size` should be not negative integer.'
+
+    with pytest.raises(Exception) as error:
+        RemmeAPI({'node_address': 'localhost:8080', 'pool_size': -1})
+
+    assert expected_result == str(error.value)
+
+
+@pytest.mark.asyncio
+async def test_send_batch():
+    """
+    Case: send many calls in chunked JSON-RPC batches.
+    Expect: results in order of calls, sent through one connection in one frame per chunk.
+    """
+    node = await JsonRpcTestNode(methods={
+        'get_balance': lambda params: int(params.get('public_key_address')),
+        'get_node_config': {'node_public_key': 'key'},
+    }).start()
+    remme_api = RemmeAPI({'node_address': node.address, 'batch_size': 4})
+
+    requests = [(RemmeMethods.TOKEN, {'public_key_address': str(index)}) for index in range(10)]
+    requests.append((RemmeMethods.NODE_CONFIG, None))
+
+    try:
+        results = await remme_api.send_batch(requests)
+
+    finally:
+        await node.stop()
+
+    assert list(range(10)) + [{'node_public_key': 'key'}] == results
+    assert 1 == node.handshakes
+    assert 11 == len(node.requests)
+
+
+@pytest.mark.asyncio
+async def test_send_batch_with_failed_call():
+    """
+    Case: send batch where one of calls fails.
+    Expect: error is raised, or returned in place of failed call with return exceptions flag.
+    """
+    node = await JsonRpcTestNode(methods={'get_balance': 100}).start()
+    remme_api = RemmeAPI({'node_address': node.address})
+
+    requests = [(RemmeMethods.TOKEN, None), (RemmeMethods.FETCH_BLOCK, {'id': 'id'})]
+
+    try:
+        with pytest.raises(aiohttp_json_rpc.RpcMethodNotFoundError):
+            await remme_api.send_batch(requests)
+
+        results = await remme_api.send_batch(requests, return_exceptions=True)
+
+    finally:
+        await node.stop()
+
+    assert 100 == results[0]
+    assert isinstance(results[1], aiohttp_json_rpc.RpcMethodNotFoundError)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_requests_over_one_connection():
+    """
+    Case: send many concurrent requests over one connection, while node responds in another order.
+    Expect: each response is matched to its request by collision-free identifier.
+    """
+    async def get_balance(params):
+        await asyncio.sleep(0.001 * (50 - int(params.get('public_key_address'))))
+        return params.get('public_key_address')
+
+    node = await JsonRpcTestNode(methods={'get_balance': get_balance}).start()
+    remme_api = RemmeAPI({'node_address': node.address, 'pool_size': 1})
+
+    try:
+        responses = await asyncio.gather(*[
+            remme_api.send_request(method=RemmeMethods.TOKEN, params={'public_key_address': str(index)})
+            for index in range(50)
+        ])
+
+        await remme_api.close()
+
+    finally:
+        await node.stop()
+
+    assert [str(index) for index in range(50)] == responses
+    assert 1 == node.handshakes
+    assert 50 == len({request.get('id') for request in node.requests})
+
+
+@pytest.mark.asyncio
+async def test_spread_reads_across_nodes():
+    """
+    Case: send reads and writes to client with several nodes.
+    Expect: reads are spread across nodes in round-robin, writes go to the primary node.
+    """
+    first_node = await JsonRpcTestNode(methods={'get_balance': 1, 'send_raw_transaction': 'batch'}).start()
+    second_node = await JsonRpcTestNode(methods={'get_balance': 2, 'send_raw_transaction': 'batch'}).start()
+
+    remme_api = RemmeAPI({'nodes': [first_node.address, second_node.address]})
+
+    try:
+        balances = [await remme_api.send_request(method=RemmeMethods.TOKEN) for _ in range(4)]
+
+        for _ in range(2):
+            await remme_api.send_request(method=RemmeMethods.TRANSACTION, params={'data': 'transaction'})
+
+        await remme_api.close()
+
+    finally:
+        await first_node.stop()
+        await second_node.stop()
+
+    assert [1, 2, 1, 2] == balances
+    assert first_node.address == remme_api.network_config.get('node_address')
+    assert 4 == len(first_node.requests)
+    assert 2 == len(second_node.requests)
+
+
+@pytest.mark.asyncio
+async def test_eject_unavailable_node():
+    """
+    Case: send reads to client with several nodes, where one of nodes is unavailable.
+    Expect: reads are retried on available node and unavailable node is ejected.
+    """
+    available_node = await JsonRpcTestNode(methods={'get_balance': 100}).start()
+    unavailable_node = await JsonRpcTestNode().start()
+    await unavailable_node.stop()
+
+    remme_api = RemmeAPI({
+        'nodes': [unavailable_node.address, available_node.address],
+        'balancing_strategy': 'least_outstanding',
+    })
+
+    try:
+        balances = [await remme_api.send_request(method=RemmeMethods.TOKEN) for _ in range(3)]
+
+        await remme_api.close()
+
+    finally:
+        await available_node.stop()
+
+    assert [100, 100, 100] == balances
+    assert remme_api.nodes[0].is_ejected
+    assert not remme_api.nodes[1].is_ejected
+
+
+@pytest.mark.asyncio
+async def test_send_requests_of_node_only_to_primary_node():
+    """
+    Case: send node config requests and reads to client with several nodes, where the primary node is unavailable.
+    Expect: node config requests fail without going to other nodes or ejecting the primary node,
+        reads are retried on available node and eject the primary node only from reads.
+    """
+    available_node = await JsonRpcTestNode(methods={'get_balance': 100, 'get_node_config': {}}).start()
+    primary_node = await JsonRpcTestNode().start()
+    await primary_node.stop()
+
+    remme_api = RemmeAPI({'nodes': [primary_node.address, available_node.address]})
+
+    try:
+        with pytest.raises(Exception):
+            await remme_api.send_request(method=RemmeMethods.NODE_CONFIG)
+
+        assert not remme_api.nodes[0].is_ejected
+
+        assert 100 == await remme_api.send_request(method=RemmeMethods.TOKEN)
+        assert remme_api.nodes[0].is_ejected
+
+        with pytest.raises(Exception):
+            await remme_api.send_request(method=RemmeMethods.NODE_CONFIG)
+
+        await remme_api.close()
+
+    finally:
+        await available_node.stop()
+
+    assert ['get_balance'] == [request.get('method') for request in available_node.requests]
+
+
+def test_create_remme_api_with_invalid_balancing_strategy():
+    """
+    Case: create RemmeAPI with unknown balancing strategy.
+    Expect: invalid balancing strategy error message.
+    """
+    expected_result = 'You try construct with invalid `balancing_strategy`, available strategies are ' \
+                      'round_robin, least_outstanding, ewma_latency.'
+
+    with pytest.raises(Exception) as error:
+        RemmeAPI({'nodes': ['localhost:8080', 'localhost:8081'], 'balancing_strategy': 'random'})
+
+    assert expected_result == str(error.value)
+
+
+@pytest.mark.asyncio
+async def test_hedge_slow_read():
+    """
+    Case: send reads with hedging to client with several nodes, where one of nodes is slow.
+    Expect: slow reads are also sent to another node and its answer wins.
+    """
+    async def get_slow_balance(params):
+        await asyncio.sleep(1)
+        return 1
+
+    slow_node = await JsonRpcTestNode(methods={'get_balance': get_slow_balance}).start()
+    fast_node = await JsonRpcTestNode(methods={'get_balance': 2}).start()
+
+    remme_api = RemmeAPI({
+        'nodes': [fast_node.address, slow_node.address],
+        'pool_size': 1,
+        'hedging_percentile': 50,
+    })
+
+    for _ in range(20):
+        remme_api.hedging_policy.record(latency=0.01)
+
+    try:
+        balances = [await remme_api.send_request(method=RemmeMethods.TOKEN) for _ in range(4)]
+
+        await remme_api.close()
+
+    finally:
+        await fast_node.stop()
+        await slow_node.stop()
+
+    assert [2, 2, 2, 2] == balances
+    assert 2 == remme_api.hedging_policy.hedged
+    assert 2 == remme_api.hedging_policy.hedge_wins
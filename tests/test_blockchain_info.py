@@ -0,0 +1,444 @@
+"""
+Provide tests for RemmeBlockchainInfo implementation.
+"""
+import asyncio
+import base64
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from remme import protobuf
+from remme.api import RemmeAPI
+from remme.blockchain_info import RemmeBlockchainInfo
+from remme.models.blockchain_info.address_index import RemmeAddressIndex
+from remme.models.blockchain_info.block_store import RemmeBlockStore
+from remme.models.blockchain_info.columnar_exporter import RemmeColumnarExporter
+from remme.models.utils.namespace import RemmeNamespace
+from remme.utils import generate_address
+from tests.utils import (
+    ChainTestData,
+    JsonRpcTestNode,
+    get_header_signature,
+)
+
+
+@pytest.mark.asyncio
+async def test_iter_blocks_through_all_pages():
+    """
+    Case: iterate over blocks of chain which does not fit into one page.
+    Expect: all blocks from the newest to the oldest, requested page by page from the same head.
+    """
+    chain = ChainTestData(blocks_count=25)
+
+    node = await JsonRpcTestNode(methods={'list_blocks': chain.list_blocks}).start()
+
+    remme_blockchain_info = RemmeBlockchainInfo(RemmeAPI({'node_address': node.address}))
+
+    try:
+        blocks = [block async for block in remme_blockchain_info.iter_blocks(page_size=10)]
+
+    finally:
+        await node.stop()
+
+    assert list(reversed(chain.blocks)) == blocks
+    assert [None, chain.blocks[-1].get('header_signature'), chain.blocks[-1].get('header_signature')] == [
+        request.get('params').get('head') for request in node.requests
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_range_in_order():
+    """
+    Case: export range of blocks in segments fetched concurrently, with node limiting size of pages.
+    Expect: blocks of the range in ascending order of block numbers.
+    """
+    chain = ChainTestData(blocks_count=50)
+
+    def list_blocks(params):
+        return chain.list_blocks(params={**params, 'limit': min(params.get('limit'), 3)})
+
+    node = await JsonRpcTestNode(methods={'list_blocks': list_blocks}).start()
+
+    remme_api = RemmeAPI({'node_address': node.address, 'pool_size': 2})
+    remme_blockchain_info = RemmeBlockchainInfo(remme_api)
+
+    try:
+        blocks = [
+            block async for block in remme_blockchain_info.export_range(
+                start_block=5, end_block=41, concurrency=3, segment_size=7,
+            )
+        ]
+
+    finally:
+        await remme_api.close()
+        await node.stop()
+
+    assert chain.blocks[5:42] == blocks
+
+
+@pytest.mark.asyncio
+async def test_sync_block_store_incrementally_and_after_fork():
+    """
+    Case: sync block store, then sync again after new blocks and after reorganization of the chain.
+    Expect: store contains blocks of the current chain with their transactions and receipts.
+    """
+    chain = ChainTestData(blocks_count=12)
+
+    node = await JsonRpcTestNode(methods={
+        'list_blocks': chain.list_blocks,
+        'list_receipts': chain.list_receipts,
+    }).start()
+
+    block_store = RemmeBlockStore(RemmeBlockchainInfo(RemmeAPI({'node_address': node.address})))
+
+    try:
+        first_sync_count = await block_store.sync()
+
+        chain.add_blocks(count=3)
+        second_sync_count = await block_store.sync()
+
+        chain.fork(block_num=13, count=4)
+        third_sync_count = await block_store.sync()
+
+        last_transaction_id = chain.blocks[-1].get('batches')[0].get('transactions')[0].get('header_signature')
+
+        assert [12, 3, 4] == [first_sync_count, second_sync_count, third_sync_count]
+        assert 16 == block_store.head_block_num
+        assert chain.blocks[13] == block_store.get_block_by_num(block_num=13)
+        assert chain.blocks[-1].get('batches')[0].get('transactions')[0] == block_store.get_transaction(
+            transaction_id=last_transaction_id,
+        )
+        assert block_store.get_receipt(transaction_id=last_transaction_id) is not None
+
+    finally:
+        block_store.close()
+        await node.stop()
+
+
+@pytest.mark.asyncio
+async def test_sync_block_store_after_failed_receipts():
+    """
+    Case: sync block store, while receipts could not be fetched, then sync again.
+    Expect: blocks are not stored without receipts, the next sync stores them with their receipts.
+    """
+    chain = ChainTestData(blocks_count=5)
+    receipts_calls = []
+
+    def list_receipts(params):
+        receipts_calls.append(params)
+
+        if len(receipts_calls) == 1:
+            raise Exception('Receipts are not available.')
+
+        return chain.list_receipts(params)
+
+    node = await JsonRpcTestNode(methods={
+        'list_blocks': chain.list_blocks,
+        'list_receipts': list_receipts,
+    }).start()
+
+    block_store = RemmeBlockStore(RemmeBlockchainInfo(RemmeAPI({'node_address': node.address})))
+
+    try:
+        with pytest.raises(Exception):
+            await block_store.sync()
+
+        assert block_store.head_block_num is None
+
+        sync_count = await block_store.sync()
+
+        first_transaction_id = chain.blocks[0].get('batches')[0].get('transactions')[0].get('header_signature')
+
+        assert 5 == sync_count
+        assert 4 == block_store.head_block_num
+        assert block_store.get_receipt(transaction_id=first_transaction_id) is not None
+
+    finally:
+        block_store.close()
+        await node.stop()
+
+
+@pytest.mark.asyncio
+async def test_transactions_for_address():
+    """
+    Case: sync block store with address index, where transfers touch addresses in headers and payloads.
+    Expect: transactions touching address since the given block, including ones only with address in payload.
+    """
+    chain = ChainTestData(blocks_count=10)
+
+    sender, receiver = '0' * 70, '1' * 70
+
+    for block in chain.blocks:
+        transaction = block.get('batches')[0].get('transactions')[0]
+        block_num = int(block.get('header').get('block_num'))
+
+        transaction.get('header').update({'inputs': [sender], 'outputs': [sender]})
+        transaction['payload'] = base64.b64encode(protobuf.TransactionPayload(
+            method=protobuf.AccountMethod.TRANSFER,
+            data=protobuf.TransferPayload(address_to=receiver if block_num % 2 else sender).SerializeToString(),
+        ).SerializeToString()).decode('utf-8')
+
+    node = await JsonRpcTestNode(methods={'list_blocks': chain.list_blocks}).start()
+
+    block_store = RemmeBlockStore(RemmeBlockchainInfo(RemmeAPI({'node_address': node.address})), with_receipts=False)
+    address_index = RemmeAddressIndex(block_store)
+
+    try:
+        await block_store.sync()
+
+        expected = [
+            block.get('batches')[0].get('transactions')[0].get('header_signature') for block in chain.blocks[5::2]
+        ]
+
+        assert expected == address_index.transactions_for_address(address=receiver, since=4)
+        assert 10 == len(address_index.transactions_for_address(address=sender))
+
+    finally:
+        block_store.close()
+        await node.stop()
+
+
+def create_transfer_transaction(address_to):
+    return {
+        'header': {'family_name': 'account'},
+        'payload': base64.b64encode(protobuf.TransactionPayload(
+            method=protobuf.AccountMethod.TRANSFER,
+            data=protobuf.TransferPayload(address_to=address_to, value=1).SerializeToString(),
+        ).SerializeToString()).decode('utf-8'),
+    }
+
+
+@pytest.mark.asyncio
+async def test_parse_transaction_payloads_concurrently():
+    """
+    Case: parse payloads of several transactions concurrently, one by one and in bulk in worker processes.
+    Expect: each result has payload of its own transaction, unsupported family is returned as exception.
+    """
+    remme_blockchain_info = RemmeBlockchainInfo(remme_api=None)
+
+    addresses = [f'{index:070x}' for index in range(20)]
+    transactions = [create_transfer_transaction(address_to=address) for address in addresses]
+
+    parsed_transactions = await asyncio.gather(*[
+        remme_blockchain_info.parse_transaction_payload(transaction=transaction) for transaction in transactions
+    ])
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        bulk_parsed_transactions = await remme_blockchain_info.parse_many(
+            transactions=transactions + [{'header': {'family_name': 'unknown'}, 'payload': ''}],
+            executor=executor,
+            chunk_size=6,
+            return_exceptions=True,
+        )
+
+    assert addresses == [parsed.get('payload').address_to for parsed in parsed_transactions]
+    assert addresses == [parsed.get('payload').get('address_to') for parsed in bulk_parsed_transactions[:-1]]
+    assert {'transfer token'} == {parsed.get('type') for parsed in bulk_parsed_transactions[:-1]}
+    assert isinstance(bulk_parsed_transactions[-1], Exception)
+    assert bulk_parsed_transactions[:-1] == await remme_blockchain_info.parse_many(transactions=transactions)
+
+
+@pytest.mark.asyncio
+async def test_export_transactions_into_columnar_chunks():
+    """
+    Case: export transfers of blocks range into columnar chunks.
+    Expect: chunks of chunk size transactions in blocks order, with timestamp, amount, sender and receiver columns,
+        information about blocks is requested once for each chunk.
+    """
+    chain = ChainTestData(blocks_count=10)
+
+    signer = '03' + '1' * 64
+
+    for block in chain.blocks:
+        block_num = int(block.get('header').get('block_num'))
+
+        transaction = block.get('batches')[0].get('transactions')[0]
+        transaction.get('header')['signer_public_key'] = signer
+        transaction['payload'] = create_transfer_transaction(address_to=f'{block_num:070x}').get('payload')
+
+    node = await JsonRpcTestNode(methods={
+        'list_blocks': chain.list_blocks,
+        'get_blocks': chain.get_blocks_info,
+    }).start()
+
+    remme_blockchain_info = RemmeBlockchainInfo(RemmeAPI({'node_address': node.address}))
+
+    try:
+        chunks = [
+            chunk async for chunk in RemmeColumnarExporter(remme_blockchain_info, chunk_size=4).iter_chunks(
+                blocks=remme_blockchain_info.export_range(start_block=0, end_block=9, segment_size=3),
+            )
+        ]
+
+    finally:
+        await node.stop()
+
+    assert [4, 4, 2] == [len(chunk['block_num']) for chunk in chunks]
+    assert list(range(10)) == [int(block_num) for chunk in chunks for block_num in chunk['block_num']]
+    assert list(range(1000, 1010)) == [int(timestamp) for chunk in chunks for timestamp in chunk['timestamp']]
+    assert 3 == len([request for request in node.requests if request.get('method') == 'get_blocks'])
+    assert [f'{index:070x}' for index in range(10)] == [str(to) for chunk in chunks for to in chunk['to']]
+    assert 10 == sum(int(amount) for chunk in chunks for amount in chunk['amount'])
+    assert {generate_address('account', signer)} == {str(from_) for chunk in chunks for from_ in chunk['from']}
+
+
+@pytest.mark.asyncio
+async def test_export_columnar_chunks_with_limited_blocks_info():
+    """
+    Case: export blocks into columnar chunks from node, that returns information about at most 3 blocks at once,
+        then from node without information about the last block.
+    Expect: information about blocks is requested page by page, missing information about block fails export.
+    """
+    chain = ChainTestData(blocks_count=10)
+
+    def get_limited_blocks_info(params):
+        return chain.get_blocks_info({**params, 'limit': min(params.get('limit'), 3)})
+
+    def get_incomplete_blocks_info(params):
+        return [block_info for block_info in chain.get_blocks_info(params) if block_info.get('block_number') != 9]
+
+    limited_node = await JsonRpcTestNode(methods={
+        'list_blocks': chain.list_blocks,
+        'get_blocks': get_limited_blocks_info,
+    }).start()
+    incomplete_node = await JsonRpcTestNode(methods={
+        'list_blocks': chain.list_blocks,
+        'get_blocks': get_incomplete_blocks_info,
+    }).start()
+
+    limited_blockchain_info = RemmeBlockchainInfo(RemmeAPI({'node_address': limited_node.address}))
+    incomplete_blockchain_info = RemmeBlockchainInfo(RemmeAPI({'node_address': incomplete_node.address}))
+
+    try:
+        chunks = [
+            chunk async for chunk in RemmeColumnarExporter(limited_blockchain_info, chunk_size=10).iter_chunks(
+                blocks=limited_blockchain_info.export_range(start_block=0, end_block=9),
+            )
+        ]
+
+        with pytest.raises(Exception) as error:
+            async for _ in RemmeColumnarExporter(incomplete_blockchain_info, chunk_size=10).iter_chunks(
+                blocks=incomplete_blockchain_info.export_range(start_block=0, end_block=9),
+            ):
+                pass
+
+    finally:
+        await limited_node.stop()
+        await incomplete_node.stop()
+
+    assert list(range(1000, 1010)) == [int(timestamp) for chunk in chunks for timestamp in chunk['timestamp']]
+    assert [(0, 10), (3, 7), (6, 4), (9, 1)] == [
+        (request.get('params').get('start'), request.get('params').get('limit'))
+        for request in limited_node.requests if request.get('method') == 'get_blocks'
+    ]
+    assert f'Information about block {chain.blocks[9].get("header_signature")} was not found.' == str(error.value)
+
+
+def list_states(states, params):
+    """
+    Serve page of states with address prefix like ``list_state`` of a node.
+    """
+    prefix = params.get('address') or ''
+    limit = params.get('limit') or 100
+
+    addresses = sorted(address for address in states if address.startswith(prefix))
+
+    if params.get('start'):
+        addresses = addresses[addresses.index(params.get('start')):]
+
+    return {
+        'data': [{'address': address, 'data': states.get(address)} for address in addresses[:limit]],
+        'head': get_header_signature(prefix='a', number=0),
+        'paging': {'next_position': addresses[limit] if len(addresses) > limit else None},
+    }
+
+
+@pytest.mark.asyncio
+async def test_scan_namespace_in_worker_processes():
+    """
+    Case: scan accounts namespace, where states of accounts and atomic swaps are stored, decoding in worker processes.
+    Expect: decoded accounts only, in order of addresses, requested page by page, the same as decoded inline.
+    """
+    states = {
+        f'{RemmeNamespace.ACCOUNT.value}{index:064x}': base64.b64encode(
+            protobuf.Account(balance=index).SerializeToString(),
+        ).decode('utf-8') for index in range(25)
+    }
+
+    states[f'{RemmeNamespace.SWAP.value}{0:064x}'] = base64.b64encode(
+        protobuf.AtomicSwapInfo(amount=1).SerializeToString(),
+    ).decode('utf-8')
+
+    node = await JsonRpcTestNode(methods={'list_state': lambda params: list_states(states, params)}).start()
+
+    remme_blockchain_info = RemmeBlockchainInfo(RemmeAPI({'node_address': node.address}))
+
+    try:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            accounts = [
+                account async for account in remme_blockchain_info.scan_namespace(
+                    namespace=RemmeNamespace.ACCOUNT, page_size=10, executor=executor, chunk_size=4, concurrency=2,
+                )
+            ]
+
+        inline_accounts = [
+            account async for account in remme_blockchain_info.scan_namespace(namespace=RemmeNamespace.ACCOUNT)
+        ]
+
+        with pytest.raises(Exception):
+            async for _ in remme_blockchain_info.scan_namespace(namespace=RemmeNamespace.CONSENSUS_ACCOUNT):
+                pass
+
+    finally:
+        await node.stop()
+
+    assert sorted(address for address in states if address.startswith(RemmeNamespace.ACCOUNT.value)) == [
+        account.get('address') for account in accounts
+    ]
+    assert list(range(25)) == [account.get('data').get('balance') for account in accounts]
+    assert accounts == inline_accounts
+    assert {'account'} == {account.get('type') for account in accounts}
+
+
+@pytest.mark.asyncio
+async def test_get_receipts_bulk_with_retries():
+    """
+    Case: get receipts of many transactions in chunks, where each chunk fails on the first request.
+    Expect: receipts of all transactions, requested by chunks of chunk size with at most concurrency at once.
+    """
+    ids = [get_header_signature(prefix='c', number=index) for index in range(25)]
+
+    requested_chunks = []
+    failed_chunks = set()
+
+    async def list_receipts(params):
+        chunk = tuple(params.get('ids'))
+        requested_chunks.append(chunk)
+
+        if chunk not in failed_chunks:
+            failed_chunks.add(chunk)
+            raise Exception('Node is busy.')
+
+        await asyncio.sleep(0.01)
+
+        return {'data': [{'transaction_id': transaction_id} for transaction_id in chunk]}
+
+    node = await JsonRpcTestNode(methods={'list_receipts': list_receipts}).start()
+
+    remme_blockchain_info = RemmeBlockchainInfo(RemmeAPI({'node_address': node.address}))
+
+    try:
+        receipts = [
+            receipt async for receipt in remme_blockchain_info.get_receipts_bulk(ids=ids, chunk_size=10, concurrency=2)
+        ]
+
+        with pytest.raises(Exception):
+            async for _ in remme_blockchain_info.get_receipts_bulk(ids=ids + ['id']):
+                pass
+
+    finally:
+        await node.stop()
+
+    assert sorted(ids) == sorted(receipt.get('transaction_id') for receipt in receipts)
+    assert [10, 10, 5] == sorted((len(chunk) for chunk in set(requested_chunks)), reverse=True)
+    assert 6 == len(requested_chunks)
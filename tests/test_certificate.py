@@ -1,12 +1,17 @@
 """
 Provide tests to implement certificate creation.
 """
+import asyncio
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from cryptography import x509
 
 from remme import Remme
+from remme.certificate import RemmeCertificate
+from remme.models.keys.key_pool import RemmeKeyPool
+from remme.models.keys.key_type import KeyType
 
 remme = Remme(account_config={'private_key_hex': 'f4f551c178104595ff184f1786ddb2bfdc74b24562611edcab90d4729fb4bab8'})
 
@@ -28,3 +33,34 @@ async def test_create_certificate():
     })
 
     assert isinstance(certificate, x509.Certificate)
+
+
+@pytest.mark.asyncio
+async def test_create_certificate_with_key_pool():
+    """
+    Case: create certificates with key pool that has ready key pairs.
+    Expect: key pairs are taken from the pool, which is topped up again in background.
+    """
+    key_pool = RemmeKeyPool(key_type=KeyType.RSA, low_watermark=1, high_watermark=2, executor=ThreadPoolExecutor())
+    certificate_service = RemmeCertificate(remme.public_key_storage, key_pool=key_pool.start())
+
+    while key_pool.depth < 2:
+        await asyncio.sleep(0.05)
+
+    certificate = certificate_service.create({'common_name': 'user_name', 'validity': 360})
+
+    key_pool.close()
+
+    assert isinstance(certificate, x509.Certificate)
+    assert 1 == key_pool.hits and 0 == key_pool.misses
+
+
+def test_key_pool_with_invalid_watermarks():
+    """
+    Case: create key pool with low watermark greater than high watermark.
+    Expect: exception is raised.
+    """
+    with pytest.raises(Exception) as error:
+        RemmeKeyPool(low_watermark=5, high_watermark=2)
+
+    assert 'Low watermark should be not negative integer not greater than high watermark.' == str(error.value)
@@ -3,6 +3,7 @@ Provide tests for Remme keys implementation.
 """
 import pytest
 import re
+from concurrent.futures import ProcessPoolExecutor
 
 from remme.keys import RemmeKeys as keys
 from remme.models.general.patterns import RemmePatterns
@@ -106,3 +107,51 @@ def test_construct_with_public_key(key_type, class_type, public_key):
     remme_keys_object = keys.construct(key_type=key_type)
 
     assert isinstance(remme_keys_object, class_type)
+
+
+def test_ecdsa_sign_and_verify_bytes():
+    """
+    Case: sign data with ECDSA (secp256k1) bytes fast path and verify it with both paths.
+    Expect: the same signature as hex signing, verified by public key only.
+    """
+    key = ECDSA(private_key=bytes.fromhex(PRIVATE_KEY_HEX_ECDSA))
+    public_key = ECDSA(public_key=bytes.fromhex(PUBLIC_KEY_HEX_ECDSA))
+
+    signature = key.sign_bytes(data=b'data')
+
+    assert signature.hex() == key.sign(data='data')
+    assert public_key.verify_bytes(data=b'data', signature=signature)
+    assert public_key.verify(data='data', signature=signature.hex())
+    assert not public_key.verify_bytes(data=b'other data', signature=signature)
+    assert not public_key.verify(data='data', signature='not hex')
+
+
+@pytest.mark.parametrize('key_type', [KeyType.RSA, KeyType.ECDSA, KeyType.EdDSA])
+def test_verify_many(key_type):
+    """
+    Case: verify many signatures of several keys, with some of them not matching data or with public key,
+        that is not hex, in worker processes.
+    Expect: verification results in the same order as signatures, ``False`` for unparsable public key.
+    """
+    constructed_keys = [keys.construct(key_type=key_type) for _ in range(2)]
+
+    items, expected = [], []
+
+    for index in range(6):
+        key = constructed_keys[index % 2]
+        data = f'data {index}'
+        signature = key.sign(data=data)
+
+        is_valid = index % 3 != 0
+
+        items.append((key.public_key if index % 2 else key.public_key_hex, data if is_valid else 'other', signature))
+        expected.append(is_valid)
+
+    items.append(('not hex', 'data', constructed_keys[0].sign(data='data')))
+    expected.append(False)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = keys.verify_many(items=items, key_type=key_type, executor=executor, chunk_size=2)
+
+    assert expected == results
+    assert expected == keys.verify_many(items=items, key_type=key_type)
@@ -0,0 +1,267 @@
+"""
+Provide tests for RemmeTransactionService implementation.
+"""
+import asyncio
+import base64
+from concurrent.futures import ProcessPoolExecutor
+
+import aiohttp_json_rpc
+import pytest
+from sawtooth_sdk.protobuf.transaction_pb2 import Transaction
+
+from remme.account import RemmeAccount
+from remme.api import RemmeAPI
+from remme.models.transaction_service.nonce_mode import RemmeNonceMode
+from remme.models.transaction_service.nonce_provider import create_nonce_provider
+from remme.transaction_service import RemmeTransactionService
+from tests.utils import (
+    PRIVATE_KEY_HEX_ECDSA,
+    PUBLIC_KEY_HEX_ECDSA,
+    JsonRpcTestNode,
+    get_header_signature,
+)
+
+
+def get_node_config_requests(node):
+    return [request for request in node.requests if request.get('method') == 'get_node_config']
+
+
+@pytest.mark.asyncio
+async def test_create_transactions_with_cached_node_config():
+    """
+    Case: create several transactions.
+    Expect: node config is requested from the node only once.
+    """
+    node = await JsonRpcTestNode(methods={'get_node_config': {'node_public_key': PUBLIC_KEY_HEX_ECDSA}}).start()
+
+    remme_api = RemmeAPI({'node_address': node.address})
+    remme_transaction = RemmeTransactionService(remme_api, RemmeAccount(private_key_hex=PRIVATE_KEY_HEX_ECDSA))
+
+    try:
+        transactions = [
+            await remme_transaction.create(
+                family_name='account', family_version='0.1', inputs=[], outputs=[], payload_bytes=b'payload',
+            ) for _ in range(3)
+        ]
+
+    finally:
+        await node.stop()
+
+    assert 3 == len(transactions)
+    assert 1 == len(get_node_config_requests(node=node))
+
+
+@pytest.mark.asyncio
+async def test_invalidate_node_config_when_transaction_rejected():
+    """
+    Case: send transaction that node rejects.
+    Expect: node config is requested again for the next transaction.
+    """
+    node = await JsonRpcTestNode(methods={'get_node_config': {'node_public_key': PUBLIC_KEY_HEX_ECDSA}}).start()
+
+    remme_api = RemmeAPI({'node_address': node.address})
+    remme_transaction = RemmeTransactionService(remme_api, RemmeAccount(private_key_hex=PRIVATE_KEY_HEX_ECDSA))
+
+    try:
+        transaction = await remme_transaction.create(
+            family_name='account', family_version='0.1', inputs=[], outputs=[], payload_bytes=b'payload',
+        )
+
+        with pytest.raises(aiohttp_json_rpc.RpcError):
+            await remme_transaction.send(payload=transaction)
+
+        await remme_transaction.create(
+            family_name='account', family_version='0.1', inputs=[], outputs=[], payload_bytes=b'payload',
+        )
+
+    finally:
+        await node.stop()
+
+    assert 2 == len(get_node_config_requests(node=node))
+
+
+@pytest.mark.asyncio
+async def test_send_transactions_with_batch_builder():
+    """
+    Case: add more transactions to batch builder than fit into one JSON-RPC batch, one of them is rejected.
+    Expect: transactions are sent over one connection, each transaction knows its batch,
+        rejected transaction fails alone and drops cached node config.
+    """
+    def send_raw_transaction(params):
+        transaction = Transaction.FromString(base64.b64decode(params.get('data')))
+
+        if transaction.payload == b'rejected':
+            raise Exception('Transaction is rejected.')
+
+        return get_header_signature(prefix='b', number=int(transaction.payload))
+
+    node = await JsonRpcTestNode(methods={
+        'get_node_config': {'node_public_key': PUBLIC_KEY_HEX_ECDSA},
+        'send_raw_transaction': send_raw_transaction,
+    }).start()
+
+    remme_api = RemmeAPI({'node_address': node.address})
+    remme_transaction = RemmeTransactionService(remme_api, RemmeAccount(private_key_hex=PRIVATE_KEY_HEX_ECDSA))
+
+    batch_builder = remme_transaction.create_batch_builder(max_batch_size=2, flush_interval=60)
+
+    try:
+        transactions = [
+            await remme_transaction.create(
+                family_name='account', family_version='0.1', inputs=[], outputs=[], payload_bytes=payload_bytes,
+            ) for payload_bytes in (b'0', b'1', b'rejected')
+        ]
+        handshakes = node.handshakes
+
+        results = [batch_builder.add(transaction=transaction) for transaction in transactions]
+        await batch_builder.close()
+        handshakes = node.handshakes - handshakes
+
+        await remme_transaction.create(
+            family_name='account', family_version='0.1', inputs=[], outputs=[], payload_bytes=b'payload',
+        )
+
+    finally:
+        await node.stop()
+
+    batch_ids = [get_header_signature(prefix='b', number=number) for number in range(2)]
+    transaction_id = Transaction.FromString(base64.b64decode(transactions[1])).header_signature
+
+    assert 1 == handshakes
+    assert batch_ids == [result.result().batch_id for result in results[:2]]
+    assert isinstance(results[2].exception(), aiohttp_json_rpc.RpcError)
+    assert batch_ids[1] == batch_builder.get_batch_id(transaction_id)
+    assert 2 == len(get_node_config_requests(node=node))
+
+
+@pytest.mark.asyncio
+async def test_create_many_transactions_in_process_pool():
+    """
+    Case: create many transactions with signing in worker processes.
+    Expect: transactions are returned in order of specs and are signed by the account.
+    """
+    node = await JsonRpcTestNode(methods={'get_node_config': {'node_public_key': PUBLIC_KEY_HEX_ECDSA}}).start()
+
+    remme_api = RemmeAPI({'node_address': node.address})
+    remme_account = RemmeAccount(private_key_hex=PRIVATE_KEY_HEX_ECDSA)
+    remme_transaction = RemmeTransactionService(remme_api, remme_account)
+
+    specs = [{
+        'family_name': 'account',
+        'family_version': '0.1',
+        'inputs': [],
+        'outputs': [],
+        'payload_bytes': str(index).encode('utf-8'),
+    } for index in range(10)]
+
+    try:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            transactions = await remme_transaction.create_many(specs=specs, executor=executor, chunk_size=3)
+
+    finally:
+        await node.stop()
+
+    transactions = [Transaction.FromString(base64.b64decode(transaction)) for transaction in transactions]
+
+    assert [spec.get('payload_bytes') for spec in specs] == [transaction.payload for transaction in transactions]
+    assert all(remme_account.verify(transaction.header, transaction.header_signature) for transaction in transactions)
+    assert 1 == len(get_node_config_requests(node=node))
+
+
+@pytest.mark.parametrize('mode', [RemmeNonceMode.COUNTER, RemmeNonceMode.RANDOM])
+def test_nonce_provider_gives_unique_nonces(mode):
+    """
+    Case: get nonces one by one and in bulk from nonce provider.
+    Expect: all nonces are different.
+    """
+    nonce_provider = create_nonce_provider(mode=mode)
+
+    nonces = [nonce_provider.get() for _ in range(5000)] + nonce_provider.get_many(count=5000)
+
+    assert 10000 == len(set(nonces))
+
+
+@pytest.mark.asyncio
+async def test_wait_for_batches_by_events_and_polling():
+    """
+    Case: wait for batches, where one was committed before subscription and others complete by events.
+    Expect: final statuses of all batches in order they complete, events of not waited batches are ignored.
+    """
+    batch_ids = [get_header_signature(prefix='b', number=index) for index in range(3)]
+    statuses = {batch_ids[0]: 'COMMITTED'}
+
+    node = await JsonRpcTestNode(methods={
+        'subscribe': lambda params: 'SUBSCRIBED',
+        'unsubscribe': lambda params: 'UNSUBSCRIBED',
+        'get_batch_status': lambda params: statuses.get(params.get('id'), 'PENDING'),
+    }).start()
+
+    remme_api = RemmeAPI({'node_address': node.address})
+    remme_transaction = RemmeTransactionService(remme_api, RemmeAccount(private_key_hex=PRIVATE_KEY_HEX_ECDSA))
+
+    async def publish_events():
+        while len([request for request in node.requests if request.get('method') == 'subscribe']) < 3:
+            await asyncio.sleep(0.01)
+
+        for batch_id, status in ((batch_ids[1], 'PENDING'), (batch_ids[2], 'INVALID'), (batch_ids[1], 'COMMITTED')):
+            await asyncio.sleep(0.05)
+            await node.publish(event_type='batch', attributes={'id': batch_id, 'status': status})
+
+    publisher = asyncio.ensure_future(publish_events())
+
+    try:
+        completed = [
+            (batch_info.batch_id, batch_info.status) async for batch_info in remme_transaction.wait_for_batches(
+                batch_ids=batch_ids, timeout=5, poll_interval=1,
+            )
+        ]
+
+        with pytest.raises(asyncio.TimeoutError):
+            async for _ in remme_transaction.wait_for_batches(batch_ids=batch_ids[1:2], timeout=0.2):
+                pass
+
+    finally:
+        await publisher
+        await node.stop()
+
+    assert [(batch_ids[0], 'COMMITTED'), (batch_ids[2], 'INVALID'), (batch_ids[1], 'COMMITTED')] == completed
+
+
+@pytest.mark.asyncio
+async def test_wait_for_batches_polls_only_batches_without_events():
+    """
+    Case: wait for pending batches, where subscription to one of them fails.
+    Expect: all batches are polled once at start, then only the batch without subscription is polled.
+    """
+    batch_ids = [get_header_signature(prefix='b', number=index) for index in range(3)]
+
+    def subscribe(params):
+        if params.get('id') == batch_ids[0]:
+            raise Exception('Subscription failed.')
+
+        return 'SUBSCRIBED'
+
+    node = await JsonRpcTestNode(methods={
+        'subscribe': subscribe,
+        'unsubscribe': lambda params: 'UNSUBSCRIBED',
+        'get_batch_status': lambda params: 'PENDING',
+    }).start()
+
+    remme_api = RemmeAPI({'node_address': node.address})
+    remme_transaction = RemmeTransactionService(remme_api, RemmeAccount(private_key_hex=PRIVATE_KEY_HEX_ECDSA))
+
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            async for _ in remme_transaction.wait_for_batches(batch_ids=batch_ids, timeout=0.5, poll_interval=0.05):
+                pass
+
+    finally:
+        await node.stop()
+
+    polled_batch_ids = [
+        request.get('params').get('id') for request in node.requests if request.get('method') == 'get_batch_status'
+    ]
+
+    assert set(batch_ids) == set(polled_batch_ids[:3])
+    assert len(polled_batch_ids) > 4
+    assert {batch_ids[0]} == set(polled_batch_ids[3:])
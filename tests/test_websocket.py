@@ -0,0 +1,406 @@
+"""
+Provide tests for RemmeWebSocket implementation.
+"""
+import asyncio
+
+import pytest
+
+from remme.models.transaction_service.base_transaction_response import BaseTransactionResponse
+from remme.models.websocket.block_info import BlockInfoDto
+from remme.models.websocket.event_consumer import RemmeEventConsumer
+from remme.models.websocket.events import RemmeEvents
+from remme.models.websocket.hub import RemmeWebSocketHub
+from remme.models.websocket.queue_policy import RemmeQueuePolicy
+from remme.models.websocket.request_params import RemmeRequestParams
+from remme.models.websocket.stream_metrics import RemmeStreamMetrics
+from remme.websocket_events import RemmeWebSocketEvents
+from tests.utils import (
+    JsonRpcTestNode,
+    get_header_signature,
+)
+
+
+def get_subscribe_methods():
+    return {
+        'subscribe': lambda params: 'SUBSCRIBED',
+        'unsubscribe': lambda params: 'UNSUBSCRIBED',
+    }
+
+
+@pytest.mark.asyncio
+async def test_hub_multiplexes_subscriptions_over_one_connection():
+    """
+    Case: subscribe to events of many batches and of transfers through shared connection.
+    Expect: one connection to the node, each event is delivered only to subscriptions matching its attributes.
+    """
+    node = await JsonRpcTestNode(methods=get_subscribe_methods()).start()
+    web_socket_hub = RemmeWebSocketHub(network_config={'node_address': node.address, 'ssl_mode': False})
+
+    batch_ids = [get_header_signature(prefix='b', number=index) for index in range(50)]
+    address = '1' * 70
+
+    try:
+        batch_subscriptions = await asyncio.gather(*[
+            web_socket_hub.subscribe(params={'event_type': 'batch', 'id': batch_id}) for batch_id in batch_ids
+        ])
+        transfer_subscription = await web_socket_hub.subscribe(params={'event_type': 'transfer', 'address': address})
+        same_transfer_subscription = await web_socket_hub.subscribe(
+            params={'event_type': 'transfer', 'address': address},
+        )
+
+        await node.publish(event_type='batch', attributes={'id': batch_ids[7], 'status': 'COMMITTED'})
+        await node.publish(event_type='transfer', attributes={'from': '0' * 70, 'to': address})
+
+        batch_info = await asyncio.wait_for(batch_subscriptions[7].__anext__(), timeout=1)
+        transfer_info = await asyncio.wait_for(transfer_subscription.__anext__(), timeout=1)
+        same_transfer_info = await asyncio.wait_for(same_transfer_subscription.__anext__(), timeout=1)
+
+        for subscription in batch_subscriptions:
+            await subscription.close()
+
+        await transfer_subscription.close()
+
+        assert 1 == node.handshakes
+        assert 1 == web_socket_hub.subscriptions_count
+        assert (batch_ids[7], 'COMMITTED') == (batch_info.batch_id, batch_info.status)
+        assert address == transfer_info.transfer_to == same_transfer_info.transfer_to
+        assert 51 == len([request for request in node.requests if request.get('method') == 'subscribe'])
+        assert 50 == len([request for request in node.requests if request.get('method') == 'unsubscribe'])
+
+    finally:
+        await web_socket_hub.close()
+        await node.stop()
+
+
+@pytest.mark.asyncio
+async def test_transaction_response_through_hub():
+    """
+    Case: listen to events of sent transaction through shared connection and lose connection to the node.
+    Expect: subscription confirmation and batch status, then exception on connection loss.
+    """
+    node = await JsonRpcTestNode(methods=get_subscribe_methods()).start()
+
+    network_config = {'node_address': node.address, 'ssl_mode': False}
+    web_socket_hub = RemmeWebSocketHub(network_config=network_config)
+
+    batch_id = get_header_signature(prefix='b', number=0)
+    transaction_response = BaseTransactionResponse(
+        network_config=network_config, batch_id=batch_id, web_socket_hub=web_socket_hub,
+    )
+
+    try:
+        messages = transaction_response.connect_to_web_socket()
+
+        assert 'SUBSCRIBED' == (await messages.__anext__()).get('result')
+
+        await node.publish(event_type='batch', attributes={'id': batch_id, 'status': 'PENDING'})
+        assert 'PENDING' == (await asyncio.wait_for(messages.__anext__(), timeout=1)).status
+
+        await node.disconnect()
+
+        with pytest.raises(Exception):
+            await asyncio.wait_for(messages.__anext__(), timeout=1)
+
+    finally:
+        await web_socket_hub.close()
+        await node.stop()
+
+
+@pytest.mark.asyncio
+async def test_stream_resumes_from_last_block_after_connection_loss():
+    """
+    Case: stream blocks events, lose connection to the node, then receive replayed and new blocks.
+    Expect: subscription is resumed from the last seen block, replayed block is skipped, reconnection is counted.
+    """
+    node = await JsonRpcTestNode(methods=get_subscribe_methods()).start()
+
+    remme_events = RemmeWebSocketEvents(network_config={'node_address': node.address, 'ssl_mode': False})
+    remme_events.data = RemmeRequestParams(data={'event_type': 'blocks'}).get_data()
+
+    block_ids = [get_header_signature(prefix='a', number=index) for index in range(3)]
+    metrics = RemmeStreamMetrics()
+
+    async def publish_blocks():
+        for block_ids_to_publish, expected_params, should_disconnect in (
+            (block_ids[:2], {'event_type': 'blocks'}, True),
+            (block_ids[1:], {'event_type': 'blocks', 'from_block': block_ids[1]}, False),
+        ):
+            while len(node.web_sockets) != 1 or not any(
+                request.get('method') == 'subscribe' and request.get('params') == expected_params
+                for request in node.requests
+            ):
+                await asyncio.sleep(0.01)
+
+            for block_id in block_ids_to_publish:
+                await node.publish(event_type='blocks', attributes={'id': block_id, 'timestamp': 1})
+
+            if should_disconnect:
+                await node.disconnect()
+
+    publisher = asyncio.ensure_future(publish_blocks())
+    events = remme_events.stream(initial_delay=0.01, metrics=metrics)
+
+    try:
+        received_block_ids = []
+
+        async for block_info in events:
+            received_block_ids.append(block_info.id)
+
+            if len(received_block_ids) == 3:
+                break
+
+    finally:
+        await events.aclose()
+        await publisher
+        await node.stop()
+
+    subscriptions = [request.get('params') for request in node.requests if request.get('method') == 'subscribe']
+
+    assert block_ids == received_block_ids
+    assert [{'event_type': 'blocks'}, {'event_type': 'blocks', 'from_block': block_ids[1]}] == subscriptions
+    assert (1, 0, 1) == (metrics.reconnects, metrics.gaps, metrics.duplicates)
+
+
+@pytest.mark.asyncio
+async def test_stream_resumes_atomic_swap_from_block_of_last_swap():
+    """
+    Case: stream atomic swap events from known block, lose connection after swap in a later block,
+        then receive replayed and new swaps.
+    Expect: subscription is resumed from block of the last seen swap, replayed swap is skipped, no gap is counted.
+    """
+    node = await JsonRpcTestNode(methods=get_subscribe_methods()).start()
+
+    block_ids = [get_header_signature(prefix='a', number=index) for index in range(3)]
+    swap_id = '1' * 64
+
+    remme_events = RemmeWebSocketEvents(network_config={'node_address': node.address, 'ssl_mode': False})
+    remme_events.data = RemmeRequestParams(data={
+        'event_type': 'atomic_swap', 'last_known_block_id': block_ids[0],
+    }).get_data()
+
+    metrics = RemmeStreamMetrics()
+
+    async def publish_swaps():
+        for swaps, expected_params, should_disconnect in (
+            ([(block_ids[1], 'OPENED')], {'event_type': 'atomic_swap', 'from_block': block_ids[0]}, True),
+            (
+                [(block_ids[1], 'OPENED'), (block_ids[2], 'CLOSED')],
+                {'event_type': 'atomic_swap', 'from_block': block_ids[1]},
+                False,
+            ),
+        ):
+            while len(node.web_sockets) != 1 or not any(
+                request.get('method') == 'subscribe' and request.get('params') == expected_params
+                for request in node.requests
+            ):
+                await asyncio.sleep(0.01)
+
+            for block_id, state in swaps:
+                await node.publish(
+                    event_type='atomic_swap', attributes={'block_id': block_id, 'swap_id': swap_id, 'state': state},
+                )
+
+            if should_disconnect:
+                await node.disconnect()
+
+    publisher = asyncio.ensure_future(publish_swaps())
+    events = remme_events.stream(initial_delay=0.01, metrics=metrics)
+
+    try:
+        states = []
+
+        async for swap_info in events:
+            states.append(swap_info.state)
+
+            if len(states) == 2:
+                break
+
+    finally:
+        await events.aclose()
+        await publisher
+        await node.stop()
+
+    assert ['OPENED', 'CLOSED'] == states
+    assert block_ids[2] == metrics.last_block_id
+    assert (1, 0, 1) == (metrics.reconnects, metrics.gaps, metrics.duplicates)
+
+
+@pytest.mark.asyncio
+async def test_stream_delivers_equal_transfers():
+    """
+    Case: stream transfers events and receive several transfers between the same addresses.
+    Expect: every transfer is delivered, none is skipped as duplicate.
+    """
+    node = await JsonRpcTestNode(methods=get_subscribe_methods()).start()
+
+    address = '1' * 70
+
+    remme_events = RemmeWebSocketEvents(network_config={'node_address': node.address, 'ssl_mode': False})
+    remme_events.data = RemmeRequestParams(data={'event_type': 'transfer', 'address': address}).get_data()
+
+    metrics = RemmeStreamMetrics()
+    events = remme_events.stream(metrics=metrics)
+
+    async def publish_transfers():
+        while not any(request.get('method') == 'subscribe' for request in node.requests):
+            await asyncio.sleep(0.01)
+
+        for _ in range(3):
+            await node.publish(event_type='transfer', attributes={'from': '0' * 70, 'to': address})
+
+    publisher = asyncio.ensure_future(publish_transfers())
+
+    try:
+        transfer_infos = []
+
+        async for transfer_info in events:
+            transfer_infos.append(transfer_info)
+
+            if len(transfer_infos) == 3:
+                break
+
+    finally:
+        await events.aclose()
+        await publisher
+        await node.stop()
+
+    assert [address] * 3 == [transfer_info.transfer_to for transfer_info in transfer_infos]
+    assert (0, 0, 0) == (metrics.reconnects, metrics.gaps, metrics.duplicates)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('policy, expected_numbers, expected_dropped, expected_spilled', [
+    (RemmeQueuePolicy.DROP_OLDEST, [7, 8, 9], 7, 0),
+    (RemmeQueuePolicy.BLOCK, list(range(10)), 0, 0),
+    (RemmeQueuePolicy.SPILL_TO_DISK, list(range(10)), 0, 7),
+])
+async def test_consume_burst_of_events_through_bounded_queue(
+    policy, expected_numbers, expected_dropped, expected_spilled,
+):
+    """
+    Case: receive burst of events faster than they are consumed, through queue of 3 events.
+    Expect: queue depth is bounded by policy, events are dropped, spilled to disk or wait for the consumer.
+    """
+    async def receive_events():
+        for number in range(10):
+            yield BlockInfoDto(data={'id': get_header_signature(prefix='a', number=number), 'timestamp': number})
+
+    consumer = RemmeEventConsumer(events=receive_events(), max_size=3, policy=policy).start()
+
+    try:
+        await asyncio.sleep(0.05)
+        depth = consumer.depth
+
+        numbers = [block_info.timestamp async for block_info in consumer]
+
+    finally:
+        await consumer.close()
+
+    assert expected_numbers == numbers
+    assert (expected_dropped, expected_spilled) == (consumer.dropped, consumer.spilled)
+    assert 0 == consumer.depth
+    assert consumer.lag >= 0
+    assert (10 if policy == RemmeQueuePolicy.SPILL_TO_DISK else 3) == depth
+
+
+@pytest.mark.asyncio
+async def test_event_bus_routes_events_to_handlers_by_key():
+    """
+    Case: register many handlers of transfers to different addresses and of blocks, where one handler fails.
+    Expect: one subscription for each address, each event is handled only by handlers of its key,
+        failed handler does not affect others.
+    """
+    node = await JsonRpcTestNode(methods=get_subscribe_methods()).start()
+
+    remme_events = RemmeWebSocketEvents(network_config={'node_address': node.address, 'ssl_mode': False})
+
+    errors = []
+    event_bus = remme_events.create_event_bus(on_error=lambda registration, event, error: errors.append(error))
+
+    addresses = [f'{index:070x}' for index in range(20)]
+    handled = {address: [] for address in addresses}
+    blocks = []
+
+    def fail(block_info):
+        raise Exception('Handler failed.')
+
+    async def handle_block(block_info):
+        blocks.append(block_info.id)
+
+    try:
+        for address in addresses:
+            for _ in range(2):
+                await event_bus.on(
+                    RemmeEvents.Transfer, lambda transfer_info, address=address: handled[address].append(transfer_info),
+                    key=address,
+                )
+
+        await event_bus.on(RemmeEvents.Blocks, fail)
+        registration = await event_bus.on(RemmeEvents.Blocks, handle_block)
+
+        await node.publish(event_type='transfer', attributes={'from': '1' * 70, 'to': addresses[3]})
+        await node.publish(event_type='blocks', attributes={'id': get_header_signature(prefix='a', number=0)})
+
+        while not blocks or not handled[addresses[3]]:
+            await asyncio.sleep(0.01)
+
+        await event_bus.off(registration)
+
+        assert 41 == event_bus.handlers_count
+
+    finally:
+        await event_bus.close()
+        await node.stop()
+
+    subscriptions = [request for request in node.requests if request.get('method') == 'subscribe']
+
+    assert 21 == len(subscriptions)
+    assert [addresses[3]] * 2 == [
+        transfer_info.transfer_to for transfer_infos in handled.values() for transfer_info in transfer_infos
+    ]
+    assert [get_header_signature(prefix='a', number=0)] == blocks
+    assert 1 == event_bus.errors == len(errors)
+
+
+@pytest.mark.asyncio
+async def test_event_bus_resubscribes_after_connection_loss():
+    """
+    Case: register handlers of blocks, lose connection to the node, then register another handler of blocks.
+    Expect: connection loss is passed to error handler, blocks are subscribed again and reach all handlers.
+    """
+    node = await JsonRpcTestNode(methods=get_subscribe_methods()).start()
+
+    remme_events = RemmeWebSocketEvents(network_config={'node_address': node.address, 'ssl_mode': False})
+
+    errors = []
+    event_bus = remme_events.create_event_bus(
+        on_error=lambda registration, event, error: errors.append(error), initial_delay=0.01,
+    )
+
+    first_blocks, second_blocks = [], []
+
+    def count_subscriptions():
+        return len([request for request in node.requests if request.get('method') == 'subscribe'])
+
+    try:
+        await event_bus.on(RemmeEvents.Blocks, lambda block_info: first_blocks.append(block_info.id))
+
+        await node.disconnect()
+
+        while count_subscriptions() < 2 or len(node.web_sockets) != 1:
+            await asyncio.sleep(0.01)
+
+        await event_bus.on(RemmeEvents.Blocks, lambda block_info: second_blocks.append(block_info.id))
+
+        while not first_blocks or not second_blocks:
+            await node.publish(event_type='blocks', attributes={'id': get_header_signature(prefix='a', number=0)})
+            await asyncio.sleep(0.01)
+
+    finally:
+        await event_bus.close()
+        await node.stop()
+
+    assert get_header_signature(prefix='a', number=0) == first_blocks[0] == second_blocks[0]
+    assert 2 == count_subscriptions()
+    assert 1 == event_bus.errors == len(errors)
+    assert isinstance(errors[0], ConnectionError)
@@ -1,3 +1,12 @@
+import asyncio
+import inspect
+import json
+
+from aiohttp import (
+    WSMsgType,
+    web,
+)
+
 PRIVATE_KEY_HEX_RSA = '308204a20201000282010100c9737eb117d805c68fcf10897b99f2f166ba10f72618bfdba4d56bb90421b9923b5a' \
                       'dc25fb9009238a7b96e9c1ab832695d25e710af00aea9763a514f6e3afd928be961bf85884c52dbe07723f1d8723' \
                       '1d91686210e915344496284daee30e67791b2b8e04d8c1a6d4cb7300c8e00d855d254dffc780b5c53d60a6dab2e6' \
@@ -39,3 +48,221 @@ PUBLIC_KEY_HEX_ECDSA = '027173b62e0d629323416b09bb94829b820cb56b10936a13be504708
 PRIVATE_KEY_HEX_EDDSA = '92f54f82c1b3e63b54ede868e12dc4c22695b88e59ba5dc6580c2c9fb72229f867e438bd3c95773de5130aed30' \
                         '26c936068ee07c5e826723fa544f81c273ecce'
 PUBLIC_KEY_HEX_EDDSA = '67e438bd3c95773de5130aed3026c936068ee07c5e826723fa544f81c273ecce'
+
+
+class JsonRpcTestNode:
+    """
+    Local WebSocket JSON-RPC server that imitates a node in tests.
+
+    Results are taken from ``methods`` dictionary, where value is either a result itself
+    or a callable that takes request params and returns a result or awaitable of result.
+    Exception raised by callable is sent as JSON-RPC error.
+    Messages are handled concurrently, so responses may be sent in another order than requests came.
+    """
+
+    def __init__(self, methods=None):
+        self.methods = methods or {}
+        self.handshakes = 0
+        self.requests = []
+        self.address = None
+        self.web_sockets = set()
+
+        self._runner = None
+
+    async def _get_response(self, request):
+
+        self.requests.append(request)
+
+        method = request.get('method')
+
+        if method not in self.methods:
+            return {
+                'jsonrpc': '2.0',
+                'id': request.get('id'),
+                'error': {'code': -32601, 'message': 'Method not found'},
+            }
+
+        result = self.methods.get(method)
+
+        try:
+            if callable(result):
+                result = result(request.get('params'))
+
+            if inspect.isawaitable(result):
+                result = await result
+
+        except Exception as error:
+            return {
+                'jsonrpc': '2.0',
+                'id': request.get('id'),
+                'error': {'code': -32603, 'message': str(error)},
+            }
+
+        return {'jsonrpc': '2.0', 'id': request.get('id'), 'result': result}
+
+    async def _handle(self, request):
+
+        self.handshakes += 1
+
+        web_socket = web.WebSocketResponse()
+        await web_socket.prepare(request)
+
+        self.web_sockets.add(web_socket)
+
+        try:
+            async for message in web_socket:
+
+                if message.type != WSMsgType.TEXT:
+                    continue
+
+                asyncio.ensure_future(self._respond(web_socket=web_socket, data=json.loads(message.data)))
+
+        finally:
+            self.web_sockets.discard(web_socket)
+
+        return web_socket
+
+    async def _respond(self, web_socket, data):
+
+        if isinstance(data, list):
+            response = await asyncio.gather(*[self._get_response(request=item) for item in data])
+
+        else:
+            response = await self._get_response(request=data)
+
+        if not web_socket.closed:
+            await web_socket.send_str(json.dumps(response))
+
+    async def publish(self, event_type, attributes):
+        """
+        Send event to all connected clients.
+        """
+        message = json.dumps({'jsonrpc': '2.0', 'result': {'event_type': event_type, 'attributes': attributes}})
+
+        for web_socket in list(self.web_sockets):
+            if not web_socket.closed:
+                await web_socket.send_str(message)
+
+    async def disconnect(self):
+        """
+        Close connections of all connected clients.
+        """
+        for web_socket in list(self.web_sockets):
+            await web_socket.close()
+
+    async def start(self):
+
+        application = web.Application()
+        application.router.add_get('/', self._handle)
+
+        self._runner = web.AppRunner(application)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, 'localhost', 0)
+        await site.start()
+
+        port = self._runner.addresses[0][1]
+        self.address = f'localhost:{port}'
+
+        return self
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+def get_header_signature(prefix, number):
+    return f'{prefix}{number:0{128 - len(prefix)}x}'
+
+
+class ChainTestData:
+    """
+    Chain of blocks with one transaction each, served page by page like ``list_blocks`` of a node.
+
+    Blocks are listed from the newest to the oldest, starting from ``start`` block number.
+    """
+
+    def __init__(self, blocks_count):
+        self.blocks = []
+        self.add_blocks(count=blocks_count)
+
+    def add_blocks(self, count, prefix='a'):
+
+        for _ in range(count):
+            block_num = len(self.blocks)
+            previous_block_id = self.blocks[-1].get('header_signature') if self.blocks else '0' * 16
+
+            self.blocks.append(
+                self.create_block(block_num=block_num, previous_block_id=previous_block_id, prefix=prefix),
+            )
+
+    def fork(self, block_num, count, prefix='d'):
+        """
+        Replace blocks starting from the block number by ``count`` blocks of another branch.
+        """
+        del self.blocks[block_num:]
+        self.add_blocks(count=count, prefix=prefix)
+
+    @staticmethod
+    def create_block(block_num, previous_block_id, prefix='a'):
+
+        transaction = {
+            'header': {'family_name': 'account', 'inputs': [], 'outputs': []},
+            'header_signature': get_header_signature(prefix=f'c{prefix}', number=block_num),
+            'payload': '',
+        }
+
+        batch = {
+            'header': {'transaction_ids': [transaction.get('header_signature')]},
+            'header_signature': get_header_signature(prefix=f'b{prefix}', number=block_num),
+            'transactions': [transaction],
+        }
+
+        return {
+            'header': {
+                'block_num': str(block_num),
+                'previous_block_id': previous_block_id,
+                'batch_ids': [batch.get('header_signature')],
+            },
+            'header_signature': get_header_signature(prefix=f'a{prefix}', number=block_num),
+            'batches': [batch],
+        }
+
+    def get_blocks_info(self, params):
+
+        start, limit = params.get('start'), params.get('limit')
+
+        return [{
+            'block_number': int(block.get('header').get('block_num')),
+            'timestamp': 1000 + int(block.get('header').get('block_num')),
+            'header_signature': block.get('header_signature'),
+        } for block in self.blocks[start:start + limit]]
+
+    def list_receipts(self, params):
+
+        return {'data': [{'transaction_id': transaction_id, 'data': []} for transaction_id in params.get('ids')]}
+
+    def list_blocks(self, params):
+
+        params = params or {}
+
+        head_block_num = len(self.blocks) - 1
+
+        if params.get('head'):
+            head_block_num = [block.get('header_signature') for block in self.blocks].index(params.get('head'))
+
+        start = params.get('start')
+        start = int(start, 16) if start else head_block_num
+        limit = params.get('limit') or 100
+
+        block_nums = range(start, max(start - limit, -1), -1)
+        next_block_num = start - limit
+
+        return {
+            'data': [self.blocks[block_num] for block_num in block_nums],
+            'head': self.blocks[head_block_num].get('header_signature'),
+            'paging': {
+                'start': params.get('start'),
+                'limit': limit,
+                'next_position': f'0x{next_block_num:016x}' if next_block_num >= 0 else None,
+            },
+        }